@@ -1,19 +1,93 @@
+import copy
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
 from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldDoesNotExist
+from django.db import IntegrityError, transaction
+from django.db.models import Model
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 
 from rest_registration.settings import registration_settings
-from rest_registration.utils.users import get_user_public_field_names
+from rest_registration.utils.users import (
+    UserFieldSchema,
+    get_user_field_schema,
+    get_user_public_field_names,
+)
 from rest_registration.utils.validation import (
     run_validators,
     validate_user_password,
     validate_user_password_confirm,
 )
 
+_T = TypeVar('_T')
+
 
 class MetaObj:
     pass
 
 
+_user_field_schema_cache: Dict[Hashable, Tuple[UserFieldSchema, Any]] = {}
+
+
+def _get_cached_for_user_field_schema(
+        key: Hashable, factory: Callable[[], Any]) -> Any:
+    """
+    Return the value created by ``factory``, reusing the previously created
+    one until the user field schema is rebuilt (e.g. on settings change).
+    """
+    schema = get_user_field_schema()
+    entry = _user_field_schema_cache.get(key)
+    if entry is None or entry[0] is not schema:
+        entry = (schema, factory())
+        _user_field_schema_cache[key] = entry
+    return entry[1]
+
+
+def _build_user_meta_obj(write_once: bool) -> MetaObj:
+    meta_obj = MetaObj()
+    meta_obj.model = get_user_model()
+    meta_obj.fields = get_user_public_field_names(write_once=write_once)
+    meta_obj.read_only_fields = get_user_public_field_names(
+        write_once=write_once, read_only=True)
+    return meta_obj
+
+
+def _get_user_meta_obj(write_once: bool) -> MetaObj:
+    return _get_cached_for_user_field_schema(
+        ('meta', write_once),
+        lambda: _build_user_meta_obj(write_once),
+    )
+
+
+class CachedFieldsSerializerMixin(serializers.Serializer):
+    """
+    Build the serializer fields once per serializer class (and the value
+    returned by ``get_fields_cache_key``); the cached fields are never bound,
+    each instance gets its own deep copy of them. The cache is invalidated
+    when the user field schema is rebuilt (e.g. on settings change).
+
+    The cache key does not include the serializer context, so the fields
+    built by the classes following this mixin in the MRO must depend only
+    on the serializer class and settings. If they depend on anything else
+    (e.g. ``self.context``), override ``get_fields_cache_key`` to include it,
+    or return ``None`` from it to disable the caching.
+    """
+
+    def get_fields_cache_key(self) -> Optional[Hashable]:
+        return ()
+
+    def get_fields(self):
+        fields_cache_key = self.get_fields_cache_key()
+        if fields_cache_key is None:
+            return super().get_fields()
+        build_fields = super().get_fields
+        key = ('fields', type(self), fields_cache_key)
+        fields = _get_cached_for_user_field_schema(
+            key, lambda: copy.deepcopy(build_fields()))
+        return copy.deepcopy(fields)
+
+
 class PasswordConfirmSerializerMixin(serializers.Serializer):
 
     def has_password_confirm_field(self) -> bool:
@@ -26,6 +100,119 @@ class PasswordConfirmSerializerMixin(serializers.Serializer):
         return fields
 
 
+def _replace_unique_validators(
+        fields: Dict[str, serializers.Field],
+        factory: Callable[[UniqueValidator], UniqueValidator]) -> None:
+    for field in fields.values():
+        field.validators = [
+            factory(validator)
+            if type(validator) is UniqueValidator  # pylint: disable=unidiomatic-typecheck  # noqa: E501
+            else validator
+            for validator in field.validators
+        ]
+
+
+class ChangedValueUniqueValidator(UniqueValidator):
+    """
+    Unique validator which skips the database query if the value
+    is the same as the current value of the updated instance.
+    """
+
+    @classmethod
+    def from_unique_validator(
+            cls, validator: UniqueValidator) -> 'ChangedValueUniqueValidator':
+        return cls(
+            queryset=validator.queryset,
+            message=validator.message,
+            lookup=validator.lookup,
+        )
+
+    def __call__(self, value, serializer_field):
+        instance = getattr(serializer_field.parent, 'instance', None)
+        field_name = serializer_field.source_attrs[-1]
+        if (
+            instance is not None
+            and serializer_field.source_attrs == [field_name]
+            and getattr(instance, field_name, None) == value
+        ):
+            return
+        super().__call__(value, serializer_field)
+
+
+class OptimisticUniqueValidator(UniqueValidator):
+    """
+    Unique validator which does not query the database during validation,
+    as the uniqueness is enforced by the database constraint.
+    The check is performed (by calling ``check()``) only after the constraint
+    was violated, to produce the appropriate validation error.
+    """
+
+    @classmethod
+    def from_unique_validator(
+            cls, validator: UniqueValidator) -> 'OptimisticUniqueValidator':
+        return cls(
+            queryset=validator.queryset,
+            message=validator.message,
+            lookup=validator.lookup,
+        )
+
+    def __call__(self, value, serializer_field):
+        pass
+
+    def check(self, value, serializer_field):
+        super().__call__(value, serializer_field)
+
+
+class OptimisticUniquenessSerializerMixin(serializers.Serializer):
+    """
+    If :ref:`user-optimistic-uniqueness-check-enabled-setting` is enabled,
+    replaces the field unique validators with ``OptimisticUniqueValidator``.
+    The writes should be then performed using ``perform_optimistic_write()``.
+
+    The validators are replaced on the field instances, which are recreated
+    on copy; therefore this mixin needs to precede
+    ``CachedFieldsSerializerMixin``.
+    """
+
+    def is_optimistic_uniqueness_check_enabled(self) -> bool:
+        return registration_settings.USER_OPTIMISTIC_UNIQUENESS_CHECK_ENABLED
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.is_optimistic_uniqueness_check_enabled():
+            return fields
+        _replace_unique_validators(
+            fields, OptimisticUniqueValidator.from_unique_validator)
+        return fields
+
+    def perform_optimistic_write(self, write: Callable[[], _T]) -> _T:
+        if not self.is_optimistic_uniqueness_check_enabled():
+            return write()
+        try:
+            with transaction.atomic():
+                return write()
+        except IntegrityError:
+            errors = self._get_optimistic_uniqueness_errors()
+            if not errors:
+                raise
+            raise serializers.ValidationError(errors) from None
+
+    def _get_optimistic_uniqueness_errors(self) -> Dict[str, Any]:
+        errors = {}
+        for field_name, field in self.fields.items():
+            if field.source not in self.validated_data:
+                continue
+            value = self.validated_data[field.source]
+            for validator in field.validators:
+                if not isinstance(validator, OptimisticUniqueValidator):
+                    continue
+                try:
+                    validator.check(value, field)
+                except serializers.ValidationError as exc:
+                    errors[field_name] = exc.detail
+        return errors
+
+
 class DefaultLoginSerializer(serializers.Serializer):  # noqa: E501 pylint: disable=abstract-method
     """
     Default serializer used for user login. Please keep in mind that
@@ -69,7 +256,9 @@ class DefaultSendResetPasswordLinkSerializer(serializers.Serializer):  # noqa: E
         return fields
 
 
-class DefaultUserProfileSerializer(serializers.ModelSerializer):
+class DefaultUserProfileSerializer(
+        CachedFieldsSerializerMixin,
+        serializers.ModelSerializer):
     """
     Default serializer used for user profile. It will use these:
 
@@ -79,21 +268,77 @@ class DefaultUserProfileSerializer(serializers.ModelSerializer):
     * :ref:`user-editable-fields-setting` setting
 
     to automagically generate the required serializer fields.
+
+    The uniqueness of the fields is checked only for the changed values,
+    and only the changed fields are saved (if any).
     """
 
     def __init__(self, *args, **kwargs):
-        user_class = get_user_model()
-        field_names = get_user_public_field_names()
-        read_only_field_names = get_user_public_field_names(read_only=True)
-        meta_obj = MetaObj()
-        meta_obj.model = user_class
-        meta_obj.fields = field_names
-        meta_obj.read_only_fields = read_only_field_names
-        self.Meta = meta_obj  # pylint: disable=invalid-name
+        self.Meta = _get_user_meta_obj(write_once=False)  # noqa: E501 pylint: disable=invalid-name
         super().__init__(*args, **kwargs)
 
+    def get_fields(self):
+        # The validators are replaced on the field instances, which are
+        # recreated on copy, so it cannot be done before the caching.
+        fields = super().get_fields()
+        _replace_unique_validators(
+            fields, ChangedValueUniqueValidator.from_unique_validator)
+        return fields
+
+    def update(self, instance, validated_data):
+        changed_field_names = _get_changed_field_names(instance, validated_data)
+        if changed_field_names is None:
+            return super().update(instance, validated_data)
+        if not changed_field_names:
+            return instance
+        for field_name in changed_field_names:
+            setattr(instance, field_name, validated_data[field_name])
+        instance.save(update_fields=[
+            *changed_field_names,
+            *_get_auto_now_field_names(instance),
+        ])
+        return instance
+
+
+def _get_changed_field_names(
+        instance: Model, validated_data: Dict[str, Any]) -> Optional[List[str]]:
+    """
+    Return the names of the concrete fields which values differ from the
+    current instance values. Return ``None`` if the data contain anything
+    else (e.g. many-to-many relations).
+    """
+    opts = instance._meta  # pylint: disable=protected-access
+    changed_field_names = []
+    for field_name, value in validated_data.items():
+        try:
+            model_field = opts.get_field(field_name)
+        except FieldDoesNotExist:
+            return None
+        if not getattr(model_field, 'concrete', False) or model_field.many_to_many:
+            return None
+        if model_field.is_relation:
+            # Compare the keys, so the related object does not get fetched.
+            current_value = getattr(instance, model_field.attname)
+            new_value = None if value is None else value.pk
+        else:
+            current_value = getattr(instance, field_name)
+            new_value = value
+        if current_value != new_value:
+            changed_field_names.append(field_name)
+    return changed_field_names
+
+
+def _get_auto_now_field_names(instance: Model) -> List[str]:
+    opts = instance._meta  # pylint: disable=protected-access
+    return [
+        field.name for field in opts.concrete_fields
+        if getattr(field, 'auto_now', False)
+    ]
+
 
 class DefaultRegisterUserSerializer(
+        OptimisticUniquenessSerializerMixin,
+        CachedFieldsSerializerMixin,
         PasswordConfirmSerializerMixin,
         serializers.ModelSerializer):
     """
@@ -107,17 +352,12 @@ class DefaultRegisterUserSerializer(
     """
 
     def __init__(self, *args, **kwargs):
-        user_class = get_user_model()
-        field_names = get_user_public_field_names(write_once=True)
-        read_only_field_names = get_user_public_field_names(
-            write_once=True, read_only=True)
-        meta_obj = MetaObj()
-        meta_obj.model = user_class
-        meta_obj.fields = field_names
-        meta_obj.read_only_fields = read_only_field_names
-        self.Meta = meta_obj  # pylint: disable=invalid-name
+        self.Meta = _get_user_meta_obj(write_once=True)  # noqa: E501 pylint: disable=invalid-name
         super().__init__(*args, **kwargs)
 
+    def get_fields_cache_key(self):
+        return self.has_password_confirm_field()
+
     def has_password_confirm_field(self):
         return registration_settings.REGISTER_SERIALIZER_PASSWORD_CONFIRM
 
@@ -134,4 +374,5 @@ class DefaultRegisterUserSerializer(
         data = validated_data.copy()
         if self.has_password_confirm_field():
             del data['password_confirm']
-        return self.Meta.model.objects.create_user(**data)
+        return self.perform_optimistic_write(
+            lambda: self.Meta.model.objects.create_user(**data))
@@ -8,21 +8,32 @@ from .views import (
     register,
     register_email,
     reset_password,
+    reset_password_check,
     send_reset_password_link,
     verify_email,
+    verify_email_check,
     verify_registration,
+    verify_registration_check,
 )
 
 app_name = 'rest_registration'
 urlpatterns = [
     path('register/', register, name='register'),
     path('verify-registration/', verify_registration, name='verify-registration'),
+    path(
+        'verify-registration/check/', verify_registration_check,
+        name='verify-registration-check',
+    ),
 
     path(
         'send-reset-password-link/', send_reset_password_link,
         name='send-reset-password-link',
     ),
     path('reset-password/', reset_password, name='reset-password'),
+    path(
+        'reset-password/check/', reset_password_check,
+        name='reset-password-check',
+    ),
 
     path('login/', login, name='login'),
     path('logout/', logout, name='logout'),
@@ -33,4 +44,5 @@ urlpatterns = [
 
     path('register-email/', register_email, name='register-email'),
     path('verify-email/', verify_email, name='verify-email'),
+    path('verify-email/check/', verify_email_check, name='verify-email-check'),
 ]
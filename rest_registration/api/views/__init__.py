@@ -1,6 +1,10 @@
 from .change_password import change_password  # noqa
 from .login import login, logout  # noqa
 from .profile import profile  # noqa
-from .register import register, verify_registration  # noqa
-from .register_email import register_email, verify_email  # noqa
-from .reset_password import reset_password, send_reset_password_link  # noqa
+from .register import register, verify_registration, verify_registration_check  # noqa
+from .register_email import register_email, verify_email, verify_email_check  # noqa
+from .reset_password import (  # noqa
+    reset_password,
+    reset_password_check,
+    send_reset_password_link,
+)
@@ -1,8 +1,20 @@
 from typing import Any, Dict, Optional, Type
 
+from django.http import Http404
+from django.utils.cache import patch_cache_control
+from django.utils.translation import gettext as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 from rest_framework.views import APIView
 
+from rest_registration.exceptions import SignatureError
+from rest_registration.settings import registration_settings
+from rest_registration.utils.responses import get_ok_response
+from rest_registration.utils.signers import URLParamsSigner, get_current_timestamp
+from rest_registration.utils.verification import check_verification_link_data
+
 
 class BaseAPIView(APIView):
     serializer_class: Optional[Type[Serializer]] = None
@@ -42,3 +54,67 @@ class BaseAPIView(APIView):
             'request': self.request,
             'view': self
         }
+
+
+class BaseVerificationLinkCheckView(BaseAPIView):
+    """
+    Check the verification link data given in the query string,
+    without accessing the database. The responses can be cached
+    by the client, unless the link is one-time-use.
+    """
+    # Authenticating the request could require a database query.
+    authentication_classes = []
+    permission_classes = registration_settings.NOT_AUTHENTICATED_PERMISSION_CLASSES
+    signer_class: Optional[Type[URLParamsSigner]] = None
+    cache_max_age = 24 * 60 * 60
+
+    def get(self, request: Request) -> Response:
+        if not self.is_verification_enabled():
+            raise Http404()
+        signer = check_verification_link_data(
+            request.query_params,
+            self.get_signer_class(),
+            self.get_serializer_class(),
+            serializer_context=self.get_serializer_context(),
+        )
+        if not signer.is_salt_stateless():
+            # The signature salt depends on the user state, so the link
+            # may be forged or already used.
+            response = get_ok_response(
+                _("Verification link signature cannot be checked"),
+                extra_data={'signature_checked': False},
+            )
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        response = get_ok_response(
+            _("Verification link is valid"),
+            extra_data={'signature_checked': True},
+        )
+        if signer.is_one_time_use():
+            # The link stops being valid once it is used.
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        max_age = self.cache_max_age
+        expiration_timestamp = signer.get_expiration_timestamp()
+        if expiration_timestamp is not None:
+            max_age = min(
+                max_age, max(expiration_timestamp - get_current_timestamp(), 0))
+        patch_cache_control(response, private=True, max_age=max_age)
+        return response
+
+    def handle_exception(self, exc: Exception) -> Response:
+        response = super().handle_exception(exc)
+        if isinstance(exc, (ValidationError, SignatureError)):
+            # The malformed, forged or expired links stay invalid.
+            patch_cache_control(response, private=True, max_age=self.cache_max_age)
+        return response
+
+    def is_verification_enabled(self) -> bool:
+        raise NotImplementedError()
+
+    def get_signer_class(self) -> Type[URLParamsSigner]:
+        assert self.signer_class is not None, (
+            f"'{self.__class__.__name__}' should include a "
+            f"`signer_class` attribute."
+        )
+        return self.signer_class
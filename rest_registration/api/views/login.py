@@ -14,6 +14,7 @@ from rest_registration.api.views.base import BaseAPIView
 from rest_registration.exceptions import LoginInvalid, UserNotFound
 from rest_registration.settings import registration_settings
 from rest_registration.utils.auth_backends import get_login_authentication_backend
+from rest_registration.utils.login_shield import shield_login_attempt
 from rest_registration.utils.responses import get_ok_response
 
 if TYPE_CHECKING:
@@ -32,12 +33,15 @@ class LoginView(BaseAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         login_authenticator = registration_settings.LOGIN_AUTHENTICATOR
-        try:
-            user = login_authenticator(serializer.validated_data, serializer=serializer)
-        except UserNotFound:
-            raise LoginInvalid() from None
+        with shield_login_attempt(request, serializer.validated_data):
+            try:
+                user = login_authenticator(
+                    serializer.validated_data, serializer=serializer)
+            except UserNotFound:
+                raise LoginInvalid() from None
 
-        extra_data = perform_login(request, user, credentials=serializer.validated_data)
+            extra_data = perform_login(
+                request, user, credentials=serializer.validated_data)
 
         return get_ok_response(_("Login successful"), extra_data=extra_data)
 
@@ -72,7 +76,8 @@ class LogoutView(BaseAPIView):
         if should_retrieve_token() and data['revoke_token']:
             auth_token_manager_cls = registration_settings.AUTH_TOKEN_MANAGER_CLASS
             auth_token_manager: AbstractAuthTokenManager = auth_token_manager_cls()  # noqa: E501
-            auth_token_manager.revoke_token(user)
+            auth_token_manager.revoke_token(
+                user, token=auth_token_manager.get_request_token(request))
 
         return get_ok_response(_("Logout successful"))
 
@@ -95,7 +100,11 @@ def should_retrieve_token() -> bool:
 
 
 def rest_auth_has_class(cls: type) -> bool:
-    return cls in api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    # TODO: remove type ignore when djangorestframework-stubs is fixed
+    return any(
+        issubclass(auth_cls, cls)  # type: ignore
+        for auth_cls in api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    )
 
 
 def perform_login(
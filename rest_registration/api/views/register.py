@@ -1,6 +1,7 @@
 from typing import Type
 
-from django.db import transaction
+from django.db import router, transaction
+from django.db.models.signals import post_save, pre_save
 from django.http import Http404
 from django.utils.translation import gettext as _
 from rest_framework import serializers, status
@@ -9,9 +10,15 @@ from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 
 from rest_registration import signals
-from rest_registration.api.views.base import BaseAPIView
+from rest_registration.api.views.base import (
+    BaseAPIView,
+    BaseVerificationLinkCheckView,
+)
 from rest_registration.api.views.login import perform_login
-from rest_registration.exceptions import UserWithoutEmailNonverifiable
+from rest_registration.exceptions import (
+    SignatureInvalid,
+    UserWithoutEmailNonverifiable,
+)
 from rest_registration.settings import registration_settings
 from rest_registration.signers.register import RegisterSigner
 from rest_registration.utils.responses import get_ok_response
@@ -19,8 +26,13 @@ from rest_registration.utils.users import (
     get_user_by_verification_id,
     get_user_email_field_name,
     get_user_setting,
+    user_identity_map,
+)
+from rest_registration.utils.verification import (
+    consuming_signer_or_bad_request,
+    expand_verification_token,
+    verify_signer_or_bad_request,
 )
-from rest_registration.utils.verification import verify_signer_or_bad_request
 
 
 class RegisterView(BaseAPIView):
@@ -97,11 +109,30 @@ class VerifyRegistrationView(BaseAPIView):
 verify_registration = VerifyRegistrationView.as_view()
 
 
+class VerifyRegistrationCheckView(BaseVerificationLinkCheckView):
+    serializer_class = VerifyRegistrationSerializer
+    signer_class = RegisterSigner
+
+    def get(self, request: Request) -> Response:
+        """
+        Check the registration verification link (without verifying the user).
+        """
+        return super().get(request)
+
+    def is_verification_enabled(self) -> bool:
+        return registration_settings.REGISTER_VERIFICATION_ENABLED
+
+
+verify_registration_check = VerifyRegistrationCheckView.as_view()
+
+
+@user_identity_map()
 def process_verify_registration_data(input_data, serializer_context=None):
     if serializer_context is None:
         serializer_context = {}
     if not registration_settings.REGISTER_VERIFICATION_ENABLED:
         raise Http404()
+    input_data = expand_verification_token(input_data, RegisterSigner)
     serializer = VerifyRegistrationSerializer(
         data=input_data,
         context=serializer_context,
@@ -113,10 +144,37 @@ def process_verify_registration_data(input_data, serializer_context=None):
     # may set strict=False
     signer = RegisterSigner(data, strict=False)
     verify_signer_or_bad_request(signer)
-
-    verification_flag_field = get_user_setting('VERIFICATION_FLAG_FIELD')
-    user = get_user_by_verification_id(data['user_id'], require_verified=False)
-    setattr(user, verification_flag_field, True)
-    user.save()
+    with consuming_signer_or_bad_request(signer):
+        verification_flag_field = get_user_setting('VERIFICATION_FLAG_FIELD')
+        user = get_user_by_verification_id(data['user_id'], require_verified=False)
+        if getattr(user, verification_flag_field):
+            # Already verified, there is nothing to write.
+            return user
+        user_class = type(user)
+        setattr(user, verification_flag_field, True)
+        # Use conditional update, so only one of the concurrent verifications
+        # of given user performs the write. The update does not send the model
+        # signals, so they are sent the same way as by save(update_fields=...).
+        # Note that if the user gets verified concurrently, pre_save is sent
+        # without the write (and post_save) following.
+        signal_kwargs = {
+            'sender': user_class,
+            'instance': user,
+            'raw': False,
+            'using': router.db_for_write(user_class, instance=user),
+            'update_fields': frozenset([verification_flag_field]),
+        }
+        pre_save.send(**signal_kwargs)
+        num_updated = (
+            user_class.objects
+            .filter(pk=user.pk)
+            .exclude(**{verification_flag_field: True})
+            .update(**{verification_flag_field: True})
+        )
+        if num_updated:
+            post_save.send(created=False, **signal_kwargs)
+        elif registration_settings.REGISTER_VERIFICATION_ONE_TIME_USE:
+            # The user was verified in the meantime using the same link.
+            raise SignatureInvalid()
 
     return user
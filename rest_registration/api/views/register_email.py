@@ -1,5 +1,6 @@
-from typing import Any, Dict, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
+from django.db import IntegrityError, transaction
 from django.http import Http404
 from django.utils.translation import gettext as _
 from rest_framework import permissions, serializers
@@ -8,7 +9,10 @@ from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 
 from rest_registration import signals
-from rest_registration.api.views.base import BaseAPIView
+from rest_registration.api.views.base import (
+    BaseAPIView,
+    BaseVerificationLinkCheckView,
+)
 from rest_registration.exceptions import EmailAlreadyRegistered
 from rest_registration.settings import registration_settings
 from rest_registration.signers.register_email import RegisterEmailSigner
@@ -17,9 +21,16 @@ from rest_registration.utils.users import (
     get_user_by_verification_id,
     get_user_email_field_name,
     is_user_email_field_unique,
+    user_identity_map,
     user_with_email_exists,
 )
-from rest_registration.utils.verification import verify_signer_or_bad_request
+from rest_registration.utils.verification import (
+    expand_verification_token,
+    verify_signer_or_bad_request,
+)
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
 
 
 class RegisterEmailView(BaseAPIView):
@@ -33,21 +44,16 @@ class RegisterEmailView(BaseAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         email = serializer.validated_data['email']
-        email_already_used = (
-            is_user_email_field_unique()
-            and user_with_email_exists(email))
 
         if registration_settings.REGISTER_EMAIL_VERIFICATION_ENABLED:
+            email_already_used = (
+                is_user_email_field_unique()
+                and user_with_email_exists(email, use_read_replica=True))
             email_sender = registration_settings.REGISTER_EMAIL_VERIFICATION_EMAIL_SENDER  # noqa: E501
             email_sender(request, user, email, email_already_used=email_already_used)
         else:
-            if email_already_used:
-                raise EmailAlreadyRegistered()
-
-            email_field_name = get_user_email_field_name()
-            old_email = getattr(user, email_field_name)
-            setattr(user, email_field_name, email)
-            user.save()
+            _check_email_not_registered(email)
+            old_email = _change_user_email(user, email)
             signals.user_changed_email.send(
                 sender=None,
                 user=user,
@@ -90,6 +96,24 @@ class VerifyEmailView(BaseAPIView):
 verify_email = VerifyEmailView.as_view()
 
 
+class VerifyEmailCheckView(BaseVerificationLinkCheckView):
+    serializer_class = VerifyEmailSerializer
+    signer_class = RegisterEmailSigner
+
+    def get(self, request: Request) -> Response:
+        '''
+        Check the email verification link (without changing the email).
+        '''
+        return super().get(request)
+
+    def is_verification_enabled(self) -> bool:
+        return registration_settings.REGISTER_EMAIL_VERIFICATION_ENABLED
+
+
+verify_email_check = VerifyEmailCheckView.as_view()
+
+
+@user_identity_map()
 def process_verify_email_data(
         input_data: Dict[str, Any],
         serializer_context: Optional[Dict[str, Any]] = None) -> None:
@@ -97,6 +121,7 @@ def process_verify_email_data(
         serializer_context = {}
     if not registration_settings.REGISTER_EMAIL_VERIFICATION_ENABLED:
         raise Http404()
+    input_data = expand_verification_token(input_data, RegisterEmailSigner)
     serializer = VerifyEmailSerializer(data=input_data, context=serializer_context)
     serializer.is_valid(raise_exception=True)
 
@@ -108,14 +133,9 @@ def process_verify_email_data(
     request = serializer_context.get('request')
     new_email = data['email']
 
-    if is_user_email_field_unique() and user_with_email_exists(new_email):
-        raise EmailAlreadyRegistered()
-
-    email_field_name = get_user_email_field_name()
+    _check_email_not_registered(new_email)
     user = get_user_by_verification_id(data['user_id'])
-    old_email = getattr(user, email_field_name)
-    setattr(user, email_field_name, new_email)
-    user.save()
+    old_email = _change_user_email(user, new_email)
 
     signals.user_changed_email.send(
         sender=None,
@@ -124,3 +144,41 @@ def process_verify_email_data(
         old_email=old_email,
         request=request,
     )
+
+
+def _check_email_not_registered(email: str) -> None:
+    if registration_settings.USER_OPTIMISTIC_UNIQUENESS_CHECK_ENABLED:
+        # The uniqueness is enforced by the database on write.
+        return
+    if (
+        is_user_email_field_unique()
+        and user_with_email_exists(email, use_read_replica=True)
+    ):
+        raise EmailAlreadyRegistered()
+
+
+def _change_user_email(user: 'AbstractBaseUser', new_email: str) -> str:
+    """
+    Set the new e-mail for the user and save it. Return the old e-mail.
+    """
+    email_field_name = get_user_email_field_name()
+    old_email = getattr(user, email_field_name)
+    optimistic = registration_settings.USER_OPTIMISTIC_UNIQUENESS_CHECK_ENABLED
+    if optimistic and is_user_email_field_unique() and old_email == new_email:
+        # Would not violate the constraint, but the upfront check
+        # treats it as already registered.
+        raise EmailAlreadyRegistered()
+    setattr(user, email_field_name, new_email)
+    if not optimistic and not registration_settings.READ_REPLICA_DB_ALIAS:
+        user.save(update_fields=[email_field_name])
+        return old_email
+    # The upfront check was skipped or could use stale replica data.
+    try:
+        with transaction.atomic():
+            user.save(update_fields=[email_field_name])
+    except IntegrityError:
+        setattr(user, email_field_name, old_email)
+        if user_with_email_exists(new_email):
+            raise EmailAlreadyRegistered() from None
+        raise
+    return old_email
@@ -8,18 +8,28 @@ from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 
 from rest_registration.api.serializers import PasswordConfirmSerializerMixin
-from rest_registration.api.views.base import BaseAPIView
+from rest_registration.api.views.base import (
+    BaseAPIView,
+    BaseVerificationLinkCheckView,
+)
 from rest_registration.exceptions import UserNotFound
 from rest_registration.settings import registration_settings
 from rest_registration.signers.reset_password import ResetPasswordSigner
 from rest_registration.utils.responses import get_ok_response
-from rest_registration.utils.users import get_user_by_verification_id
+from rest_registration.utils.users import (
+    get_user_by_verification_id,
+    user_identity_map,
+)
 from rest_registration.utils.validation import (
     run_validators,
     validate_password_with_user_id,
     validate_user_password_confirm,
 )
-from rest_registration.utils.verification import verify_signer_or_bad_request
+from rest_registration.utils.verification import (
+    consuming_signer_or_bad_request,
+    expand_verification_token,
+    verify_signer_or_bad_request,
+)
 
 
 class SendResetPasswordLinkView(BaseAPIView):
@@ -55,21 +65,30 @@ class SendResetPasswordLinkView(BaseAPIView):
 send_reset_password_link = SendResetPasswordLinkView.as_view()
 
 
-class ResetPasswordSerializer(  # pylint: disable=abstract-method
-        PasswordConfirmSerializerMixin,
-        serializers.Serializer):
+PASSWORD_VALIDATION_DEFERRED_CONTEXT_KEY = 'password_validation_deferred'
+
+
+class ResetPasswordLinkSerializer(serializers.Serializer):  # noqa: E501 pylint: disable=abstract-method
     user_id = serializers.CharField(required=True)
     timestamp = serializers.IntegerField(required=True)
     signature = serializers.CharField(required=True)
+
+
+class ResetPasswordSerializer(  # pylint: disable=abstract-method
+        PasswordConfirmSerializerMixin,
+        ResetPasswordLinkSerializer):
     password = serializers.CharField(required=True)
 
     def has_password_confirm_field(self):
         return registration_settings.RESET_PASSWORD_SERIALIZER_PASSWORD_CONFIRM
 
+    def is_password_validation_deferred(self):
+        return self.context.get(PASSWORD_VALIDATION_DEFERRED_CONTEXT_KEY, False)
+
     def validate(self, attrs):
-        validators = [
-            validate_password_with_user_id,
-        ]
+        validators = []
+        if not self.is_password_validation_deferred():
+            validators.append(validate_password_with_user_id)
         if self.has_password_confirm_field():
             validators.append(validate_user_password_confirm)
         run_validators(validators, attrs)
@@ -94,12 +113,35 @@ class ResetPasswordView(BaseAPIView):
 reset_password = ResetPasswordView.as_view()
 
 
+class ResetPasswordCheckView(BaseVerificationLinkCheckView):
+    serializer_class = ResetPasswordLinkSerializer
+    signer_class = ResetPasswordSigner
+
+    def get(self, request: Request) -> Response:
+        '''
+        Check the reset password link (without resetting the password).
+        '''
+        return super().get(request)
+
+    def is_verification_enabled(self) -> bool:
+        return registration_settings.RESET_PASSWORD_VERIFICATION_ENABLED
+
+
+reset_password_check = ResetPasswordCheckView.as_view()
+
+
+@user_identity_map()
 def process_reset_password_data(input_data, serializer_context=None):
     if serializer_context is None:
         serializer_context = {}
     if not registration_settings.RESET_PASSWORD_VERIFICATION_ENABLED:
         raise Http404()
-    serializer = ResetPasswordSerializer(data=input_data, context=serializer_context)
+    input_data = expand_verification_token(input_data, ResetPasswordSigner)
+    # The password itself is validated only after the signature is verified.
+    serializer = ResetPasswordSerializer(data=input_data, context={
+        **serializer_context,
+        PASSWORD_VALIDATION_DEFERRED_CONTEXT_KEY: True,
+    })
     serializer.is_valid(raise_exception=True)
 
     data = serializer.validated_data.copy()
@@ -109,7 +151,13 @@ def process_reset_password_data(input_data, serializer_context=None):
     # may set strict=False
     signer = ResetPasswordSigner(data, strict=False)
     verify_signer_or_bad_request(signer)
-
-    user = get_user_by_verification_id(data['user_id'], require_verified=False)
-    user.set_password(password)
-    user.save()
+    # Run the (potentially expensive) password validators and load the user
+    # only for the links which are not forged nor expired.
+    run_validators([validate_password_with_user_id], {
+        'user_id': data['user_id'],
+        'password': password,
+    })
+    with consuming_signer_or_bad_request(signer):
+        user = get_user_by_verification_id(data['user_id'], require_verified=False)
+        user.set_password(password)
+        user.save(update_fields=['password'])
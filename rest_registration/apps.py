@@ -1,7 +1,29 @@
 from django.apps import AppConfig
+from django.test.signals import setting_changed  # type: ignore
 
 import rest_registration.checks  # noqa
 
 
 class RestRegistrationConfig(AppConfig):
     name = 'rest_registration'
+
+    def ready(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        from rest_registration.auth_token_managers import (
+            connect_token_changed_handler,
+            token_settings_changed_handler,
+        )
+        from rest_registration.settings import registration_settings
+        from rest_registration.utils.last_login import (
+            replace_django_update_last_login_receiver,
+        )
+
+        registration_settings.compile()
+        replace_django_update_last_login_receiver()
+        # The token receivers depend on AUTH_TOKEN_MANAGER_CLASS,
+        # so they are reconnected on the settings change.
+        connect_token_changed_handler()
+        setting_changed.connect(
+            token_settings_changed_handler,
+            dispatch_uid='rest_registration_auth_token_settings_changed_handler',
+        )
@@ -1,13 +1,52 @@
-from typing import TYPE_CHECKING, NewType, Optional, Sequence, Type
+import datetime
+import secrets
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    List,
+    NewType,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.utils.translation import gettext_lazy as _
 from rest_framework.authentication import BaseAuthentication, TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
 
-from rest_registration.exceptions import AuthTokenNotFound, AuthTokenNotRevoked
+from rest_registration.exceptions import (
+    AuthTokenNotFound,
+    AuthTokenNotRevoked,
+)
+from rest_registration.settings import registration_settings
+from rest_registration.utils.cache import (
+    build_cache_key,
+    get_cache,
+    hash_cache_key_part,
+)
+from rest_registration.utils.users import get_user_by_lookup_dict
 
 AuthToken = NewType('AuthToken', str)
 
+TOKEN_CHANGED_HANDLER_DISPATCH_UID = 'rest_registration_token_changed_handler'
+
 if TYPE_CHECKING:
     from django.contrib.auth.base_user import AbstractBaseUser
+    from rest_framework.request import Request
+
+    from rest_registration.contrib.auth_token_key_versions.models import (
+        AuthTokenKeyVersion,
+    )
+
+UsersOrQuerySet = Union['QuerySet[AbstractBaseUser]', Iterable['AbstractBaseUser']]
 
 
 class AbstractAuthTokenManager:
@@ -30,6 +69,16 @@ class AbstractAuthTokenManager:
         """
         return []
 
+    def get_request_token(self, request: 'Request') -> Optional[AuthToken]:
+        """
+        Return the token which was used to authenticate given request,
+        if only that token should be revoked on logout.
+
+        By default, ``None`` is returned, so all tokens of the user
+        are revoked on logout.
+        """
+        return None
+
     def provide_token(self, user: 'AbstractBaseUser') -> AuthToken:
         """
         Get or create token for given user.
@@ -53,6 +102,26 @@ class AbstractAuthTokenManager:
         """
         raise AuthTokenNotRevoked()
 
+    def revoke_tokens(self, users: UsersOrQuerySet) -> int:
+        """
+        Revoke all tokens for given users (which can be provided as
+        a queryset). Users without any token are skipped.
+        Return the number of revoked tokens (or the number of the affected
+        users, if the tokens are not stored).
+
+        The default implementation calls ``revoke_token`` for each user;
+        overriding this method is recommended if the tokens can be revoked
+        using a single (set-based) operation.
+        """
+        num_revoked = 0
+        for user in users:
+            try:
+                self.revoke_token(user)
+            except AuthTokenNotFound:
+                continue
+            num_revoked += 1
+        return num_revoked
+
 
 class RestFrameworkAuthTokenManager(AbstractAuthTokenManager):
 
@@ -87,4 +156,345 @@ class RestFrameworkAuthTokenManager(AbstractAuthTokenManager):
         if token is not None and token_obj.key != token:
             raise AuthTokenNotFound() from None
 
+        invalidate_cached_token_user(token_obj.key)
         token_obj.delete()
+
+    def revoke_tokens(self, users: UsersOrQuerySet) -> int:
+        from rest_framework.authtoken.models import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            Token,
+        )
+
+        if not isinstance(users, QuerySet):
+            users = [user.pk for user in users]
+        tokens = Token.objects.filter(user__in=users)
+        # Delete the tokens using single DELETE statement, without loading
+        # them and sending the model signals.
+        return tokens._raw_delete(tokens.db)  # pylint: disable=protected-access
+
+
+class CachedRestFrameworkAuthTokenManager(RestFrameworkAuthTokenManager):
+    """
+    Same as ``RestFrameworkAuthTokenManager``, but the token keys are read
+    through the Django cache specified by :ref:`cache-alias-setting`,
+    so providing the token for the same user repeatedly does not need
+    any database queries. The matching authentication class,
+    ``CachedTokenAuthentication``, caches the primary keys of the users
+    authenticated by the tokens.
+
+    The missing token is inserted in a race-safe way, by ignoring
+    the conflicts (``ON CONFLICT DO NOTHING`` on the database backends
+    which support it) and reading the token which won the race.
+    """
+    CACHE_TIMEOUT: Optional[float] = 60 * 60
+
+    def get_authentication_class(self) -> Type[BaseAuthentication]:
+        return CachedTokenAuthentication
+
+    def provide_token(self, user: 'AbstractBaseUser') -> AuthToken:
+        cache = get_cache()
+        cache_key = build_token_cache_key(user.pk)
+        token_key = cache.get(cache_key)
+        if token_key is None:
+            token_key = self._get_or_create_token_key(user)
+            cache.set(cache_key, token_key, timeout=self.CACHE_TIMEOUT)
+        return AuthToken(token_key)
+
+    def revoke_token(
+            self, user: 'AbstractBaseUser', *,
+            token: Optional[AuthToken] = None) -> None:
+        try:
+            super().revoke_token(user, token=token)
+        finally:
+            invalidate_cached_token(user.pk)
+
+    def revoke_tokens(self, users: UsersOrQuerySet) -> int:
+        """
+        Same as ``RestFrameworkAuthTokenManager.revoke_tokens``, but the keys
+        of the tokens are read first (as values, single query), so their
+        cache entries can be invalidated in bulk after the delete.
+        When revoking the tokens of many users, pass the users in chunks.
+        """
+        from rest_framework.authtoken.models import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            Token,
+        )
+
+        if not isinstance(users, QuerySet):
+            users = [user.pk for user in users]
+        token_items = list(
+            Token.objects.filter(user__in=users).values_list('user_id', 'key'))
+        if not token_items:
+            return 0
+        tokens = Token.objects.filter(key__in=[key for _, key in token_items])
+        num_deleted = tokens._raw_delete(tokens.db)  # pylint: disable=protected-access
+        get_cache().delete_many([
+            *(build_token_cache_key(user_pk) for user_pk, _ in token_items),
+            *(
+                build_token_user_cache_key(hash_cache_key_part(key))
+                for _, key in token_items
+            ),
+        ])
+        return num_deleted
+
+    def _get_or_create_token_key(self, user: 'AbstractBaseUser') -> str:
+        from rest_framework.authtoken.models import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            Token,
+        )
+
+        token_keys = Token.objects.filter(user_id=user.pk).values_list(
+            'key', flat=True)
+        token_key = token_keys.first()
+        if token_key is not None:
+            return token_key
+        Token.objects.bulk_create(
+            [Token(key=Token.generate_key(), user=user)],
+            ignore_conflicts=True,
+        )
+        return token_keys.get()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Same as ``TokenAuthentication``, but the primary keys of the users
+    authenticated by the tokens are cached in the Django cache specified by
+    :ref:`cache-alias-setting`. For the recently seen clients, the
+    ``authtoken_token JOIN`` user query is replaced by a query retrieving
+    the user by primary key; the user is still queried on every request.
+
+    Only the user primary keys are cached, never the user instances.
+    The cache entry of the token is invalidated when the token is revoked,
+    saved or deleted, which requires
+    :ref:`auth-token-manager-class-setting` to be
+    ``CachedRestFrameworkAuthTokenManager`` (or its subclass).
+
+    Unlike ``TokenAuthentication``, ``request.auth`` is the token key
+    and not the ``Token`` instance.
+    """
+    CACHE_TIMEOUT: Optional[float] = 5 * 60
+
+    def authenticate_credentials(
+            self, key: str) -> Tuple['AbstractBaseUser', str]:
+        cache = get_cache()
+        cache_key = build_token_user_cache_key(hash_cache_key_part(key))
+        user_pk = cache.get(cache_key)
+        user: Optional['AbstractBaseUser'] = None
+        if user_pk is not None:
+            user = get_user_by_lookup_dict(
+                {'pk': user_pk}, default=None, require_verified=False)
+        if user is None:
+            user = super().authenticate_credentials(key)[0]
+            cache.set(cache_key, user.pk, timeout=self.CACHE_TIMEOUT)
+        if not user.is_active:
+            raise AuthenticationFailed(_('User inactive or deleted.'))
+        return (user, key)
+
+
+class SignedAuthTokenManager(AbstractAuthTokenManager):
+    """
+    Auth token manager which does not store the tokens. Each token is
+    signed using ``SECRET_KEY`` and contains the user id, the issue time
+    and the key version of the user, so authenticating the request needs
+    only the user to be retrieved.
+
+    The key versions are stored in the database
+    (``rest_registration.contrib.auth_token_key_versions`` needs to be
+    in ``INSTALLED_APPS``) and read through the Django cache specified by
+    :ref:`cache-alias-setting`, which needs to be shared by all the processes.
+    Revoking the token generates new key version for the user, which revokes
+    all tokens issued for that user. Changing the password of the user
+    also invalidates all the tokens.
+    """
+    SALT = 'rest_registration.auth_token_managers.SignedAuthTokenManager'
+    VALID_PERIOD: Optional[datetime.timedelta] = datetime.timedelta(days=30)
+    KEY_VERSION_CACHE_TIMEOUT = 300
+
+    def get_authentication_class(self) -> Type[BaseAuthentication]:
+        return SignedTokenAuthentication
+
+    def get_app_names(self) -> Sequence[str]:
+        return [
+            'rest_registration.contrib.auth_token_key_versions',
+        ]
+
+    def provide_token(self, user: 'AbstractBaseUser') -> AuthToken:
+        data = {
+            'user_id': _serialize_pk(user.pk),
+            'key_version': self._get_or_create_key_version(user.pk),
+            'auth_hash': self._get_user_auth_hash(user),
+        }
+        return AuthToken(signing.dumps(data, salt=self.SALT))
+
+    def revoke_token(
+            self, user: 'AbstractBaseUser', *,
+            token: Optional[AuthToken] = None) -> None:
+        if token is not None:
+            data = self._load_token_data(token)
+            if data is None or data['user_id'] != _serialize_pk(user.pk):
+                raise AuthTokenNotFound()
+        key_version_model = _get_key_version_model()
+        key_version_model.objects.rotate_key_version(user.pk)
+        get_cache().delete(build_key_version_cache_key(user.pk))
+
+    def revoke_tokens(self, users: UsersOrQuerySet) -> int:
+        user_pks: List[Any]
+        if isinstance(users, QuerySet):
+            user_pks = list(users.values_list('pk', flat=True))
+        else:
+            user_pks = [user.pk for user in users]
+        # Tokens with missing key version are considered invalid.
+        key_version_model = _get_key_version_model()
+        key_version_model.objects.filter(user_id__in=user_pks).delete()
+        get_cache().delete_many([
+            build_key_version_cache_key(pk) for pk in user_pks
+        ])
+        return len(user_pks)
+
+    def get_user_for_token(self, token: str) -> Optional['AbstractBaseUser']:
+        """
+        Return the user for given token or ``None`` if the token is invalid,
+        expired or revoked.
+        """
+        data = self._load_token_data(token)
+        if data is None:
+            return None
+        key_version = self._get_key_version(data['user_id'])
+        if key_version is None or key_version != data['key_version']:
+            return None
+        user_class = get_user_model()
+        try:
+            user = user_class._default_manager.get(  # noqa: E501 pylint: disable=protected-access
+                pk=data['user_id'])
+        except user_class.DoesNotExist:
+            return None
+        if not secrets.compare_digest(
+                self._get_user_auth_hash(user), data['auth_hash']):
+            return None
+        return user
+
+    def _load_token_data(self, token: str) -> Optional[dict]:
+        max_age = self.VALID_PERIOD
+        try:
+            data = signing.loads(token, salt=self.SALT, max_age=max_age)
+        except signing.BadSignature:
+            return None
+        if not isinstance(data, dict):
+            return None
+        return data
+
+    def _get_key_version(self, user_pk: Any) -> Optional[str]:
+        cache = get_cache()
+        cache_key = build_key_version_cache_key(user_pk)
+        key_version = cache.get(cache_key)
+        if key_version is not None:
+            return key_version
+        key_version_model = _get_key_version_model()
+        key_version = key_version_model.objects.get_key_version(user_pk)
+        if key_version is not None:
+            cache.set(
+                cache_key, key_version, timeout=self.KEY_VERSION_CACHE_TIMEOUT)
+        return key_version
+
+    def _get_or_create_key_version(self, user_pk: Any) -> str:
+        key_version = self._get_key_version(user_pk)
+        if key_version is not None:
+            return key_version
+        key_version_model = _get_key_version_model()
+        key_version = key_version_model.objects.get_or_create_key_version(user_pk)
+        get_cache().set(
+            build_key_version_cache_key(user_pk), key_version,
+            timeout=self.KEY_VERSION_CACHE_TIMEOUT)
+        return key_version
+
+    def _get_user_auth_hash(self, user: 'AbstractBaseUser') -> str:
+        return user.get_session_auth_hash()[:16]
+
+
+class SignedTokenAuthentication(TokenAuthentication):
+    """
+    Authentication class parsing tokens provided by
+    ``SignedAuthTokenManager``. It uses the same
+    ``Authorization: Token ${YourToken}`` header as ``TokenAuthentication``.
+    """
+    token_manager_class = SignedAuthTokenManager
+
+    def authenticate_credentials(
+            self, key: str) -> Tuple['AbstractBaseUser', str]:
+        user = self.token_manager_class().get_user_for_token(key)
+        if user is None:
+            raise AuthenticationFailed(_('Invalid token.'))
+        if not user.is_active:
+            raise AuthenticationFailed(_('User inactive or deleted.'))
+        return (user, key)
+
+
+def build_key_version_cache_key(user_pk: Any) -> str:
+    return build_cache_key('auth-token', 'key-version', _serialize_pk(user_pk))
+
+
+def _serialize_pk(pk: Any) -> str:
+    return str(pk)
+
+
+def _get_key_version_model() -> Type['AuthTokenKeyVersion']:
+    from rest_registration.contrib.auth_token_key_versions.models import (  # noqa: E501 pylint: disable=import-outside-toplevel
+        AuthTokenKeyVersion,
+    )
+    return AuthTokenKeyVersion
+
+
+def build_token_cache_key(user_pk: object) -> str:
+    return build_cache_key('auth-token', 'user', user_pk)
+
+
+def invalidate_cached_token(user_pk: object) -> None:
+    get_cache().delete(build_token_cache_key(user_pk))
+
+
+def build_token_user_cache_key(key_hash: str) -> str:
+    return build_cache_key('auth-token-user', 'token', key_hash)
+
+
+def invalidate_cached_token_user(token_key: str) -> None:
+    get_cache().delete(
+        build_token_user_cache_key(hash_cache_key_part(token_key)))
+
+
+def token_changed_handler(sender, instance, **kwargs) -> None:
+    invalidate_cached_token(instance.user_id)
+    invalidate_cached_token_user(instance.key)
+
+
+def connect_token_changed_handler() -> None:
+    """
+    Connect ``token_changed_handler`` to the signals of the DRF ``Token``
+    model if the cached token manager is used; disconnect it otherwise,
+    so the other token managers keep the fast deletes of the tokens.
+    """
+    if not apps.is_installed('rest_framework.authtoken'):
+        return
+    for signal in (post_save, post_delete):
+        if _is_token_manager_cached():
+            signal.connect(
+                token_changed_handler,
+                sender='authtoken.Token',
+                dispatch_uid=TOKEN_CHANGED_HANDLER_DISPATCH_UID,
+            )
+        else:
+            signal.disconnect(
+                sender='authtoken.Token',
+                dispatch_uid=TOKEN_CHANGED_HANDLER_DISPATCH_UID,
+            )
+
+
+def token_settings_changed_handler(setting, **kwargs) -> None:
+    if setting == 'REST_REGISTRATION':
+        connect_token_changed_handler()
+
+
+def _is_token_manager_cached() -> bool:
+    try:
+        cls = registration_settings.AUTH_TOKEN_MANAGER_CLASS
+    except ImportError:
+        # The invalid setting is reported by the system checks.
+        return False
+    return isinstance(cls, type) and issubclass(
+        cls, CachedRestFrameworkAuthTokenManager)
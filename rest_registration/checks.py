@@ -6,8 +6,15 @@ from django.contrib.auth import get_user_model
 from django.core.checks import register
 from rest_framework.settings import api_settings
 
-from rest_registration.auth_token_managers import AbstractAuthTokenManager
+from rest_registration.auth_token_managers import (
+    AbstractAuthTokenManager,
+    SignedAuthTokenManager,
+)
 from rest_registration.enums import ErrorCode, WarningCode
+from rest_registration.one_time_use_stores import (
+    AbstractOneTimeUseStore,
+    get_one_time_use_store,
+)
 from rest_registration.settings import registration_settings
 from rest_registration.utils.auth_backends import get_login_authentication_backend
 from rest_registration.utils.checks import no_exception_check, predicate_check
@@ -23,6 +30,10 @@ from rest_registration.utils.users import (
 if TYPE_CHECKING:
     from django.db.models import Model
 
+NON_SHARED_CACHE_BACKENDS = {
+    'django.core.cache.backends.locmem.LocMemCache',
+}
+
 
 @register()
 @predicate_check(
@@ -130,6 +141,19 @@ def token_auth_installed_check() -> bool:
     )
 
 
+@register()
+@predicate_check(
+    'SignedAuthTokenManager is used but'
+    ' the cache specified by CACHE_ALIAS is not shared between processes',
+    ErrorCode.NON_SHARED_AUTH_TOKEN_CACHE,
+)
+def signed_auth_token_cache_shared_check() -> bool:
+    return implies(
+        _is_auth_token_manager_signed(),
+        _is_cache_shared,
+    )
+
+
 def _is_auth_token_manager_auth_class_enabled() -> bool:
     auth_token_manager = _get_auth_token_manager()
     auth_cls = auth_token_manager.get_authentication_class()
@@ -167,6 +191,20 @@ def register_verification_one_time_auto_login_check() -> bool:
     )
 
 
+@register()
+@predicate_check(
+    'LOGIN_PASSWORD_HASH_UPGRADE_DEFERRED is enabled,'
+    ' but LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED is not enabled.'
+    ' The password hash upgrades will not be deferred.',
+    WarningCode.LOGIN_PASSWORD_HASH_UPGRADE_NOT_DEFERRED,
+)
+def login_password_hash_upgrade_deferred_check() -> bool:
+    return implies(
+        registration_settings.LOGIN_PASSWORD_HASH_UPGRADE_DEFERRED,
+        registration_settings.LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED,
+    )
+
+
 @register()
 @no_exception_check(
     'REGISTER_VERIFICATION_EMAIL_TEMPLATES is invalid',
@@ -306,6 +344,45 @@ def valid_auth_token_manager_class_provide_token_check() -> bool:
     )
 
 
+@register()
+@predicate_check(
+    'READ_REPLICA_DB_ALIAS is not one of the DATABASES keys',
+    ErrorCode.INVALID_READ_REPLICA_DB_ALIAS,
+)
+def read_replica_db_alias_check() -> bool:
+    read_replica_db_alias = registration_settings.READ_REPLICA_DB_ALIAS
+    return implies(
+        read_replica_db_alias is not None,
+        read_replica_db_alias in settings.DATABASES,
+    )
+
+
+@register()
+@predicate_check(
+    'VERIFICATION_ONE_TIME_USE_STORE_CLASS is not proper subclass'
+    ' of AbstractOneTimeUseStore',
+    ErrorCode.INVALID_ONE_TIME_USE_STORE_CLASS,
+)
+def valid_one_time_use_store_class_check() -> bool:
+    return implies(
+        _is_one_time_use_store_set(),
+        _is_one_time_use_store_proper_subclass,
+    )
+
+
+@register()
+@predicate_check(
+    'VERIFICATION_ONE_TIME_USE_STORE_CLASS requires apps'
+    ' which are not in INSTALLED_APPS',
+    ErrorCode.INVALID_ONE_TIME_USE_STORE_CLASS,
+)
+def one_time_use_store_app_names_installed_check() -> bool:
+    return implies(
+        _is_one_time_use_store_set() and _is_one_time_use_store_proper_subclass(),
+        _is_one_time_use_store_app_name_installed,
+    )
+
+
 @register()
 @no_exception_check(
     'invalid authentication backends configuration',
@@ -356,6 +433,16 @@ def _is_auth_token_manager_proper_subclass() -> bool:
         and cls != AbstractAuthTokenManager)
 
 
+def _is_auth_token_manager_signed() -> bool:
+    cls = registration_settings.AUTH_TOKEN_MANAGER_CLASS
+    return isinstance(cls, type) and issubclass(cls, SignedAuthTokenManager)
+
+
+def _is_cache_shared() -> bool:
+    cache_config = settings.CACHES.get(registration_settings.CACHE_ALIAS, {})
+    return cache_config.get('BACKEND') not in NON_SHARED_CACHE_BACKENDS
+
+
 def _is_auth_token_manager_class_implementing_method(method_name: str) -> bool:
     cls = registration_settings.AUTH_TOKEN_MANAGER_CLASS
     cls_method = getattr(cls, method_name, None)
@@ -363,5 +450,23 @@ def _is_auth_token_manager_class_implementing_method(method_name: str) -> bool:
     return cls_method is not abstract_method
 
 
+def _is_one_time_use_store_set() -> bool:
+    return registration_settings.VERIFICATION_ONE_TIME_USE_STORE_CLASS is not None
+
+
+def _is_one_time_use_store_proper_subclass() -> bool:
+    cls = registration_settings.VERIFICATION_ONE_TIME_USE_STORE_CLASS
+    return (
+        isinstance(cls, type)
+        and issubclass(cls, AbstractOneTimeUseStore)
+        and cls != AbstractOneTimeUseStore)
+
+
+def _is_one_time_use_store_app_name_installed() -> bool:
+    store = get_one_time_use_store()
+    app_names = store.get_app_names() if store is not None else []
+    return all(app_name in settings.INSTALLED_APPS for app_name in app_names)
+
+
 def _is_auth_installed() -> bool:
     return 'django.contrib.auth' in settings.INSTALLED_APPS
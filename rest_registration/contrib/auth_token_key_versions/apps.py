@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class AuthTokenKeyVersionsConfig(AppConfig):
+    name = 'rest_registration.contrib.auth_token_key_versions'
+    label = 'auth_token_key_versions'
+    verbose_name = 'Auth token key versions'
+    default_auto_field = 'django.db.models.BigAutoField'
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuthTokenKeyVersion',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='auth_token_key_version', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='User')),
+                ('key_version', models.CharField(max_length=32, verbose_name='Key version')),
+            ],
+            options={
+                'verbose_name': 'Auth token key version',
+                'verbose_name_plural': 'Auth token key versions',
+            },
+        ),
+    ]
@@ -0,0 +1,58 @@
+import secrets
+from typing import Any, Optional
+
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class AuthTokenKeyVersionQuerySet(models.QuerySet):
+
+    def get_key_version(self, user_pk: Any) -> Optional[str]:
+        return (
+            self.filter(user_id=user_pk)
+            .values_list('key_version', flat=True)
+            .first())
+
+    def get_or_create_key_version(self, user_pk: Any) -> str:
+        obj, _ = self.get_or_create(
+            user_id=user_pk,
+            defaults={'key_version': generate_key_version()},
+        )
+        return obj.key_version
+
+    def rotate_key_version(self, user_pk: Any) -> str:
+        """
+        Replace the key version of given user, which invalidates all the
+        tokens issued with the previous one.
+        """
+        key_version = generate_key_version()
+        self.update_or_create(
+            user_id=user_pk,
+            defaults={'key_version': key_version},
+        )
+        return key_version
+
+
+class AuthTokenKeyVersion(models.Model):
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        primary_key=True,
+        related_name='auth_token_key_version',
+        on_delete=models.CASCADE,
+        verbose_name=_("User"),
+    )
+    key_version = models.CharField(_("Key version"), max_length=32)
+
+    objects = AuthTokenKeyVersionQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("Auth token key version")
+        verbose_name_plural = _("Auth token key versions")
+
+    def __str__(self) -> str:
+        return str(self.user_id)  # pylint: disable=no-member
+
+
+def generate_key_version() -> str:
+    return secrets.token_hex(8)
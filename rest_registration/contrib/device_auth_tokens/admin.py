@@ -0,0 +1,15 @@
+from django.contrib import admin
+
+from rest_registration.contrib.device_auth_tokens.models import DeviceAuthToken
+
+
+@admin.register(DeviceAuthToken)
+class DeviceAuthTokenAdmin(admin.ModelAdmin):
+    list_display = ('prefix', 'user', 'created')
+    fields = ('user', 'prefix', 'created')
+    readonly_fields = ('user', 'prefix', 'created')
+    ordering = ('-created',)
+
+    def has_add_permission(self, request):
+        # The raw token would not be shown, so adding makes no sense.
+        return False
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class DeviceAuthTokensConfig(AppConfig):
+    name = 'rest_registration.contrib.device_auth_tokens'
+    label = 'device_auth_tokens'
+    verbose_name = 'Device auth tokens'
+    default_auto_field = 'django.db.models.BigAutoField'
@@ -0,0 +1,102 @@
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple, Type
+
+from django.db.models import QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework.authentication import BaseAuthentication, TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from rest_registration.auth_token_managers import (
+    AbstractAuthTokenManager,
+    AuthToken,
+    UsersOrQuerySet,
+)
+from rest_registration.exceptions import AuthTokenNotFound
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+    from rest_framework.request import Request
+
+
+class DeviceAuthTokenManager(AbstractAuthTokenManager):
+    """
+    Auth token manager which provides new token on each login, so the user
+    can have multiple tokens (one per device). The tokens are stored hashed;
+    only a short prefix of the token is stored as-is (and indexed)
+    to make the lookup fast.
+
+    Revoking the token used to authenticate the logout request revokes only
+    that token, so other devices of the user stay logged in.
+    """
+
+    def get_authentication_class(self) -> Type[BaseAuthentication]:
+        return DeviceTokenAuthentication
+
+    def get_app_names(self) -> Sequence[str]:
+        return [
+            'rest_registration.contrib.device_auth_tokens',
+        ]
+
+    def get_request_token(self, request: 'Request') -> Optional[AuthToken]:
+        if not isinstance(
+                request.successful_authenticator, DeviceTokenAuthentication):
+            return None
+        return AuthToken(request.auth)
+
+    def provide_token(self, user: 'AbstractBaseUser') -> AuthToken:
+        from rest_registration.contrib.device_auth_tokens.models import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            DeviceAuthToken,
+        )
+
+        _, raw_token = DeviceAuthToken.objects.create_token(user)
+        return AuthToken(raw_token)
+
+    def revoke_token(
+            self, user: 'AbstractBaseUser', *,
+            token: Optional[AuthToken] = None) -> None:
+        from rest_registration.contrib.device_auth_tokens.models import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            DeviceAuthToken,
+        )
+
+        user_tokens = DeviceAuthToken.objects.filter(user_id=user.pk)
+        if token is None:
+            num_deleted, _ = user_tokens.delete()
+            if not num_deleted:
+                raise AuthTokenNotFound()
+            return
+
+        token_obj = user_tokens.get_by_raw_token(token)
+        if token_obj is None:
+            raise AuthTokenNotFound()
+        token_obj.delete()
+
+    def revoke_tokens(self, users: UsersOrQuerySet) -> int:
+        from rest_registration.contrib.device_auth_tokens.models import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            DeviceAuthToken,
+        )
+
+        if not isinstance(users, QuerySet):
+            users = [user.pk for user in users]
+        num_deleted, _ = DeviceAuthToken.objects.filter(user__in=users).delete()
+        return num_deleted
+
+
+class DeviceTokenAuthentication(TokenAuthentication):
+    """
+    Authentication class parsing tokens provided by
+    ``DeviceAuthTokenManager``. It uses the same
+    ``Authorization: Token ${YourToken}`` header as ``TokenAuthentication``.
+    """
+
+    def authenticate_credentials(
+            self, key: str) -> Tuple['AbstractBaseUser', str]:
+        from rest_registration.contrib.device_auth_tokens.models import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            DeviceAuthToken,
+        )
+
+        token_obj = DeviceAuthToken.objects.select_related(
+            'user').get_by_raw_token(key)
+        if token_obj is None:
+            raise AuthenticationFailed(_('Invalid token.'))
+        if not token_obj.user.is_active:
+            raise AuthenticationFailed(_('User inactive or deleted.'))
+        return (token_obj.user, key)
@@ -0,0 +1,80 @@
+import hashlib
+import secrets
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+
+TOKEN_PREFIX_LENGTH = 8
+
+
+class DeviceAuthTokenQuerySet(models.QuerySet):
+
+    def create_token(self, user: 'AbstractBaseUser') -> Tuple[
+            'DeviceAuthToken', str]:
+        """
+        Create new token for given user. Return the token object
+        and the raw token; the raw token is not stored in the database.
+        """
+        raw_token = generate_raw_token()
+        token_obj = self.create(
+            user=user,
+            prefix=get_token_prefix(raw_token),
+            digest=get_token_digest(raw_token),
+        )
+        return token_obj, raw_token
+
+    def filter_by_raw_token(self, raw_token: str) -> 'DeviceAuthTokenQuerySet':
+        """
+        Filter the tokens using the indexed prefix of given raw token.
+        The result needs to be checked with ``DeviceAuthToken.matches()``.
+        """
+        return self.filter(prefix=get_token_prefix(raw_token))
+
+    def get_by_raw_token(self, raw_token: str) -> Optional['DeviceAuthToken']:
+        for token_obj in self.filter_by_raw_token(raw_token):
+            if token_obj.matches(raw_token):
+                return token_obj
+        return None
+
+
+class DeviceAuthToken(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name='device_auth_tokens',
+        on_delete=models.CASCADE,
+        verbose_name=_("User"),
+    )
+    prefix = models.CharField(
+        _("Prefix"), max_length=TOKEN_PREFIX_LENGTH, db_index=True)
+    digest = models.CharField(_("Digest"), max_length=64)
+    created = models.DateTimeField(_("Created"), auto_now_add=True)
+
+    objects = DeviceAuthTokenQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("Device auth token")
+        verbose_name_plural = _("Device auth tokens")
+
+    def __str__(self) -> str:
+        return f"{self.prefix}..."
+
+    def matches(self, raw_token: str) -> bool:
+        return secrets.compare_digest(self.digest, get_token_digest(raw_token))
+
+
+def generate_raw_token() -> str:
+    return secrets.token_hex(20)
+
+
+def get_token_prefix(raw_token: str) -> str:
+    return raw_token[:TOKEN_PREFIX_LENGTH]
+
+
+def get_token_digest(raw_token: str) -> str:
+    # The raw tokens have high entropy, so a fast hash function is sufficient.
+    return hashlib.sha256(raw_token.encode('utf-8')).hexdigest()
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class VerificationNoncesConfig(AppConfig):
+    name = 'rest_registration.contrib.verification_nonces'
+    label = 'verification_nonces'
+    verbose_name = 'Verification nonces'
+    default_auto_field = 'django.db.models.BigAutoField'
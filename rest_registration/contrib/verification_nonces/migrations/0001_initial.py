@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UsedVerificationNonce',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nonce', models.CharField(max_length=64, unique=True, verbose_name='Nonce')),
+                ('expires', models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='Expires')),
+            ],
+            options={
+                'verbose_name': 'Used verification nonce',
+                'verbose_name_plural': 'Used verification nonces',
+            },
+        ),
+    ]
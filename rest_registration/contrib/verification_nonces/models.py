@@ -0,0 +1,47 @@
+import datetime
+from typing import Optional
+
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class UsedVerificationNonceQuerySet(models.QuerySet):
+
+    def consume(
+            self, nonce: str, timeout: Optional[datetime.timedelta]) -> bool:
+        """
+        Store the nonce as used. Return ``False`` if it is already stored
+        and not expired yet.
+        """
+        now = timezone.now()
+        expires = now + timeout if timeout is not None else None
+        try:
+            with transaction.atomic(using=self.db):
+                self.create(nonce=nonce, expires=expires)
+        except IntegrityError:
+            # Reuse the row of the expired nonce.
+            num_updated = (
+                self.filter(nonce=nonce, expires__lte=now)
+                .update(expires=expires))
+            return num_updated > 0
+        return True
+
+    def delete_expired(self) -> int:
+        num_deleted, _ = self.filter(expires__lte=timezone.now()).delete()
+        return num_deleted
+
+
+class UsedVerificationNonce(models.Model):
+    nonce = models.CharField(_("Nonce"), max_length=64, unique=True)
+    expires = models.DateTimeField(
+        _("Expires"), null=True, blank=True, db_index=True)
+
+    objects = UsedVerificationNonceQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("Used verification nonce")
+        verbose_name_plural = _("Used verification nonces")
+
+    def __str__(self) -> str:
+        return self.nonce
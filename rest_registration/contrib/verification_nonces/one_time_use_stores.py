@@ -0,0 +1,25 @@
+import datetime
+from typing import Optional, Sequence
+
+from rest_registration.one_time_use_stores import AbstractOneTimeUseStore
+
+
+class DatabaseOneTimeUseStore(AbstractOneTimeUseStore):
+    """
+    Store which keeps the used nonces in a compact database table.
+    The expired nonces can be removed using
+    ``UsedVerificationNonce.objects.delete_expired()``.
+    """
+
+    def get_app_names(self) -> Sequence[str]:
+        return [
+            'rest_registration.contrib.verification_nonces',
+        ]
+
+    def consume(
+            self, nonce: str, timeout: Optional[datetime.timedelta]) -> bool:
+        from rest_registration.contrib.verification_nonces.models import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            UsedVerificationNonce,
+        )
+
+        return UsedVerificationNonce.objects.consume(nonce, timeout)
@@ -14,7 +14,7 @@ from rest_registration.contrib.verification_redirects.settings import (
 def verify_registration(request):
     return _generic_redirect_view(
         request, process_verify_registration_data,
-        ['user_id', 'signature', 'timestamp'],
+        ['user_id', 'signature', 'timestamp', 'token'],
         verification_redirects_settings.VERIFY_REGISTRATION_SUCCESS_URL,
         verification_redirects_settings.VERIFY_REGISTRATION_FAILURE_URL)
 
@@ -23,7 +23,7 @@ def verify_registration(request):
 def verify_email(request):
     return _generic_redirect_view(
         request, process_verify_email_data,
-        ['user_id', 'email', 'signature', 'timestamp'],
+        ['user_id', 'email', 'signature', 'timestamp', 'token'],
         verification_redirects_settings.VERIFY_EMAIL_SUCCESS_URL,
         verification_redirects_settings.VERIFY_EMAIL_FAILURE_URL)
 
@@ -32,7 +32,7 @@ def verify_email(request):
 def reset_password(request):
     return _generic_redirect_view(
         request, process_reset_password_data,
-        ['user_id', 'signature', 'timestamp', 'password'],
+        ['user_id', 'signature', 'timestamp', 'token', 'password'],
         verification_redirects_settings.RESET_PASSWORD_SUCCESS_URL,
         verification_redirects_settings.RESET_PASSWORD_FAILURE_URL,
         use_post_method=True)
@@ -31,6 +31,9 @@ class ErrorCode(_BaseCheckCodeMixin, Enum):
     INVALID_REGISTER_EMAIL_SERIALIZER_CLASS = 12
     NON_UNIQUE_FIELD_USED_AS_UNIQUE = 13
     INVALID_AUTH_BACKENDS_CONFIG = 14
+    INVALID_READ_REPLICA_DB_ALIAS = 15
+    INVALID_ONE_TIME_USE_STORE_CLASS = 16
+    NON_SHARED_AUTH_TOKEN_CACHE = 17
 
     def get_code_id(self) -> str:
         return f"E{self.value:03d}"
@@ -45,6 +48,7 @@ class ErrorCode(_BaseCheckCodeMixin, Enum):
 class WarningCode(_BaseCheckCodeMixin, Enum):
     REGISTER_VERIFICATION_MULTIPLE_AUTO_LOGIN = 1
     DEPRECATION = 2
+    LOGIN_PASSWORD_HASH_UPGRADE_NOT_DEFERRED = 3
 
     def get_code_id(self) -> str:
         return f"W{self.value:03d}"
@@ -0,0 +1,83 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from rest_registration.settings import registration_settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Revoke the auth tokens of all users, using AUTH_TOKEN_MANAGER_CLASS."
+        " The users are processed in chunks ordered by primary key;"
+        " an interrupted run can be resumed using --start-after-pk."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=1000,
+            help="Number of users processed in single chunk.",
+        )
+        parser.add_argument(
+            '--start-after-pk',
+            help="Process only users with primary key greater than given one.",
+        )
+        parser.add_argument(
+            '--only-active', action='store_true',
+            help="Process only active users.",
+        )
+        parser.add_argument(
+            '--noinput', '--no-input', action='store_false', dest='interactive',
+            help="Do not prompt the user for confirmation.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        if chunk_size <= 0:
+            raise CommandError("--chunk-size must be positive")
+        if options['interactive']:
+            confirm = input(
+                "This will revoke the auth tokens of the users."
+                " Type 'yes' to continue: ")
+            if confirm != 'yes':
+                raise CommandError("Revoking the auth tokens cancelled.")
+
+        auth_token_manager = registration_settings.AUTH_TOKEN_MANAGER_CLASS()
+        user_class = get_user_model()
+        users = user_class._default_manager.all()  # pylint: disable=protected-access
+        if options['only_active']:
+            users = users.filter(is_active=True)
+        last_pk = options['start_after_pk']
+        if last_pk is not None:
+            last_pk = user_class._meta.pk.to_python(last_pk)  # noqa: E501 pylint: disable=protected-access
+
+        start_time = time.monotonic()
+        total_users = 0
+        total_revoked = 0
+        while True:
+            chunk_users = users.order_by('pk')
+            if last_pk is not None:
+                chunk_users = chunk_users.filter(pk__gt=last_pk)
+            chunk_pks = list(chunk_users.values_list('pk', flat=True)[:chunk_size])
+            if not chunk_pks:
+                break
+            total_revoked += auth_token_manager.revoke_tokens(
+                users.filter(pk__in=chunk_pks))
+            total_users += len(chunk_pks)
+            last_pk = chunk_pks[-1]
+            elapsed = time.monotonic() - start_time
+            self.stdout.write(
+                f"Processed {total_users} users ({total_revoked} tokens revoked,"
+                f" {_get_rate(total_users, elapsed):.1f} users/s),"
+                f" last pk: {last_pk}")
+
+        elapsed = time.monotonic() - start_time
+        self.stdout.write(self.style.SUCCESS(
+            f"Done: processed {total_users} users, revoked {total_revoked} tokens"
+            f" in {elapsed:.1f}s ({_get_rate(total_users, elapsed):.1f} users/s)"))
+
+
+def _get_rate(count: int, elapsed: float) -> float:
+    if elapsed <= 0:
+        return 0.0
+    return count / elapsed
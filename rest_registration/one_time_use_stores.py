@@ -0,0 +1,49 @@
+import datetime
+from typing import Optional, Sequence
+
+from rest_registration.settings import registration_settings
+from rest_registration.utils.cache import build_cache_key, get_cache
+
+
+class AbstractOneTimeUseStore:
+
+    def get_app_names(self) -> Sequence[str]:
+        """
+        Return the Django app names which need to be installed so
+        this store works properly.
+        """
+        return []
+
+    def consume(
+            self, nonce: str, timeout: Optional[datetime.timedelta]) -> bool:
+        """
+        Mark given nonce as used for (at least) given timeout;
+        ``None`` means forever. Return ``False`` if the nonce was
+        already used.
+
+        The implementation should be atomic, so only one of the concurrent
+        calls with the same nonce succeeds.
+        """
+        raise NotImplementedError()
+
+
+class CacheOneTimeUseStore(AbstractOneTimeUseStore):
+    """
+    Store which keeps the used nonces in the cache specified
+    by ``CACHE_ALIAS`` setting. To work across multiple processes or nodes,
+    the cache needs to be shared (like Redis or Memcached) and it should not
+    evict the entries before they expire.
+    """
+
+    def consume(
+            self, nonce: str, timeout: Optional[datetime.timedelta]) -> bool:
+        cache_key = build_cache_key('one-time-use', nonce)
+        timeout_secs = timeout.total_seconds() if timeout is not None else None
+        return get_cache().add(cache_key, True, timeout=timeout_secs)
+
+
+def get_one_time_use_store() -> Optional[AbstractOneTimeUseStore]:
+    store_cls = registration_settings.VERIFICATION_ONE_TIME_USE_STORE_CLASS
+    if store_cls is None:
+        return None
+    return store_cls()
@@ -14,8 +14,13 @@ registration_settings = NestedSettings(
 
 
 def settings_changed_handler(*args, **kwargs):
+    from rest_registration.utils.users import (  # noqa: E501 pylint: disable=import-outside-toplevel
+        reset_user_field_schema,
+    )
+
     registration_settings.reset_user_settings()
     registration_settings.reset_attr_cache()
+    reset_user_field_schema()
 
 
 setting_changed.connect(settings_changed_handler)
@@ -57,6 +57,27 @@ USER_SETTINGS_FIELDS = [
             **Disable this setting only when you know what you're doing!**
             """)
     ),
+    Field(
+        'USER_OPTIMISTIC_UNIQUENESS_CHECK_ENABLED',
+        type_signature=bool,
+        default=False,
+        help=dedent("""\
+            By default, the uniqueness of the user fields is checked
+            by separate database queries before the user is created
+            (by ``DefaultRegisterUserSerializer``) or before the e-mail
+            is changed (by :ref:`register-email-view` and
+            :ref:`verify-email-view`); one query per unique field.
+
+            If enabled, these queries are skipped; the write is attempted
+            directly and the database unique constraint violation
+            (``IntegrityError``) is turned into the same validation error
+            as the one which would be raised by the query-based check.
+
+            Please note that the e-mail uniqueness is still checked upfront
+            when :ref:`register-email-verification-enabled-setting`
+            is enabled, as the result affects the sent notification.
+            """)
+    ),
     Field(
         'USER_HIDDEN_FIELDS',
         default=(
@@ -254,6 +275,51 @@ LOGIN_SETTINGS_FIELDS = [
             the returned user.
             """),
     ),
+    Field(
+        'LOGIN_SINGLE_QUERY_USER_LOOKUP_ENABLED',
+        type_signature=bool,
+        default=False,
+        help=dedent("""\
+            Used by the default :ref:`login-authenticator-setting` implementation.
+
+            If ``True``, the candidate user is found using one database query
+            combining all the login fields (listed in
+            :ref:`user-login-fields-setting`) with ``OR``, instead of querying
+            the login fields one by one. Only that single candidate is then
+            authenticated, so the password is hashed at most once per login
+            request.
+
+            If more than one user matches, the tie is broken in the following way:
+            the user matching the ``login`` value on the earliest field listed in
+            :ref:`user-login-fields-setting` wins, then the user matching
+            the explicitly given login field values (in the same order);
+            if there is still a tie, the user with the lowest primary key wins.
+            """),
+    ),
+    Field(
+        'LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED',
+        type_signature=bool,
+        default=False,
+        help=dedent("""\
+            Used by the default :ref:`login-authenticator-setting` implementation.
+
+            If ``True``, the password is checked directly on the already loaded
+            user (using ``user.check_password()`` and the backend's
+            ``user_can_authenticate()``), instead of calling
+            ``django.contrib.auth.authenticate()`` which would load the same user
+            again and try every backend listed in ``AUTHENTICATION_BACKENDS``.
+
+            The backend used for the check is the one which would be used
+            to log the user in, so if there are multiple
+            ``AUTHENTICATION_BACKENDS`` specified, you need to set
+            :ref:`login-default-session-authentication-backend-setting`.
+            That backend should check the passwords the same way Django's
+            ``ModelBackend`` does.
+
+            The ``user_login_failed`` signal is sent once when the login fails,
+            and the ``user_logged_in`` signal is sent as usual on success.
+            """),
+    ),
     Field('LOGIN_AUTHENTICATE_SESSION'),
     Field(
         'LOGIN_RETRIEVE_TOKEN',
@@ -321,6 +387,27 @@ LOGIN_SETTINGS_FIELDS = [
             and optionally revoking the token.
             The class should inherit from
             ``rest_registration.token_managers.AbstractTokenManager``.
+
+            You can use
+            ``rest_registration.auth_token_managers.CachedRestFrameworkAuthTokenManager``
+            to read the tokens through the cache specified by
+            :ref:`cache-alias-setting`, or
+            ``rest_registration.auth_token_managers.SignedAuthTokenManager``
+            to use signed tokens which are not stored in the database
+            (in that case, add
+            ``rest_registration.auth_token_managers.SignedTokenAuthentication``
+            to ``REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES']``,
+            ``rest_registration.contrib.auth_token_key_versions``
+            to ``INSTALLED_APPS`` and make sure the cache specified by
+            :ref:`cache-alias-setting` is shared between the processes).
+
+            If the users should have separate tokens for separate devices
+            (so logging out on one device does not revoke the tokens on other
+            devices), add ``rest_registration.contrib.device_auth_tokens``
+            to ``INSTALLED_APPS`` and use
+            ``rest_registration.contrib.device_auth_tokens.auth_token_managers.DeviceAuthTokenManager``
+            together with
+            ``rest_registration.contrib.device_auth_tokens.auth_token_managers.DeviceTokenAuthentication``.
             """)
     ),
     Field(
@@ -334,7 +421,117 @@ LOGIN_SETTINGS_FIELDS = [
 
             The value must be a dotted import path string or ``None``.
             """),
-    )
+    ),
+    Field(
+        'LOGIN_PASSWORD_HASH_UPGRADE_DEFERRED',
+        type_signature=bool,
+        default=False,
+        help=dedent("""\
+            When the password hasher parameters change (for instance,
+            the number of iterations is increased after Django upgrade),
+            the password hash of the user is upgraded (computed once again and
+            saved) when the user logs in.
+
+            If ``True``, the new hash is computed during the login password
+            check, but it is not saved synchronously. Instead, it is recorded
+            as pending (after the current transaction is committed) and saved
+            after the response is sent (on ``request_finished`` signal).
+            The raw password is not kept. The pending upgrades can also be
+            applied explicitly by calling
+            ``rest_registration.utils.passwords.apply_pending_password_hash_upgrades()``.
+
+            This setting works only when the password is checked by
+            Django REST Registration itself, which is the case when
+            :ref:`login-direct-credentials-check-enabled-setting` is ``True``.
+            """),
+    ),
+    Field(
+        'LOGIN_LAST_LOGIN_UPDATE_GRANULARITY',
+        default=None,
+        help=dedent("""\
+            By default, every successful login updates the ``last_login``
+            field of the user in the database.
+
+            If set to a ``datetime.timedelta`` value, the update is skipped
+            when the current ``last_login`` value of the user is more recent
+            than given time period (for instance,
+            ``datetime.timedelta(minutes=5)``).
+
+            This setting works only when ``rest_registration`` is listed
+            after ``django.contrib.auth`` in ``INSTALLED_APPS``, and affects
+            all logins which send the ``user_logged_in`` signal.
+            """),
+    ),
+    Field(
+        'LOGIN_LAST_LOGIN_UPDATE_FLUSH_INTERVAL',
+        default=None,
+        help=dedent("""\
+            If set to a ``datetime.timedelta`` value, the ``last_login``
+            updates are not written to the database immediately, but buffered
+            in the memory of the process and written using a single query
+            when at least given time period passed since the previous flush
+            (checked on each login and after each request is finished).
+            The remaining buffered updates are written when the process exits;
+            they can also be written explicitly by calling
+            ``rest_registration.utils.last_login.flush_last_login_updates()``.
+
+            The buffered updates are lost if the process is killed or crashes,
+            so use this setting only if losing some ``last_login`` updates
+            is acceptable.
+
+            Can be combined with :ref:`login-last-login-update-granularity-setting`.
+            The same restrictions regarding ``INSTALLED_APPS`` apply.
+            """),
+    ),
+    Field(
+        'LOGIN_SHIELD_ENABLED',
+        type_signature=bool,
+        default=False,
+        help=dedent("""\
+            If ``True``, the :ref:`login-view` counts the login failures
+            (signaled via ``user_login_failed``) per login value and per client
+            IP address (taken from ``REMOTE_ADDR``) in the cache defined by
+            :ref:`cache-alias-setting`.
+
+            When the number of failures within :ref:`login-shield-period-setting`
+            reaches :ref:`login-shield-max-failures-per-login-setting` or
+            :ref:`login-shield-max-failures-per-ip-setting`, the login attempt
+            is rejected with the standard "login invalid" error before
+            :ref:`login-authenticator-setting` is called, so no password
+            is hashed.
+
+            The number of rejected attempts can be obtained using
+            ``rest_registration.utils.login_shield.get_login_shield_stats()``.
+            """),
+    ),
+    Field(
+        'LOGIN_SHIELD_MAX_FAILURES_PER_LOGIN',
+        type_signature=Union[int, None],
+        default=10,
+        help=dedent("""\
+            Used when :ref:`login-shield-enabled-setting` is ``True``.
+            Number of login failures for given login value after which
+            the next login attempts are rejected. ``None`` disables the limit.
+            """),
+    ),
+    Field(
+        'LOGIN_SHIELD_MAX_FAILURES_PER_IP',
+        type_signature=Union[int, None],
+        default=100,
+        help=dedent("""\
+            Used when :ref:`login-shield-enabled-setting` is ``True``.
+            Number of login failures for given client IP address after which
+            the next login attempts are rejected. ``None`` disables the limit.
+            """),
+    ),
+    Field(
+        'LOGIN_SHIELD_PERIOD',
+        default=datetime.timedelta(minutes=15),
+        help=dedent("""\
+            Used when :ref:`login-shield-enabled-setting` is ``True``.
+            Specifies how long the login failures are remembered.
+            """),
+    ),
 ]
 RESET_PASSWORD_SETTINGS_FIELDS = [
     Field(
@@ -495,6 +692,58 @@ GLOBAL_VERIFICATION_SETTINGS_FIELDS = [
             to encode the signed values properly in the URL.
             """),
     ),
+    Field(
+        'VERIFICATION_COMPACT_TOKEN_ENABLED',
+        type_signature=bool,
+        default=False,
+        help=dedent("""\
+            If enabled, the default url builder will put the signed data
+            in a single ``token`` query parameter, containing the binary-packed
+            data and a truncated signature, instead of the separate
+            ``user_id``, ``timestamp``, ``signature`` (and ``email``)
+            parameters. This makes the verification links notably shorter,
+            which is useful when sending them via SMS.
+
+            The verification endpoints accept both formats regardless
+            of this setting, so the links sent before changing it stay valid.
+            """),
+    ),
+    Field(
+        'VERIFICATION_ONE_TIME_USE_STORE_CLASS',
+        default=None,
+        import_string=True,
+        help=dedent("""\
+            By default, :ref:`register-verification-one-time-use-setting`
+            and :ref:`reset-password-verification-one-time-use-setting`
+            are enforced by making the user state (the verification flag
+            or the password hash) a part of the signature salt,
+            which requires a database query before the signature
+            can be checked.
+
+            If this setting is set, the signature is checked without
+            accessing the database, and the used verification links are
+            recorded in given store instead (for the verification period).
+            The class should inherit from
+            ``rest_registration.one_time_use_stores.AbstractOneTimeUseStore``.
+
+            You can use
+            ``rest_registration.one_time_use_stores.CacheOneTimeUseStore``
+            to record the used links in the cache specified by
+            :ref:`cache-alias-setting`, or
+            ``rest_registration.contrib.verification_nonces.one_time_use_stores.DatabaseOneTimeUseStore``
+            to record them in a database table
+            (``rest_registration.contrib.verification_nonces`` needs to be
+            added to ``INSTALLED_APPS``).
+
+            The reset password links are not affected by this setting.
+            They always keep the password hash in the salt, so resetting
+            (or changing) the password invalidates all the reset password
+            links sent before, not only the used one.
+
+            Changing this setting invalidates the one-time-use
+            verification links sent before.
+            """),
+    ),
     Field(
         'VERIFICATION_TEMPLATE_CONTEXT_BUILDER',
         default='rest_registration.utils.verification.build_default_template_context',  # noqa: E501
@@ -623,6 +872,40 @@ MISC_SETTINGS_FIELDS = [
             defined by ``REST_FRAMEWORK['NON_FIELD_ERRORS_KEY']``.
             """),
     ),
+    Field(
+        'READ_REPLICA_DB_ALIAS',
+        type_signature=Union[str, None],
+        default=None,
+        help=dedent("""\
+            The alias of the database (one of the ``DATABASES`` keys)
+            to which the user lookups which do not need the most recent data
+            are sent:
+
+            * resolving the login fields
+              (when the password is checked against the primary database),
+            * finding the user for :ref:`send-reset-password-link-view`,
+            * checking whether the e-mail is already used.
+
+            The writes and the lookups which could follow a recent write
+            (e.g. the verification of the registration) always use
+            the primary database. The users not found in the replica
+            are looked up again in the primary database, so recently
+            registered users can be found in spite of the replication lag.
+            Only the primary keys and field values are read from the replica;
+            the users themselves are always loaded from the primary database.
+
+            If not set, the primary database is used for all lookups.
+            """),
+    ),
+    Field(
+        'CACHE_ALIAS',
+        type_signature=str,
+        default='default',
+        help=dedent("""\
+            The alias of the Django cache (one of the ``CACHES`` keys)
+            used by the cache-backed features of Django REST Registration.
+            """),
+    ),
 ]
 
 PERMISSIONS_SETTINGS_FIELDS = [
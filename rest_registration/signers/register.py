@@ -1,11 +1,16 @@
+from rest_registration.one_time_use_stores import get_one_time_use_store
 from rest_registration.settings import registration_settings
 from rest_registration.utils.signers import URLParamsSigner
-from rest_registration.utils.users import get_user_by_verification_id, get_user_setting
+from rest_registration.utils.users import (
+    get_user_setting,
+    get_user_values_by_verification_id,
+)
 
 
 class RegisterSigner(URLParamsSigner):
     SALT_BASE = 'register'
     USE_TIMESTAMP = True
+    TOKEN_FIELDS = ('user_id',)
 
     def get_base_url(self):
         return registration_settings.REGISTER_VERIFICATION_URL
@@ -13,16 +18,26 @@ class RegisterSigner(URLParamsSigner):
     def get_valid_period(self):
         return registration_settings.REGISTER_VERIFICATION_PERIOD
 
+    def is_one_time_use(self):
+        return registration_settings.REGISTER_VERIFICATION_ONE_TIME_USE
+
+    def is_salt_stateless(self):
+        return not self.is_one_time_use() or get_one_time_use_store() is not None
+
     def _calculate_salt(self, data):
-        if registration_settings.REGISTER_VERIFICATION_ONE_TIME_USE:
-            user = get_user_by_verification_id(data['user_id'], require_verified=False)
+        if not self.is_salt_stateless():
+            verification_flag_field = get_user_setting('VERIFICATION_FLAG_FIELD')
+            # Within the user identity map (used by the verification
+            # flow), this loads the whole user, which is reused
+            # for the verification.
+            user_values = get_user_values_by_verification_id(
+                data['user_id'], [verification_flag_field], require_verified=False)
             # Use current user verification flag as a part of the salt.
             # If the verification flag gets changed, then assume that
             # the change was caused by previous verification and the signature
             # is not valid anymore because changed user verification flag
             # implies changed salt used when verifying the input data.
-            verification_flag_field = get_user_setting('VERIFICATION_FLAG_FIELD')
-            verification_flag = getattr(user, verification_flag_field)
+            verification_flag = user_values[verification_flag_field]
             salt = f"{self.SALT_BASE}:{verification_flag}"
         else:
             salt = self.SALT_BASE
@@ -5,6 +5,7 @@ from rest_registration.utils.signers import URLParamsSigner
 class RegisterEmailSigner(URLParamsSigner):
     SALT_BASE = 'register-email'
     USE_TIMESTAMP = True
+    TOKEN_FIELDS = ('user_id', 'email')
 
     def get_base_url(self):
         return registration_settings.REGISTER_EMAIL_VERIFICATION_URL
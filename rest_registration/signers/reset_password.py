@@ -1,11 +1,12 @@
 from rest_registration.settings import registration_settings
 from rest_registration.utils.signers import URLParamsSigner
-from rest_registration.utils.users import get_user_by_verification_id
+from rest_registration.utils.users import get_user_values_by_verification_id
 
 
 class ResetPasswordSigner(URLParamsSigner):
     SALT_BASE = 'reset-password'
     USE_TIMESTAMP = True
+    TOKEN_FIELDS = ('user_id',)
 
     def get_base_url(self):
         return registration_settings.RESET_PASSWORD_VERIFICATION_URL
@@ -13,10 +14,23 @@ class ResetPasswordSigner(URLParamsSigner):
     def get_valid_period(self):
         return registration_settings.RESET_PASSWORD_VERIFICATION_PERIOD
 
+    def is_one_time_use(self):
+        return registration_settings.RESET_PASSWORD_VERIFICATION_ONE_TIME_USE
+
+    def is_salt_stateless(self):
+        # The one-time use is always enforced by the salt (regardless
+        # of the one-time-use store), so resetting or changing the password
+        # invalidates all the reset password links sent before.
+        return not self.is_one_time_use()
+
     def _calculate_salt(self, data):
-        if registration_settings.RESET_PASSWORD_VERIFICATION_ONE_TIME_USE:
-            user = get_user_by_verification_id(data['user_id'], require_verified=False)
-            user_password_hash = user.password
+        if not self.is_salt_stateless():
+            # Within the user identity map (used by the reset password
+            # flow), this loads the whole user, which is reused for
+            # the password update.
+            user_values = get_user_values_by_verification_id(
+                data['user_id'], ['password'], require_verified=False)
+            user_password_hash = user_values['password']
             # Use current user password hash as a part of the salt.
             # If the password gets changed, then assume that the change
             # was caused by previous password reset and the signature
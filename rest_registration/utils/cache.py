@@ -0,0 +1,31 @@
+import hashlib
+from typing import Any
+
+from django.core.cache import BaseCache, caches
+
+from rest_registration.settings import registration_settings
+
+CACHE_KEY_PREFIX = 'rest_registration'
+
+
+def get_cache() -> BaseCache:
+    return caches[registration_settings.CACHE_ALIAS]
+
+
+def build_cache_key(*parts: Any) -> str:
+    """
+    >>> build_cache_key('login-shield', 'ip', '127.0.0.1')
+    'rest_registration:login-shield:ip:127.0.0.1'
+    """
+    return ':'.join([CACHE_KEY_PREFIX, *(str(p) for p in parts)])
+
+
+def hash_cache_key_part(value: Any) -> str:
+    """
+    Make arbitrary (possibly user-provided) value safe to be used
+    as a part of cache key.
+
+    >>> hash_cache_key_part('john.doe@example.com')
+    '836f82db99121b3481011f16b49dfa5fbc714a0d1b1b9f784a1ebbbf5b39577f'
+    """
+    return hashlib.sha256(str(value).encode('utf-8')).hexdigest()
@@ -0,0 +1,135 @@
+import atexit
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from django.contrib.auth.signals import user_logged_in
+from django.core.signals import request_finished
+from django.utils import timezone
+
+from rest_registration.settings import registration_settings
+
+if TYPE_CHECKING:
+    import datetime
+
+    from django.contrib.auth.base_user import AbstractBaseUser
+
+DJANGO_UPDATE_LAST_LOGIN_DISPATCH_UID = 'update_last_login'
+
+_buffered_last_logins: Dict[object, 'datetime.datetime'] = {}
+_buffered_last_logins_lock = threading.Lock()
+_last_flush_monotonic_time = time.monotonic()
+
+
+def update_last_login_handler(
+        sender, user: 'AbstractBaseUser', **kwargs) -> None:
+    """
+    Replacement for the Django ``update_last_login`` signal receiver.
+    Behaves exactly the same way unless
+    :ref:`login-last-login-update-granularity-setting` or
+    :ref:`login-last-login-update-flush-interval-setting` is set.
+    """
+    granularity = registration_settings.LOGIN_LAST_LOGIN_UPDATE_GRANULARITY
+    flush_interval = registration_settings.LOGIN_LAST_LOGIN_UPDATE_FLUSH_INTERVAL
+    if granularity is None and flush_interval is None:
+        update_last_login(sender, user, **kwargs)
+        return
+
+    now = timezone.now()
+    last_login = _get_last_login(user)
+    if (
+        granularity is not None
+        and last_login is not None
+        and now - last_login < granularity
+    ):
+        return
+
+    if flush_interval is None:
+        update_last_login(sender, user, **kwargs)
+        return
+
+    user.last_login = now
+    with _buffered_last_logins_lock:
+        _buffered_last_logins[user.pk] = now
+    _flush_last_login_updates_if_due()
+
+
+def flush_last_login_updates() -> int:
+    """
+    Write the buffered ``last_login`` updates to the database
+    using a single bulk query.
+
+    Return the number of flushed updates.
+    """
+    global _last_flush_monotonic_time  # pylint: disable=global-statement
+    with _buffered_last_logins_lock:
+        last_logins = dict(_buffered_last_logins)
+        _buffered_last_logins.clear()
+        _last_flush_monotonic_time = time.monotonic()
+    if not last_logins:
+        return 0
+    user_class = get_user_model()
+    users = [
+        user_class(pk=pk, last_login=last_login)
+        for pk, last_login in last_logins.items()
+    ]
+    user_class.objects.bulk_update(users, ['last_login'])
+    return len(users)
+
+
+def has_buffered_last_login_updates() -> bool:
+    with _buffered_last_logins_lock:
+        return bool(_buffered_last_logins)
+
+
+def replace_django_update_last_login_receiver() -> bool:
+    """
+    Replace the ``update_last_login`` receiver connected by
+    ``django.contrib.auth`` with :func:`update_last_login_handler`.
+
+    Return ``True`` if the Django receiver was connected and got replaced.
+    """
+    replaced = user_logged_in.disconnect(
+        dispatch_uid=DJANGO_UPDATE_LAST_LOGIN_DISPATCH_UID)
+    if replaced:
+        user_logged_in.connect(
+            update_last_login_handler,
+            dispatch_uid=DJANGO_UPDATE_LAST_LOGIN_DISPATCH_UID,
+        )
+    return replaced
+
+
+def _get_last_login(user: 'AbstractBaseUser') -> Optional['datetime.datetime']:
+    with _buffered_last_logins_lock:
+        buffered_last_login = _buffered_last_logins.get(user.pk)
+    if buffered_last_login is not None:
+        return buffered_last_login
+    return user.last_login
+
+
+def request_finished_handler(sender, **kwargs) -> None:
+    _flush_last_login_updates_if_due()
+
+
+def _flush_last_login_updates_if_due() -> None:
+    flush_interval = registration_settings.LOGIN_LAST_LOGIN_UPDATE_FLUSH_INTERVAL
+    if flush_interval is None or not has_buffered_last_login_updates():
+        return
+    elapsed = time.monotonic() - _last_flush_monotonic_time
+    if elapsed >= flush_interval.total_seconds():
+        flush_last_login_updates()
+
+
+def _flush_at_exit() -> None:
+    if has_buffered_last_login_updates():
+        flush_last_login_updates()
+
+
+atexit.register(_flush_at_exit)
+
+request_finished.connect(
+    request_finished_handler,
+    dispatch_uid='rest_registration_last_login_request_finished_handler',
+)
@@ -0,0 +1,165 @@
+import contextlib
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from django.contrib.auth.signals import user_login_failed
+
+from rest_registration.exceptions import LoginInvalid
+from rest_registration.settings import registration_settings
+from rest_registration.utils.cache import (
+    build_cache_key,
+    get_cache,
+    hash_cache_key_part,
+)
+from rest_registration.utils.users import get_user_login_field_names
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+BLOCKED_ATTEMPTS_STAT = 'blocked_attempts'
+RECORDED_FAILURES_STAT = 'recorded_failures'
+
+
+class _LoginAttempt:
+
+    def __init__(self, login_keys: List[str], ip_key: Optional[str]) -> None:
+        super().__init__()
+        self.login_keys = login_keys
+        self.ip_key = ip_key
+        self.failure_recorded = False
+
+    @property
+    def keys(self) -> List[str]:
+        if self.ip_key is None:
+            return self.login_keys
+        return [*self.login_keys, self.ip_key]
+
+
+_current_login_attempt: ContextVar[Optional[_LoginAttempt]] = ContextVar(
+    'rest_registration_current_login_attempt', default=None)
+
+
+@contextlib.contextmanager
+def shield_login_attempt(
+        request: 'HttpRequest',
+        data: Dict[str, Any]) -> Iterator[None]:
+    """
+    Reject the login attempt with ``LoginInvalid`` (before any password
+    is hashed) if there were too many recent login failures for any
+    of the login values provided in ``data`` or for the client IP address.
+
+    Failures are recorded while the context is active, using the
+    ``user_login_failed`` signal. On success, the failure counters
+    for the provided login values are cleared.
+    """
+    if not registration_settings.LOGIN_SHIELD_ENABLED:
+        yield
+        return
+
+    attempt = _LoginAttempt(
+        login_keys=_get_login_keys(data),
+        ip_key=_get_ip_key(request),
+    )
+    if _is_blocked(attempt):
+        _increment_stat(BLOCKED_ATTEMPTS_STAT)
+        raise LoginInvalid()
+
+    token = _current_login_attempt.set(attempt)
+    try:
+        yield
+    finally:
+        _current_login_attempt.reset(token)
+
+    if not attempt.failure_recorded:
+        get_cache().delete_many(attempt.login_keys)
+
+
+def get_login_shield_stats() -> Dict[str, int]:
+    """
+    Return the counters of the login shield. The ``blocked_attempts``
+    counter tells how many login attempts were rejected before
+    the authentication (and the password hashing) took place.
+    """
+    cache = get_cache()
+    stat_names = [BLOCKED_ATTEMPTS_STAT, RECORDED_FAILURES_STAT]
+    stat_keys = {name: _build_stat_key(name) for name in stat_names}
+    values = cache.get_many(stat_keys.values())
+    return {name: values.get(key, 0) for name, key in stat_keys.items()}
+
+
+def reset_login_shield_stats() -> None:
+    get_cache().delete_many([
+        _build_stat_key(BLOCKED_ATTEMPTS_STAT),
+        _build_stat_key(RECORDED_FAILURES_STAT),
+    ])
+
+
+def login_failed_handler(sender, credentials=None, request=None, **kwargs) -> None:
+    attempt = _current_login_attempt.get()
+    # Multiple failures can be signaled during single login attempt
+    # (for instance, when multiple login fields are tried),
+    # but they should be counted only once.
+    if attempt is None or attempt.failure_recorded:
+        return
+    attempt.failure_recorded = True
+    timeout = registration_settings.LOGIN_SHIELD_PERIOD.total_seconds()
+    for key in attempt.keys:
+        _increment(key, timeout=timeout)
+    _increment_stat(RECORDED_FAILURES_STAT)
+
+
+def _is_blocked(attempt: _LoginAttempt) -> bool:
+    failures = get_cache().get_many(attempt.keys)
+    max_failures_per_login = registration_settings.LOGIN_SHIELD_MAX_FAILURES_PER_LOGIN
+    max_failures_per_ip = registration_settings.LOGIN_SHIELD_MAX_FAILURES_PER_IP
+    if max_failures_per_login is not None and any(
+            failures.get(key, 0) >= max_failures_per_login
+            for key in attempt.login_keys):
+        return True
+    if max_failures_per_ip is not None and attempt.ip_key is not None:
+        return failures.get(attempt.ip_key, 0) >= max_failures_per_ip
+    return False
+
+
+def _get_login_keys(data: Dict[str, Any]) -> List[str]:
+    field_names = ['login', *get_user_login_field_names()]
+    values = {
+        str(data[name]).lower()
+        for name in field_names
+        if data.get(name) is not None
+    }
+    return sorted(
+        build_cache_key('login-shield', 'login', hash_cache_key_part(value))
+        for value in values
+    )
+
+
+def _get_ip_key(request: 'HttpRequest') -> Optional[str]:
+    ip_address = request.META.get('REMOTE_ADDR')
+    if not ip_address:
+        return None
+    return build_cache_key('login-shield', 'ip', hash_cache_key_part(ip_address))
+
+
+def _build_stat_key(name: str) -> str:
+    return build_cache_key('login-shield', 'stats', name)
+
+
+def _increment_stat(name: str) -> None:
+    _increment(_build_stat_key(name), timeout=None)
+
+
+def _increment(key: str, timeout: Optional[float]) -> None:
+    cache = get_cache()
+    cache.add(key, 0, timeout=timeout)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key expired in the meantime.
+        cache.add(key, 1, timeout=timeout)
+
+
+user_login_failed.connect(
+    login_failed_handler,
+    dispatch_uid='rest_registration_login_shield_login_failed_handler',
+)
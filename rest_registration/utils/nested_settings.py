@@ -1,9 +1,37 @@
-from typing import Any, Dict, Iterable, Optional
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Type
 
 from django.conf import settings as root_settings
 from rest_framework.settings import perform_import
 
 
+class CompiledSettings:
+    """
+    Immutable snapshot of the resolved settings values
+    (with the import strings already imported).
+
+    The subclasses define the slots for the setting names. If the slot is
+    not set, the value could not be resolved when the snapshot was compiled.
+    """
+    __slots__ = ('_default_attrs',)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def is_default(self, attr: str) -> bool:
+        return attr in self._default_attrs
+
+
+def _build_compiled_settings_class(
+        setting_names: Iterable[str]) -> Type[CompiledSettings]:
+    return type('CompiledSettings', (CompiledSettings,), {
+        '__slots__': tuple(setting_names),
+    })
+
+
 class NestedSettings:
     def __init__(
             self,
@@ -16,6 +44,10 @@ class NestedSettings:
         self.defaults = defaults
         self.import_strings = import_strings
         self.root_setting_name = root_setting_name
+        self._compiled_class = _build_compiled_settings_class(defaults.keys())
+        self._compiled: Optional[CompiledSettings] = None
+        self._compile_lock = threading.RLock()
+        self._compiling = False
 
     @property
     def user_settings(self) -> Dict[str, Any]:
@@ -32,19 +64,79 @@ class NestedSettings:
             del self._user_settings
 
     def reset_attr_cache(self) -> None:
-        for key in self.defaults.keys():
-            if hasattr(self, key):
-                delattr(self, key)
+        """
+        Replace the compiled snapshot with a new one (if the settings
+        were already compiled), so the readers never observe
+        a partially populated snapshot.
+        """
+        with self._compile_lock:
+            if self._compiled is not None:
+                self._compiled = self._compile()
+
+    def compile(self) -> CompiledSettings:
+        """
+        Resolve all the settings (including the import strings)
+        eagerly and store them in an immutable snapshot.
+        """
+        with self._compile_lock:
+            self._compiled = self._compile()
+            return self._compiled
 
     def is_default(self, attr: str) -> bool:
-        if attr not in self.user_settings:
-            return True
-        return self.user_settings[attr] == self.defaults[attr]
+        compiled = self._get_compiled()
+        if compiled is None:
+            return self._is_default(attr)
+        return compiled.is_default(attr)
 
     def __getattr__(self, attr: str) -> Any:
+        if attr.startswith('_'):
+            raise AttributeError(attr)
         if attr not in self.defaults.keys():
             raise AttributeError(f"Invalid {self.root_setting_name} setting: '{attr}'")
 
+        compiled = self._get_compiled()
+        if compiled is None:
+            return self._resolve(attr)
+        try:
+            return getattr(compiled, attr)
+        except AttributeError:
+            # The value could not be resolved during the compilation;
+            # resolve it again to raise the appropriate error.
+            return self._resolve(attr)
+
+    def _get_compiled(self) -> Optional[CompiledSettings]:
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled
+        with self._compile_lock:
+            if self._compiling:
+                # The settings are accessed during the compilation
+                # (for instance, by a module imported using an import string).
+                return None
+            if self._compiled is None:
+                self._compiled = self._compile()
+            return self._compiled
+
+    def _compile(self) -> CompiledSettings:
+        self._compiling = True
+        try:
+            compiled = object.__new__(self._compiled_class)
+            for attr in self.defaults.keys():
+                try:
+                    val = self._resolve(attr)
+                except ImportError:
+                    # Leave the slot unset, so the import is retried
+                    # (and the error raised) when the setting is accessed.
+                    continue
+                object.__setattr__(compiled, attr, val)
+            default_attrs: FrozenSet[str] = frozenset(
+                attr for attr in self.defaults.keys() if self._is_default(attr))
+            object.__setattr__(compiled, '_default_attrs', default_attrs)
+        finally:
+            self._compiling = False
+        return compiled
+
+    def _resolve(self, attr: str) -> Any:
         try:
             # Check if present in user settings
             val = self.user_settings[attr]
@@ -56,6 +148,9 @@ class NestedSettings:
         if attr in self.import_strings:
             val = perform_import(val, attr)
 
-        # Cache the result
-        setattr(self, attr, val)
         return val
+
+    def _is_default(self, attr: str) -> bool:
+        if attr not in self.user_settings:
+            return True
+        return self.user_settings[attr] == self.defaults[attr]
@@ -0,0 +1,92 @@
+import threading
+from typing import TYPE_CHECKING, List, NamedTuple
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.signals import request_finished
+from django.db import transaction
+
+from rest_registration.settings import registration_settings
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+
+
+class PendingPasswordHashUpgrade(NamedTuple):
+    user_pk: object
+    old_password_hash: str
+    new_password_hash: str
+
+
+_pending_upgrades: List[PendingPasswordHashUpgrade] = []
+_pending_upgrades_lock = threading.Lock()
+
+
+def check_user_password(user: 'AbstractBaseUser', raw_password: str) -> bool:
+    """
+    Same as ``user.check_password()``, but if
+    :ref:`login-password-hash-upgrade-deferred-setting` is enabled, the password
+    hash upgrade (when the hasher parameters have changed) is not saved
+    synchronously but recorded as pending instead. Only the new hash is
+    recorded; the raw password is never kept beyond this call.
+    """
+    if not registration_settings.LOGIN_PASSWORD_HASH_UPGRADE_DEFERRED:
+        return user.check_password(raw_password)
+
+    old_password_hash = user.password
+
+    def setter(raw_password: str) -> None:
+        new_password_hash = make_password(raw_password)
+        # The session auth hash (and the tokens derived from it) need
+        # to match the hash which is going to be stored.
+        user.password = new_password_hash
+        upgrade = PendingPasswordHashUpgrade(
+            user_pk=user.pk,
+            old_password_hash=old_password_hash,
+            new_password_hash=new_password_hash,
+        )
+        # Record the upgrade only when the current transaction succeeds.
+        transaction.on_commit(lambda: _add_pending_upgrade(upgrade))
+
+    return check_password(raw_password, old_password_hash, setter)
+
+
+def apply_pending_password_hash_upgrades() -> int:
+    """
+    Store the password hashes recorded as pending. The hash is updated
+    only if it was not changed in the meantime.
+
+    Return the number of updated users.
+    """
+    with _pending_upgrades_lock:
+        upgrades = _pending_upgrades[:]
+        _pending_upgrades.clear()
+    user_class = get_user_model()
+    num_updated = 0
+    for upgrade in upgrades:
+        num_updated += user_class.objects.filter(
+            pk=upgrade.user_pk,
+            password=upgrade.old_password_hash,
+        ).update(password=upgrade.new_password_hash)
+    return num_updated
+
+
+def has_pending_password_hash_upgrades() -> bool:
+    with _pending_upgrades_lock:
+        return bool(_pending_upgrades)
+
+
+def _add_pending_upgrade(upgrade: PendingPasswordHashUpgrade) -> None:
+    with _pending_upgrades_lock:
+        _pending_upgrades.append(upgrade)
+
+
+def request_finished_handler(sender, **kwargs) -> None:
+    if has_pending_password_hash_upgrades():
+        apply_pending_password_hash_upgrades()
+
+
+request_finished.connect(
+    request_finished_handler,
+    dispatch_uid='rest_registration_password_hash_upgrades_request_finished_handler',
+)
@@ -1,9 +1,20 @@
 import datetime
+import functools
+import hashlib
+import hmac
 import pickle
+import struct
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from django.core.signing import BadSignature, SignatureExpired, Signer
+from django.conf import settings
+from django.core.signing import (
+    BadSignature,
+    SignatureExpired,
+    Signer,
+    b64_decode,
+    b64_encode,
+)
 from django.utils.crypto import constant_time_compare
 from rest_framework.request import Request
 
@@ -19,10 +30,62 @@ def get_current_timestamp() -> int:
 
 
 def get_dict_repr(data: Dict[Any, Any]) -> bytes:
+    """
+    Legacy representation of the signed data, used only to verify
+    the signatures created before the canonical representation
+    was introduced.
+    """
     data_items = sorted((str(k), str(v)) for k, v in data.items())
     return pickle.dumps(data_items, PICKLE_REPR_PROTOCOL)
 
 
+def get_dict_canonical_repr(data: Dict[Any, Any]) -> bytes:
+    """
+    Encode the data items (converted to strings) sorted by key,
+    each string prefixed by its length.
+
+    >>> get_dict_canonical_repr({'user_id': 1, 'timestamp': 1600000000})
+    b'9:timestamp10:16000000007:user_id1:1'
+    """
+    data_items = sorted([(str(k), str(v)) for k, v in data.items()])
+    return ''.join([
+        f"{len(k)}:{k}{len(v)}:{v}" for k, v in data_items
+    ]).encode('utf-8')
+
+
+def _derive_hmac_key(key_salt: str, secret: str, algorithm: str) -> bytes:
+    # The same way as django.utils.crypto.salted_hmac() does.
+    hasher = getattr(hashlib, algorithm)
+    return hasher(key_salt.encode('utf-8') + secret.encode('utf-8')).digest()
+
+
+# Only the keys for the shared (stateless) salts are cached; the per-user
+# salts (containing e.g. the password hash) would evict them
+# and keep the keys derived from the user state in the memory.
+_derive_cached_hmac_key = functools.lru_cache(maxsize=32)(_derive_hmac_key)
+
+
+class SigningEngine:
+    """
+    Produces the same signatures as ``django.core.signing.Signer.signature()``
+    with the ``sha256`` algorithm. If ``cache_key`` is set, the HMAC key
+    derived from the salt and the secret key is computed only once per salt.
+    """
+    ALGORITHM = 'sha256'
+
+    def __init__(self, salt: str, cache_key: bool = True) -> None:
+        derive_hmac_key = _derive_cached_hmac_key if cache_key else _derive_hmac_key
+        self._key = derive_hmac_key(
+            f"{salt}signer", settings.SECRET_KEY, self.ALGORITHM)
+        self._digestmod = getattr(hashlib, self.ALGORITHM)
+
+    def digest(self, value: bytes) -> bytes:
+        return hmac.new(self._key, value, self._digestmod).digest()
+
+    def signature(self, value: bytes) -> str:
+        return b64_encode(self.digest(value)).decode()
+
+
 class DataSigner:
     SIGNATURE_FIELD = 'signature'
     TIMESTAMP_FIELD = 'timestamp'
@@ -35,14 +98,39 @@ class DataSigner:
             data = data.copy()
             data[self.TIMESTAMP_FIELD] = get_current_timestamp()
         self._data = data
-        self._salt = self._calculate_salt(data)
-        self._signer = Signer(salt=self._salt)
+        self._salt: Optional[str] = None
+        self._signing_engine_instance: Optional[SigningEngine] = None
+
+    def _get_salt(self) -> str:
+        # The salt may require a database query, so it is calculated
+        # only when the signature is really needed.
+        if self._salt is None:
+            self._salt = self._calculate_salt(self._data)
+        return self._salt
+
+    @property
+    def _signing_engine(self) -> SigningEngine:
+        if self._signing_engine_instance is None:
+            salt = self._get_salt()
+            self._signing_engine_instance = SigningEngine(
+                salt, cache_key=salt == self.SALT_BASE)
+        return self._signing_engine_instance
 
     def _calculate_signature(self, data: SignerData) -> str:
+        return self._signing_engine.signature(
+            get_dict_canonical_repr(self._get_unsigned_data(data)))
+
+    def _calculate_legacy_signature(self, data: SignerData) -> str:
+        # The previous versions used Django's signer, which algorithm depends
+        # on the Django version (and DEFAULT_HASHING_ALGORITHM setting).
+        return Signer(salt=self._get_salt()).signature(
+            get_dict_repr(self._get_unsigned_data(data)))
+
+    def _get_unsigned_data(self, data: SignerData) -> SignerData:
         if self.SIGNATURE_FIELD in data:
             data = data.copy()
             del data[self.SIGNATURE_FIELD]
-        return self._signer.signature(get_dict_repr(data))
+        return data
 
     def calculate_signature(self) -> str:
         return self._calculate_signature(self._data)
@@ -55,18 +143,69 @@ class DataSigner:
     def get_valid_period(self) -> Optional[datetime.timedelta]:
         return self.VALID_PERIOD
 
+    def get_expiration_timestamp(self) -> Optional[int]:
+        valid_period = self.get_valid_period()
+        if not self.USE_TIMESTAMP or valid_period is None:
+            return None
+        timestamp = int(self._data[self.TIMESTAMP_FIELD])
+        return timestamp + int(valid_period.total_seconds())
+
+    def is_one_time_use(self) -> bool:
+        return False
+
+    def get_nonce(self) -> str:
+        """
+        Return the identifier of the signed data, independent of the signature
+        (and its format), used to record the data as used.
+        """
+        value = get_dict_canonical_repr(self._get_unsigned_data(self._data))
+        return hashlib.sha256(
+            f"{self.SALT_BASE}:".encode('utf-8') + value).hexdigest()
+
+    def is_salt_stateless(self) -> bool:
+        """
+        Return ``True`` if the salt can be calculated without
+        accessing the database.
+        """
+        return True
+
     def _calculate_salt(self, data: Dict[Any, Any]) -> str:
         return self.SALT_BASE
 
     def verify(self) -> None:
+        """
+        Verify the data in stages ordered by their cost, so the malformed,
+        expired or forged data are rejected before anything else is done.
+        The signature is checked last, as calculating the salt may require
+        a database query.
+        """
+        self.verify_format()
+        self.verify_timestamp()
+        self.verify_signature()
+
+    def verify_stateless(self) -> None:
+        """
+        Run the verification stages which do not require database access.
+        The signature is not checked if calculating the salt needs
+        the database.
+        """
+        self.verify_format()
+        self.verify_timestamp()
+        if self.is_salt_stateless():
+            self.verify_signature()
+
+    def verify_format(self) -> None:
         data = self._data
-        signature = data.get(self.SIGNATURE_FIELD, None)
-        if signature is None:
-            raise BadSignature()
-        expected_signature = self.calculate_signature()
-        if not constant_time_compare(signature, expected_signature):
+        if not isinstance(data.get(self.SIGNATURE_FIELD, None), str):
             raise BadSignature()
+        if self.USE_TIMESTAMP:
+            try:
+                int(data[self.TIMESTAMP_FIELD])
+            except (KeyError, TypeError, ValueError):
+                raise BadSignature() from None
 
+    def verify_timestamp(self) -> None:
+        data = self._data
         valid_period = self.get_valid_period()
 
         if self.USE_TIMESTAMP and valid_period is not None:
@@ -77,9 +216,28 @@ class DataSigner:
             if current_timestamp - timestamp > valid_period_secs:
                 raise SignatureExpired()
 
+    def verify_signature(self) -> None:
+        data = self._data
+        signature = data[self.SIGNATURE_FIELD]
+        expected_signature = self.calculate_signature()
+        if not constant_time_compare(signature, expected_signature):
+            # Accept the signatures created by the previous versions.
+            expected_signature = self._calculate_legacy_signature(data)
+            if not constant_time_compare(signature, expected_signature):
+                raise BadSignature()
+
 
 class URLParamsSigner(DataSigner):
     BASE_URL = None
+    TOKEN_PARAM = 'token'
+    # The data fields (besides the timestamp) packed in the token, in order.
+    TOKEN_FIELDS: Tuple[str, ...] = ()
+    TOKEN_VERSION = 1
+    TOKEN_MAC_SIZE = 16
+    # Not a part of the URL-safe base64 alphabet, so it cannot clash
+    # with the regular signatures.
+    COMPACT_SIGNATURE_PREFIX = '.'
+    _TOKEN_HEADER = struct.Struct('>BI')
 
     def get_base_url(self) -> Optional[str]:
         return self.BASE_URL
@@ -97,3 +255,101 @@ class URLParamsSigner(DataSigner):
     def get_url(self) -> str:
         url_builder = registration_settings.VERIFICATION_URL_BUILDER
         return url_builder(self)
+
+    def supports_token(self) -> bool:
+        try:
+            self._get_token_payload(self._data)
+        except ValueError:
+            return False
+        return True
+
+    def get_signed_token(self) -> str:
+        """
+        Return the signed data as single URL-safe token, containing
+        the binary-packed data followed by the truncated MAC.
+        """
+        payload = self._get_token_payload(self._data)
+        return b64_encode(payload + self._calculate_token_mac(payload)).decode()
+
+    @classmethod
+    def parse_token(cls, token: str) -> SignerData:
+        """
+        Unpack the token created by ``get_signed_token()`` into the signed data.
+        The MAC is carried in the signature field and checked by ``verify()``.
+        """
+        try:
+            raw = b64_decode(token.encode('ascii'))
+        except ValueError:
+            raise BadSignature() from None
+        # Reject the non-canonical encodings (e.g. with altered unused bits
+        # of the last character), so each token has exactly one valid form.
+        if b64_encode(raw).decode() != token:
+            raise BadSignature()
+        if len(raw) <= cls.TOKEN_MAC_SIZE:
+            raise BadSignature()
+        payload, mac = raw[:-cls.TOKEN_MAC_SIZE], raw[-cls.TOKEN_MAC_SIZE:]
+        data = cls._unpack_token_payload(payload)
+        data[cls.SIGNATURE_FIELD] = (
+            cls.COMPACT_SIGNATURE_PREFIX + b64_encode(mac).decode())
+        return data
+
+    def verify_signature(self) -> None:
+        signature = self._data[self.SIGNATURE_FIELD]
+        if not signature.startswith(self.COMPACT_SIGNATURE_PREFIX):
+            super().verify_signature()
+            return
+        try:
+            payload = self._get_token_payload(self._data)
+        except ValueError:
+            raise BadSignature() from None
+        expected_signature = self.COMPACT_SIGNATURE_PREFIX + b64_encode(
+            self._calculate_token_mac(payload)).decode()
+        if not constant_time_compare(signature, expected_signature):
+            raise BadSignature()
+
+    def _calculate_token_mac(self, payload: bytes) -> bytes:
+        return self._signing_engine.digest(payload)[:self.TOKEN_MAC_SIZE]
+
+    def _get_token_payload(self, data: SignerData) -> bytes:
+        unsigned_data = self._get_unsigned_data(data)
+        if not self.USE_TIMESTAMP or not self.TOKEN_FIELDS:
+            raise ValueError("The signer does not support tokens")
+        if set(unsigned_data) != {self.TIMESTAMP_FIELD, *self.TOKEN_FIELDS}:
+            raise ValueError("The data fields cannot be packed in the token")
+        timestamp = int(unsigned_data[self.TIMESTAMP_FIELD])
+        if not 0 <= timestamp <= 0xFFFFFFFF:
+            raise ValueError("The timestamp cannot be packed in the token")
+        chunks = [self._TOKEN_HEADER.pack(self.TOKEN_VERSION, timestamp)]
+        for field_name in self.TOKEN_FIELDS:
+            value = str(unsigned_data[field_name]).encode('utf-8')
+            if len(value) > 0xFF:
+                raise ValueError(f"The {field_name} value is too long")
+            chunks.append(bytes([len(value)]))
+            chunks.append(value)
+        return b''.join(chunks)
+
+    @classmethod
+    def _unpack_token_payload(cls, payload: bytes) -> SignerData:
+        header_size = cls._TOKEN_HEADER.size
+        if len(payload) < header_size:
+            raise BadSignature()
+        version, timestamp = cls._TOKEN_HEADER.unpack_from(payload)
+        if version != cls.TOKEN_VERSION:
+            raise BadSignature()
+        data: SignerData = {cls.TIMESTAMP_FIELD: timestamp}
+        offset = header_size
+        for field_name in cls.TOKEN_FIELDS:
+            if offset >= len(payload):
+                raise BadSignature()
+            size = payload[offset]
+            value = payload[offset + 1:offset + 1 + size]
+            if len(value) != size:
+                raise BadSignature()
+            try:
+                data[field_name] = value.decode('utf-8')
+            except UnicodeDecodeError:
+                raise BadSignature() from None
+            offset += 1 + size
+        if offset != len(payload):
+            raise BadSignature()
+        return data
@@ -1,10 +1,19 @@
+import contextlib
+import itertools
+from contextvars import ContextVar
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
     Tuple,
     TypeVar,
     Union,
@@ -12,23 +21,36 @@ from typing import (
 
 from django.contrib import auth
 from django.contrib.auth import get_user_model
-from django.core.exceptions import ValidationError
+from django.contrib.auth.signals import user_login_failed
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    ValidationError,
+)
+from django.db.models import Case, IntegerField, Q, Value, When
 from django.db.models.base import Model
 from django.db.models.query import QuerySet
-from django.http import Http404
+from django.http import Http404, HttpRequest
 from django.shortcuts import get_object_or_404 as _get_object_or_404
 
 from rest_registration.exceptions import UserNotFound
 from rest_registration.settings import registration_settings
+from rest_registration.utils.auth_backends import get_login_authentication_backend
 from rest_registration.utils.common import DefaultValues, set_or_none
+from rest_registration.utils.passwords import check_user_password
 from rest_registration.utils.types import Literal
 
+_T = TypeVar('_T')
 _DefaultT = TypeVar('_DefaultT')
 _ModelT = TypeVar('_ModelT', bound=Model)
 
-if TYPE_CHECKING:
-    from typing import Optional
+_user_identity_map: ContextVar[Optional[Dict[Tuple[Any, ...], 'AbstractBaseUser']]] = (
+    ContextVar('rest_registration_user_identity_map', default=None))
+
+LOGIN_SELECTOR_PRIORITY_ANNOTATION = 'rest_registration_login_selector_priority'
+CLEANSED_SUBSTITUTE = '********************'
 
+if TYPE_CHECKING:
     from django.contrib.auth.base_user import AbstractBaseUser
     from django.contrib.contenttypes.fields import GenericForeignKey
     from django.db.models import Field, ForeignObjectRel
@@ -45,32 +67,30 @@ class UserAttrsProxy:
 
 def authenticate_by_login_data(
         data: Dict[str, Any], **kwargs: Any) -> 'AbstractBaseUser':
-    login_field_names = get_user_login_field_names()
-    username_field_name = get_username_field_name()
     password = data.get('password')
-    login_value = data.get('login')
     if password is None:
         raise UserNotFound()
-    user_selectors: List[Tuple[str, str]] = []
-    if login_value is not None:
-        user_selectors.extend(
-            (field_name, login_value) for field_name in login_field_names)
+    user_selectors = _get_login_user_selectors(data)
+    request = _get_serializer_request(kwargs)
 
-    for field_name in login_field_names:
-        field_value = data.get(field_name)
-        if field_value is None:
-            continue
-        user_selectors.append((field_name, field_value))
+    if registration_settings.LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED:
+        return _authenticate_directly(user_selectors, password, request=request)
 
+    if registration_settings.LOGIN_SINGLE_QUERY_USER_LOOKUP_ENABLED:
+        return _authenticate_by_single_query_lookup(
+            user_selectors, password, request=request)
+
+    username_field_name = get_username_field_name()
     for field_name, field_value in user_selectors:
         if field_name == username_field_name:
             username = field_value
         else:
-            user = get_user_by_lookup_dict(
-                {field_name: field_value}, default=None, require_verified=False)
-            if user is None:
+            user_values = get_user_values_by_lookup_dict(
+                {field_name: field_value}, [username_field_name],
+                default=None, require_verified=False, use_read_replica=True)
+            if user_values is None:
                 continue
-            username = getattr(user, username_field_name)
+            username = user_values[username_field_name]
         user = auth.authenticate(username=username, password=password)
         if user:
             return user
@@ -78,6 +98,208 @@ def authenticate_by_login_data(
     raise UserNotFound()
 
 
+def check_user_credentials(
+        user: 'AbstractBaseUser',
+        password: str) -> bool:
+    """
+    Check the password of already loaded user directly against
+    the login authentication backend, without fetching the user again
+    via ``django.contrib.auth.authenticate()``.
+
+    If the check succeeds, the backend path is set as the ``backend``
+    attribute of the user.
+    """
+    backend_path = get_login_authentication_backend()
+    if backend_path is None:
+        raise ImproperlyConfigured(
+            "LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED requires"
+            " LOGIN_DEFAULT_SESSION_AUTHENTICATION_BACKEND to be set"
+            " when multiple AUTHENTICATION_BACKENDS are specified")
+    backend = auth.load_backend(backend_path)
+    if not check_user_password(user, password):
+        return False
+    user_can_authenticate = getattr(backend, 'user_can_authenticate', None)
+    if user_can_authenticate is not None and not user_can_authenticate(user):
+        return False
+    user.backend = backend_path  # type: ignore
+    return True
+
+
+def find_user_by_login_selectors(
+        user_selectors: Sequence[Tuple[str, Any]],
+        use_read_replica: bool = False,
+) -> Optional['AbstractBaseUser']:
+    """
+    Find the user matching any of given ``(field_name, value)`` selectors
+    using single database query.
+
+    If more than one user matches, the user matching the earliest selector
+    wins; if there is still a tie, the user with the lowest primary key wins.
+
+    If ``use_read_replica`` is set, the primary key of the user is looked up
+    in :ref:`read-replica-db-alias-setting` first; the user itself is always
+    loaded from the primary database.
+    """
+    find_first = _build_login_selectors_finder(user_selectors)
+    if find_first is None:
+        return None
+    queryset: QuerySet[AbstractBaseUser] = get_user_model().objects.all()
+    if use_read_replica and registration_settings.READ_REPLICA_DB_ALIAS:
+        user_pk = _find_in_read_replica(
+            lambda replica_queryset: find_first(replica_queryset, 'pk'))
+        if user_pk is not None:
+            user = _get_object_or_none(queryset, pk=user_pk)
+            if user is not None:
+                return user
+        # The user could be not replicated yet.
+    return find_first(queryset)
+
+
+def _find_username_by_login_selectors(
+        user_selectors: Sequence[Tuple[str, Any]]) -> Optional[str]:
+    """
+    Same as ``find_user_by_login_selectors()``, but return only the username
+    of the user, looked up in :ref:`read-replica-db-alias-setting` first.
+    """
+    find_first = _build_login_selectors_finder(user_selectors)
+    if find_first is None:
+        return None
+    username_field_name = get_username_field_name()
+    if registration_settings.READ_REPLICA_DB_ALIAS:
+        username = _find_in_read_replica(
+            lambda queryset: find_first(queryset, username_field_name))
+        if username is not None:
+            return username
+        # The user could be not replicated yet.
+    return find_first(get_user_model().objects.all(), username_field_name)
+
+
+def _build_login_selectors_finder(
+        user_selectors: Sequence[Tuple[str, Any]],
+) -> Optional[Callable[..., Any]]:
+    """
+    Return the function finding the first user (or the value of given field
+    of the user) in given queryset matching the selectors,
+    or ``None`` if no selector value is valid.
+    """
+    query = Q()
+    priority_cases = []
+    for priority, (field_name, field_value) in enumerate(user_selectors):
+        try:
+            get_user_field_obj(field_name).to_python(field_value)
+        except ValidationError:
+            continue
+        selector_query = Q(**{field_name: field_value})
+        query |= selector_query
+        priority_cases.append(When(selector_query, then=Value(priority)))
+    if not priority_cases:
+        return None
+
+    def find_first(
+            queryset: 'QuerySet[AbstractBaseUser]',
+            field_name: Optional[str] = None) -> Any:
+        queryset = (
+            queryset.filter(query)
+            .annotate(**{
+                LOGIN_SELECTOR_PRIORITY_ANNOTATION: Case(
+                    *priority_cases, output_field=IntegerField()),
+            })
+            .order_by(LOGIN_SELECTOR_PRIORITY_ANNOTATION, 'pk')
+        )
+        if field_name is not None:
+            queryset = queryset.values_list(field_name, flat=True)
+        try:
+            return queryset.first()
+        except (TypeError, ValueError, ValidationError):
+            return None
+
+    return find_first
+
+
+def _authenticate_directly(
+        user_selectors: Sequence[Tuple[str, Any]],
+        password: str,
+        request: Optional[HttpRequest] = None) -> 'AbstractBaseUser':
+    candidates: Iterable[Optional['AbstractBaseUser']]
+    if registration_settings.LOGIN_SINGLE_QUERY_USER_LOOKUP_ENABLED:
+        candidates = [find_user_by_login_selectors(user_selectors)]
+    else:
+        candidates = (
+            get_user_by_lookup_dict(
+                {field_name: field_value}, default=None, require_verified=False)
+            for field_name, field_value in user_selectors
+        )
+    password_checked = False
+    for candidate in candidates:
+        if candidate is None:
+            continue
+        password_checked = True
+        if check_user_credentials(candidate, password):
+            return candidate
+    if not password_checked:
+        _run_password_hasher(password)
+    _send_user_login_failed(user_selectors, request=request)
+    raise UserNotFound()
+
+
+def _authenticate_by_single_query_lookup(
+        user_selectors: Sequence[Tuple[str, Any]],
+        password: str,
+        request: Optional[HttpRequest] = None) -> 'AbstractBaseUser':
+    # The password is checked by authenticate() using the primary database.
+    username = _find_username_by_login_selectors(user_selectors)
+    if username is None:
+        _run_password_hasher(password)
+        _send_user_login_failed(user_selectors, request=request)
+        raise UserNotFound()
+    user = auth.authenticate(request, username=username, password=password)
+    if not user:
+        raise UserNotFound()
+    return user
+
+
+def _run_password_hasher(password: str) -> None:
+    # Run the password hasher once to reduce the timing difference
+    # between existing and nonexistent users (the same way Django's
+    # ModelBackend does).
+    get_user_model()().set_password(password)
+
+
+def _get_login_user_selectors(data: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    login_field_names = get_user_login_field_names()
+    login_value = data.get('login')
+    user_selectors: List[Tuple[str, Any]] = []
+    if login_value is not None:
+        user_selectors.extend(
+            (field_name, login_value) for field_name in login_field_names)
+
+    for field_name in login_field_names:
+        field_value = data.get(field_name)
+        if field_value is None:
+            continue
+        user_selectors.append((field_name, field_value))
+    return user_selectors
+
+
+def _get_serializer_request(kwargs: Dict[str, Any]) -> Optional[HttpRequest]:
+    serializer = kwargs.get('serializer')
+    if serializer is None:
+        return None
+    return serializer.context.get('request')
+
+
+def _send_user_login_failed(
+        user_selectors: Sequence[Tuple[str, Any]],
+        request: Optional[HttpRequest] = None) -> None:
+    credentials = {field_name: value for field_name, value in user_selectors}
+    credentials['password'] = CLEANSED_SUBSTITUTE
+    user_login_failed.send(
+        sender=__name__,
+        credentials=credentials,
+        request=request,
+    )
+
+
 def get_user_login_field_names() -> List[str]:
     user_class = get_user_model()
     return get_user_setting('LOGIN_FIELDS') or [user_class.USERNAME_FIELD]
@@ -122,23 +344,35 @@ def find_user_by_by_send_reset_password_link_data(
             continue
         for db_fn in db_field_names:
             user = get_user_by_lookup_dict(
-                {db_fn: value}, default=None, require_verified=False)
+                {db_fn: value}, default=None, require_verified=False,
+                use_read_replica=True)
             if user is not None:
                 return user
 
     raise UserNotFound()
 
 
-def user_with_email_exists(email: str) -> bool:
+def user_with_email_exists(email: str, use_read_replica: bool = False) -> bool:
     user_class = get_user_model()
     email_field_name = get_user_email_field_name()
     if not email_field_name:
         return True
     queryset = user_class.objects.filter(**{email_field_name: email})
+    read_replica_db_alias = registration_settings.READ_REPLICA_DB_ALIAS
+    if use_read_replica and read_replica_db_alias:
+        queryset = queryset.using(read_replica_db_alias)
     return queryset.exists()
 
 
 def is_user_email_field_unique() -> bool:
+    email_field_unique = get_user_field_schema().email_field_unique
+    if email_field_unique is None:
+        # Raise the appropriate error.
+        return _is_user_email_field_unique()
+    return email_field_unique
+
+
+def _is_user_email_field_unique() -> bool:
     email_field_name = get_user_email_field_name()
     email_field = get_user_field_obj(email_field_name)
     return is_model_field_unique(email_field)
@@ -153,22 +387,195 @@ def get_user_by_lookup_dict(
         lookup_dict: Dict[str, Any],
         default: Union[_DefaultT, Literal[
             DefaultValues.RAISE_EXCEPTION]] = DefaultValues.RAISE_EXCEPTION,
-        require_verified: bool = True) -> Union['AbstractBaseUser', _DefaultT]:
+        require_verified: bool = True,
+        use_read_replica: bool = False) -> Union['AbstractBaseUser', _DefaultT]:
+    """
+    If ``use_read_replica`` is set, the primary key of the user is looked up
+    in :ref:`read-replica-db-alias-setting` first; the user itself is always
+    loaded from the primary database.
+    """
+    user_class = get_user_model()
+    kwargs = _build_user_lookup_kwargs(lookup_dict, require_verified)
+    user = _get_loaded_user(kwargs)
+    if user is not None:
+        return user
+    if use_read_replica and registration_settings.READ_REPLICA_DB_ALIAS:
+        replica_user_pk = _find_in_read_replica(
+            lambda queryset: queryset.filter(**kwargs)
+            .values_list('pk', flat=True).first())
+        # The user could be not replicated yet.
+        user = _get_user_by_pk_hint(replica_user_pk, kwargs)
+    if user is None:
+        try:
+            queryset: QuerySet[AbstractBaseUser] = user_class.objects.all()
+            user = get_object_or_404(queryset, **kwargs)
+        except Http404:
+            if default is DefaultValues.RAISE_EXCEPTION:
+                raise UserNotFound() from None
+            return default
+    identity_map = _user_identity_map.get()
+    if identity_map is not None:
+        identity_map[_build_user_identity_key(user_class, kwargs)] = user
+    return user
+
+
+def _get_user_by_pk_hint(
+        user_pk: Any,
+        lookup_kwargs: Dict[str, Any]) -> Optional['AbstractBaseUser']:
+    """
+    Retrieve the user from the primary database by the primary key
+    found beforehand in the read replica. The lookup values
+    are checked as well, so the stale primary keys are not harmful.
+    """
+    if user_pk is None:
+        return None
+    queryset: QuerySet[AbstractBaseUser] = get_user_model().objects.all()
+    return _get_object_or_none(queryset, pk=user_pk, **lookup_kwargs)
+
+
+def _find_in_read_replica(
+        find: Callable[['QuerySet[AbstractBaseUser]'], _T]) -> _T:
+    """
+    Run given read-only lookup against
+    :ref:`read-replica-db-alias-setting` database.
+
+    The lookup should fetch only the primary keys or field values;
+    the model instances loaded from the replica could be stale
+    and must not be saved.
+    """
+    user_class = get_user_model()
+    queryset: QuerySet[AbstractBaseUser] = user_class.objects.using(
+        registration_settings.READ_REPLICA_DB_ALIAS)
+    return find(queryset)
+
+
+def _get_object_or_none(
+        queryset: 'QuerySet[_ModelT]', **filter_kwargs: Any) -> Optional[_ModelT]:
+    try:
+        return get_object_or_404(queryset, **filter_kwargs)
+    except Http404:
+        return None
+
+
+def get_user_values_by_verification_id(
+        user_verification_id: Any,
+        field_names: Sequence[str],
+        default: Union[
+            _DefaultT,
+            Literal[DefaultValues.RAISE_EXCEPTION]] = DefaultValues.RAISE_EXCEPTION,
+        require_verified: bool = True) -> Union[Dict[str, Any], _DefaultT]:
+    verification_id_field = get_user_setting('VERIFICATION_ID_FIELD')
+    return get_user_values_by_lookup_dict({
+        verification_id_field: user_verification_id},
+        field_names,
+        default=default,
+        require_verified=require_verified)
+
+
+def get_user_values_by_lookup_dict(
+        lookup_dict: Dict[str, Any],
+        field_names: Sequence[str],
+        default: Union[_DefaultT, Literal[
+            DefaultValues.RAISE_EXCEPTION]] = DefaultValues.RAISE_EXCEPTION,
+        require_verified: bool = True,
+        use_read_replica: bool = False) -> Union[Dict[str, Any], _DefaultT]:
+    """
+    Same as ``get_user_by_lookup_dict()``, but return only the values
+    of given user fields (as a dict).
+
+    Within ``user_identity_map()``, the whole user is loaded (once),
+    so the subsequent lookups of the same user reuse it; otherwise only
+    given columns are fetched from the database.
+
+    This is a trade-off made for the verification flows, which run
+    within the identity map: the one-time-use signer salts load the whole
+    user row before the signature is verified, so a valid link needs only
+    one user query (the user is needed for the write anyway), but a forged
+    or already used (not expired) link loads the whole row as well,
+    instead of the given columns only.
+
+    If ``use_read_replica`` is set, the values are looked up
+    in :ref:`read-replica-db-alias-setting` first.
+    """
+    user_class = get_user_model()
+    kwargs = _build_user_lookup_kwargs(lookup_dict, require_verified)
+    user = _get_loaded_user(kwargs)
+    if user is None and use_read_replica and (
+            registration_settings.READ_REPLICA_DB_ALIAS):
+        replica_values: Optional[Dict[str, Any]] = _find_in_read_replica(
+            lambda queryset: queryset.filter(**kwargs)
+            .values(*field_names).first())
+        if replica_values is not None:
+            return replica_values
+        # The user could be not replicated yet.
+    if user is None and _user_identity_map.get() is not None:
+        user = get_user_by_lookup_dict(
+            lookup_dict, default=None, require_verified=require_verified)
+        if user is None:
+            if default is DefaultValues.RAISE_EXCEPTION:
+                raise UserNotFound()
+            return default
+    if user is not None:
+        return {name: getattr(user, name) for name in field_names}
+    try:
+        queryset = user_class.objects.values(*field_names)
+        values: Dict[str, Any] = get_object_or_404(
+            queryset, **kwargs)  # type: ignore[arg-type]
+    except Http404:
+        if default is DefaultValues.RAISE_EXCEPTION:
+            raise UserNotFound() from None
+        return default
+    return values
+
+
+def _build_user_lookup_kwargs(
+        lookup_dict: Dict[str, Any], require_verified: bool) -> Dict[str, Any]:
     verification_enabled = registration_settings.REGISTER_VERIFICATION_ENABLED
     verification_flag_field = get_user_setting('VERIFICATION_FLAG_FIELD')
-    user_class = get_user_model()
     kwargs = {}
     kwargs.update(lookup_dict)
     if require_verified and verification_enabled and verification_flag_field:
         kwargs[verification_flag_field] = True
+    return kwargs
+
+
+def _get_loaded_user(
+        lookup_kwargs: Dict[str, Any]) -> Optional['AbstractBaseUser']:
+    identity_map = _user_identity_map.get()
+    if identity_map is not None:
+        identity_key = _build_user_identity_key(get_user_model(), lookup_kwargs)
+        if identity_key in identity_map:
+            return identity_map[identity_key]
+    return None
+
+
+@contextlib.contextmanager
+def user_identity_map() -> Iterator[None]:
+    """
+    Within this context, the users retrieved by ``get_user_by_lookup_dict()``
+    (and ``get_user_by_verification_id()``) using the same lookup are loaded
+    from the database only once; the same instance is returned
+    for the subsequent lookups.
+
+    Can be used as a decorator. Nested usage reuses the outer identity map.
+    """
+    if _user_identity_map.get() is not None:
+        yield
+        return
+    token = _user_identity_map.set({})
     try:
-        queryset: QuerySet[AbstractBaseUser] = user_class.objects.all()
-        user = get_object_or_404(queryset, **kwargs)
-    except Http404:
-        if default is DefaultValues.RAISE_EXCEPTION:
-            raise UserNotFound() from None
-        return default
-    return user
+        yield
+    finally:
+        _user_identity_map.reset(token)
+
+
+def _build_user_identity_key(
+        user_class: type, lookup_kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+    # The lookup values may come in different types (e.g. the user id
+    # from the URL params vs. the primary key value).
+    lookup_items = tuple(sorted(
+        (name, str(value)) for name, value in lookup_kwargs.items()))
+    return (user_class, lookup_items)
 
 
 def get_user_field_obj(name: str) -> 'UserField':
@@ -203,9 +610,79 @@ def build_initial_user(
         return UserAttrsProxy(**user_data)
 
 
+class UserFieldSchema(NamedTuple):
+    """
+    Precomputed, immutable information about the user fields,
+    derived from the user model and the user-related settings.
+    """
+    user_class: type
+    default_fields: Tuple['UserField', ...]
+    field_names: Mapping[Tuple[bool, bool], Tuple[str, ...]]
+    public_field_names: Mapping[Tuple[bool, bool], Tuple[str, ...]]
+    email_field_unique: Optional[bool]
+
+    @classmethod
+    def build(cls) -> 'UserFieldSchema':
+        bool_pairs = list(itertools.product([False, True], repeat=2))
+        field_names = {
+            (allow_primary_key, non_editable): _compute_user_field_names(
+                allow_primary_key=allow_primary_key,
+                non_editable=non_editable,
+            )
+            for allow_primary_key, non_editable in bool_pairs
+        }
+        default_fields = tuple(_compute_user_default_fields())
+        public_field_names = {
+            (write_once, read_only): _compute_user_public_field_names(
+                default_fields,
+                write_once=write_once,
+                read_only=read_only,
+            )
+            for write_once, read_only in bool_pairs
+        }
+        try:
+            email_field_unique: Optional[bool] = _is_user_email_field_unique()
+        except FieldDoesNotExist:
+            email_field_unique = None
+        return cls(
+            user_class=get_user_model(),
+            default_fields=default_fields,
+            field_names=MappingProxyType(field_names),
+            public_field_names=MappingProxyType(public_field_names),
+            email_field_unique=email_field_unique,
+        )
+
+
+_user_field_schema: Optional[UserFieldSchema] = None
+
+
+def get_user_field_schema() -> UserFieldSchema:
+    """
+    Return the user field schema, building it if it is missing
+    or outdated (the user model has changed).
+    """
+    global _user_field_schema  # pylint: disable=global-statement
+    schema = _user_field_schema
+    if schema is None or schema.user_class is not get_user_model():
+        schema = UserFieldSchema.build()
+        _user_field_schema = schema
+    return schema
+
+
+def reset_user_field_schema() -> None:
+    global _user_field_schema  # pylint: disable=global-statement
+    _user_field_schema = None
+
+
 def get_user_field_names(
         allow_primary_key: bool = True,
         non_editable: bool = False) -> Tuple[str, ...]:
+    return get_user_field_schema().field_names[allow_primary_key, non_editable]
+
+
+def _compute_user_field_names(
+        allow_primary_key: bool = True,
+        non_editable: bool = False) -> Tuple[str, ...]:
 
     def not_in_seq(names: Iterable[str]) -> Callable[[str], bool]:
         return lambda name: name not in names
@@ -245,9 +722,13 @@ def get_user_field_names(
 def get_user_public_field_names(
         write_once: bool = False,
         read_only: bool = False) -> Tuple[str, ...]:
+    return get_user_field_schema().public_field_names[write_once, read_only]
 
-    fields = _get_user_default_fields()
 
+def _compute_user_public_field_names(
+        fields: Iterable['UserField'],
+        write_once: bool = False,
+        read_only: bool = False) -> Tuple[str, ...]:
     if read_only:
         field_names = _get_user_public_read_only_field_names(
             fields, write_once=write_once)
@@ -317,7 +798,11 @@ def _get_pk_name(fields: Iterable['UserField']) -> str:
     return pk_name
 
 
-def _get_user_default_fields() -> List['UserField']:
+def _get_user_default_fields() -> Sequence['UserField']:
+    return get_user_field_schema().default_fields
+
+
+def _compute_user_default_fields() -> List['UserField']:
     user_class = get_user_model()
     fields = user_class._meta.get_fields()  # pylint: disable=protected-access
     default_field_names = [
@@ -1,14 +1,18 @@
+import contextlib
 from collections import namedtuple
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Type
 from urllib.parse import urlencode
 
 from django.core import signing
+from django.db import transaction
 from django.template.loader import render_to_string
 from django.utils.safestring import SafeString
 from rest_framework.request import Request
+from rest_framework.serializers import Serializer
 
 from rest_registration.exceptions import SignatureExpired, SignatureInvalid
 from rest_registration.notifications.enums import NotificationMethod, NotificationType
+from rest_registration.one_time_use_stores import get_one_time_use_store
 from rest_registration.settings import registration_settings
 from rest_registration.utils.email import parse_template_config
 from rest_registration.utils.signers import URLParamsSigner
@@ -33,9 +37,86 @@ def verify_signer_or_bad_request(signer: URLParamsSigner) -> None:
         raise SignatureInvalid() from None
 
 
+def check_verification_link_data(
+        input_data: Dict[str, Any],
+        signer_class: Type[URLParamsSigner],
+        serializer_class: Type[Serializer],
+        serializer_context: Optional[Dict[str, Any]] = None) -> URLParamsSigner:
+    """
+    Check the verification link data without accessing the database
+    and return the signer.
+    """
+    if serializer_context is None:
+        serializer_context = {}
+    input_data = expand_verification_token(input_data, signer_class)
+    serializer = serializer_class(data=input_data, context=serializer_context)
+    serializer.is_valid(raise_exception=True)
+    signer = signer_class(serializer.validated_data, strict=False)
+    try:
+        signer.verify_stateless()
+    except signing.SignatureExpired:
+        raise SignatureExpired() from None
+    except signing.BadSignature:
+        raise SignatureInvalid() from None
+    return signer
+
+
+@contextlib.contextmanager
+def consuming_signer_or_bad_request(signer: URLParamsSigner) -> Iterator[None]:
+    """
+    Record the verified signed data as used, if the one-time use
+    is enforced by the one-time-use store, and run the ``with`` block
+    (performing the database writes for the link) in the same transaction.
+
+    If the block fails, the data recorded by the stores backed
+    by the database is rolled back together with the writes.
+    """
+    if not signer.is_one_time_use() or not signer.is_salt_stateless():
+        # The one-time use is not required or it is enforced
+        # by the signer salt.
+        yield
+        return
+    store = get_one_time_use_store()
+    if store is None:
+        yield
+        return
+    with transaction.atomic():
+        if not store.consume(signer.get_nonce(), signer.get_valid_period()):
+            raise SignatureInvalid()
+        yield
+
+
+def expand_verification_token(
+        input_data: Dict[str, Any],
+        signer_class: Type[URLParamsSigner]) -> Dict[str, Any]:
+    """
+    Replace the compact token (if present in the input data)
+    with the signed data it contains.
+    """
+    token = input_data.get(signer_class.TOKEN_PARAM)
+    if token is None:
+        return input_data
+    try:
+        token_data = signer_class.parse_token(str(token))
+    except signing.BadSignature:
+        raise SignatureInvalid() from None
+    data = {
+        key: value for key, value in input_data.items()
+        if key != signer_class.TOKEN_PARAM
+    }
+    data.update(token_data)
+    return data
+
+
 def build_default_verification_url(signer: URLParamsSigner) -> str:
     base_url = signer.get_base_url()
-    params = urlencode(signer.get_signed_data())
+    if (
+        registration_settings.VERIFICATION_COMPACT_TOKEN_ENABLED
+        and signer.supports_token()
+    ):
+        params = urlencode({signer.TOKEN_PARAM: signer.get_signed_token()})
+    else:
+        params = urlencode(signer.get_signed_data())
     url = f"{base_url}?{params}"
     if signer.request:
         url = signer.request.build_absolute_uri(url)
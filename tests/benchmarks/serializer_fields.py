@@ -0,0 +1,57 @@
+"""
+Compare the time needed to build the fields of the default generated
+serializers with and without the fields cache.
+
+Run it from the repository root directory::
+
+    python -m tests.benchmarks.serializer_fields
+"""
+import argparse
+import os
+import timeit
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=1000)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.default_settings')
+    import django  # pylint: disable=import-outside-toplevel
+    django.setup()
+
+    from rest_framework.serializers import (  # noqa: E501 pylint: disable=import-outside-toplevel
+        ModelSerializer,
+    )
+
+    from rest_registration.api.serializers import (  # noqa: E501 pylint: disable=import-outside-toplevel
+        DefaultRegisterUserSerializer,
+        DefaultUserProfileSerializer,
+        PasswordConfirmSerializerMixin,
+    )
+
+    def build_uncached(serializer_class):
+        serializer = serializer_class(data={})
+        if isinstance(serializer, PasswordConfirmSerializerMixin):
+            return PasswordConfirmSerializerMixin.get_fields(serializer)
+        return ModelSerializer.get_fields(serializer)
+
+    def build_cached(serializer_class):
+        return serializer_class(data={}).get_fields()
+
+    for serializer_class in (
+            DefaultUserProfileSerializer, DefaultRegisterUserSerializer):
+        build_cached(serializer_class)  # warm up the cache
+        uncached = timeit.timeit(
+            lambda: build_uncached(serializer_class), number=args.number)
+        cached = timeit.timeit(
+            lambda: build_cached(serializer_class), number=args.number)
+        print(
+            f"{serializer_class.__name__}:"
+            f" uncached {uncached / args.number * 1e6:.1f} us/op,"
+            f" cached {cached / args.number * 1e6:.1f} us/op,"
+            f" speedup {uncached / cached:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Compare the time needed to sign the verification data
+using the legacy signing (``django.core.signing.Signer`` + pickled data)
+and the current signing engine.
+
+Run it from the repository root directory::
+
+    python -m tests.benchmarks.signers
+"""
+import argparse
+import os
+import timeit
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=10000)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.default_settings')
+    import django  # pylint: disable=import-outside-toplevel
+    django.setup()
+
+    from django.core.signing import (  # noqa: E501 pylint: disable=import-outside-toplevel
+        Signer,
+    )
+
+    from rest_registration.utils.signers import (  # noqa: E501 pylint: disable=import-outside-toplevel
+        DataSigner,
+        SigningEngine,
+        get_dict_canonical_repr,
+        get_dict_repr,
+    )
+
+    data = {
+        'user_id': 12345,
+        'email': 'john.doe@example.com',
+        'timestamp': 1600000000,
+    }
+
+    def sign_legacy():
+        return Signer(salt=DataSigner.SALT_BASE).signature(get_dict_repr(data))
+
+    def sign_current():
+        return SigningEngine(DataSigner.SALT_BASE).signature(
+            get_dict_canonical_repr(data))
+
+    legacy = timeit.timeit(sign_legacy, number=args.number)
+    current = timeit.timeit(sign_current, number=args.number)
+    print(
+        f"legacy {legacy / args.number * 1e6:.1f} us/op,"
+        f" current {current / args.number * 1e6:.1f} us/op,"
+        f" speedup {legacy / current:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
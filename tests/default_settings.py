@@ -8,7 +8,12 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'test_db.sqlite3'),
-    }
+    },
+    # Stand-in for a read replica (not replicated, used by the routing tests).
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.path.join(BASE_DIR, 'test_replica_db.sqlite3'),
+    },
 }
 
 INSTALLED_APPS = (
@@ -22,6 +27,9 @@ INSTALLED_APPS = (
     'rest_framework',
     'rest_framework.authtoken',
     'rest_registration',
+    'rest_registration.contrib.device_auth_tokens',
+    'rest_registration.contrib.verification_nonces',
+    'rest_registration.contrib.auth_token_key_versions',
 
     'tests.testapps.custom_users',
     'tests.testapps.custom_templates',
@@ -27,8 +27,8 @@ class APIViewRequestFactory:
     def create_patch_request(self, data=None, format=None):  # noqa: E501 pylint: disable=redefined-builtin
         return self._factory.patch(self.view_url, data=data, format=format)
 
-    def create_get_request(self):
-        return self._factory.get(self.view_url)
+    def create_get_request(self, data=None):
+        return self._factory.get(self.view_url, data=data)
 
     def add_session_to_request(self, request):
         add_session_to_request(request)
@@ -0,0 +1,52 @@
+from rest_framework import serializers
+
+from rest_registration.api.serializers import CachedFieldsSerializerMixin
+
+
+class ContextFieldsSerializer(serializers.Serializer):  # noqa: E501 pylint: disable=abstract-method
+    name = serializers.CharField()
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.context.get('with_extra'):
+            fields['extra'] = serializers.CharField()
+        return fields
+
+
+class KeyedContextFieldsSerializer(  # pylint: disable=abstract-method
+        CachedFieldsSerializerMixin,
+        ContextFieldsSerializer):
+
+    def get_fields_cache_key(self):
+        return bool(self.context.get('with_extra'))
+
+
+class UncachedContextFieldsSerializer(  # pylint: disable=abstract-method
+        CachedFieldsSerializerMixin,
+        ContextFieldsSerializer):
+
+    def get_fields_cache_key(self):
+        return None
+
+
+def test_instances_get_own_copies_of_cached_fields():
+    serializer1 = KeyedContextFieldsSerializer()
+    serializer2 = KeyedContextFieldsSerializer()
+    fields1 = serializer1.fields
+    fields2 = serializer2.fields
+    assert fields1['name'] is not fields2['name']
+    assert fields1['name'].parent is serializer1
+    assert fields2['name'].parent is serializer2
+
+
+def test_context_dependent_fields_cached_per_cache_key():
+    assert set(KeyedContextFieldsSerializer().fields) == {'name'}
+    assert set(KeyedContextFieldsSerializer(
+        context={'with_extra': True}).fields) == {'name', 'extra'}
+    assert set(KeyedContextFieldsSerializer().fields) == {'name'}
+
+
+def test_caching_disabled_when_cache_key_is_none():
+    assert set(UncachedContextFieldsSerializer().fields) == {'name'}
+    assert set(UncachedContextFieldsSerializer(
+        context={'with_extra': True}).fields) == {'name', 'extra'}
@@ -1,6 +1,10 @@
+from unittest import mock
+
 import pytest
+from rest_framework.serializers import ModelSerializer
 
 from rest_registration.settings import registration_settings
+from tests.helpers.settings import override_rest_registration_settings
 
 
 @pytest.fixture
@@ -44,3 +48,33 @@ def test_no_password_generated_fields(
         "email",
         "password",
     }
+
+
+def test_generated_fields_cached(settings_with_register_verification, monkeypatch):
+    serializer_class = registration_settings.REGISTER_SERIALIZER_CLASS
+    serializer_class(data={}).get_fields()
+    model_get_fields_mock = mock.Mock(side_effect=ModelSerializer.get_fields)
+    monkeypatch.setattr(ModelSerializer, "get_fields", model_get_fields_mock)
+
+    serializer1 = serializer_class(data={})
+    serializer2 = serializer_class(data={})
+    fields1 = serializer1.fields
+    fields2 = serializer2.fields
+
+    model_get_fields_mock.assert_not_called()
+    assert set(fields1) == set(fields2)
+    assert fields1["username"] is not fields2["username"]
+    assert fields1["username"].parent is serializer1
+    assert fields2["username"].parent is serializer2
+
+
+def test_generated_fields_cache_invalidated_on_settings_change(
+    settings_with_register_verification,
+):
+    serializer_class = registration_settings.REGISTER_SERIALIZER_CLASS
+    assert "password_confirm" in serializer_class(data={}).get_fields()
+    with override_rest_registration_settings({
+        "REGISTER_SERIALIZER_PASSWORD_CONFIRM": False,
+    }):
+        assert "password_confirm" not in serializer_class(data={}).get_fields()
+    assert "password_confirm" in serializer_class(data={}).get_fields()
@@ -1,9 +1,12 @@
 import django
 import pytest
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.test.utils import override_settings
 from rest_framework.authtoken.models import Token
 from rest_framework.settings import api_settings
 from rest_framework.test import APIRequestFactory
 
+from rest_registration.utils.passwords import apply_pending_password_hash_upgrades
 from tests.helpers.api_views import (
     assert_response_is_bad_request,
     assert_response_is_ok,
@@ -247,6 +250,102 @@ def test_ok_when_user_with_unique_email_logs_with_email(
     user_login_failed_send_mock.assert_called_once()
 
 
+@override_settings(
+    PASSWORD_HASHERS=[
+        "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ],
+)
+@override_rest_registration_settings(
+    {
+        "LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED": True,
+        "LOGIN_PASSWORD_HASH_UPGRADE_DEFERRED": True,
+    }
+)
+def test_ok_with_deferred_password_hash_upgrade_session_stays_valid(
+    settings_minimal,
+    user,
+    password_change,
+    api_view_provider,
+    http_client,
+    django_capture_on_commit_callbacks,
+):
+    password = password_change.old_value
+    user.password = make_password(password, hasher="md5")
+    user.save()
+    with django_capture_on_commit_callbacks(execute=True):
+        response = http_client.post(api_view_provider.view_url, {
+            "login": user.username,
+            "password": password,
+        })
+    assert response.status_code == 200
+    assert apply_pending_password_hash_upgrades() == 1
+    user.refresh_from_db()
+    assert identify_hasher(user.password).algorithm == "pbkdf2_sha256"
+
+    response = http_client.get(ViewProvider("profile").view_url)
+    assert response.status_code == 200
+    assert response.json()["id"] == user.pk
+
+
+@override_rest_registration_settings(
+    {
+        "USER_LOGIN_FIELDS": ["username", "email"],
+        "LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED": True,
+    }
+)
+def test_ok_when_user_with_unique_email_logs_with_email_and_direct_check(
+    settings_minimal,
+    settings_with_user_with_unique_email,
+    user,
+    password_change,
+    api_view_provider,
+    api_factory,
+    user_logged_in_send_mock,
+    user_login_failed_send_mock,
+):
+    password = password_change.old_value
+    request = api_factory.create_post_request(
+        {
+            "login": user.email,
+            "password": password,
+        }
+    )
+    api_factory.add_session_to_request(request)
+    response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    user_logged_in_send_mock.assert_called_once()
+    user_login_failed_send_mock.assert_not_called()
+
+
+@override_rest_registration_settings(
+    {
+        "USER_LOGIN_FIELDS": ["username", "email"],
+        "LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED": True,
+    }
+)
+def test_fail_with_direct_check(
+    settings_minimal,
+    settings_with_user_with_unique_email,
+    user,
+    api_view_provider,
+    api_factory,
+    user_logged_in_send_mock,
+    user_login_failed_send_mock,
+):
+    request = api_factory.create_post_request(
+        {
+            "login": user.email,
+            "password": "blah",
+        }
+    )
+    api_factory.add_session_to_request(request)
+    response = api_view_provider.view_func(request)
+    assert_response_is_bad_request(response)
+    user_logged_in_send_mock.assert_not_called()
+    user_login_failed_send_mock.assert_called_once()
+
+
 @pytest.mark.skipif(
     DJANGO_VERSION_INFO < (5, 0),
     reason="requires Django 5.0 or higher",
@@ -300,6 +399,54 @@ def test_ok_with_token_and_auth_jwt_manager(
     assert_response_is_ok(response)
 
 
+@override_rest_registration_settings(
+    {
+        "AUTH_TOKEN_MANAGER_CLASS": (
+            "rest_registration.auth_token_managers.CachedRestFrameworkAuthTokenManager"  # noqa: E501
+        ),
+    }
+)
+@override_rest_framework_settings(
+    {
+        "DEFAULT_AUTHENTICATION_CLASSES": (
+            "rest_registration.auth_token_managers.CachedTokenAuthentication",
+        ),
+    }
+)
+def test_ok_with_token_and_cached_token_authentication(
+    settings_minimal,
+    user,
+    password_change,
+    api_view_provider,
+    api_factory,
+    django_assert_num_queries,
+):
+    password = password_change.old_value
+    request = api_factory.create_post_request(
+        {
+            "login": user.username,
+            "password": password,
+        }
+    )
+    response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    assert "token" in response.data
+    token_key = response.data["token"]
+
+    profile_view_provider = ViewProvider("profile")
+    api_request_factory = APIRequestFactory()
+    for expected_num_queries in [1, 1]:
+        authorized_request = api_request_factory.get(
+            profile_view_provider.view_url,
+            headers={
+                "Authorization": f"Token {token_key}",
+            },
+        )
+        with django_assert_num_queries(expected_num_queries):
+            response = profile_view_provider.view_func(authorized_request)
+        assert_response_is_ok(response)
+
+
 @pytest.fixture
 def api_view_provider():
     return ViewProvider("login")
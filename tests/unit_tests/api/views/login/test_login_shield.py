@@ -0,0 +1,115 @@
+import pytest
+from django.core.cache import cache
+
+from rest_registration.utils.login_shield import get_login_shield_stats
+from tests.helpers.api_views import (
+    assert_response_is_bad_request,
+    assert_response_is_ok,
+)
+from tests.helpers.settings import override_rest_registration_settings
+from tests.helpers.views import ViewProvider
+
+
+@override_rest_registration_settings(
+    {
+        "LOGIN_SHIELD_ENABLED": True,
+        "LOGIN_SHIELD_MAX_FAILURES_PER_LOGIN": 2,
+    }
+)
+def test_when_too_many_failures_then_login_rejected_before_authentication(
+    settings_minimal,
+    user,
+    password_change,
+    api_view_provider,
+    api_factory,
+    monkeypatch,
+):
+    for _ in range(2):
+        response = _login(api_view_provider, api_factory, user.username, "blah")
+        assert_response_is_bad_request(response)
+
+    monkeypatch.setattr(
+        "rest_registration.utils.users.auth.authenticate",
+        _fail_when_called,
+    )
+    response = _login(
+        api_view_provider, api_factory, user.username, password_change.old_value)
+    assert_response_is_bad_request(response)
+    assert response.data["detail"].code == "login-invalid"
+    assert get_login_shield_stats() == {
+        "blocked_attempts": 1,
+        "recorded_failures": 2,
+    }
+
+
+@override_rest_registration_settings(
+    {
+        "LOGIN_SHIELD_ENABLED": True,
+        "LOGIN_SHIELD_MAX_FAILURES_PER_LOGIN": 2,
+    }
+)
+def test_when_login_succeeds_then_login_failures_are_cleared(
+    settings_minimal,
+    user,
+    password_change,
+    api_view_provider,
+    api_factory,
+):
+    response = _login(api_view_provider, api_factory, user.username, "blah")
+    assert_response_is_bad_request(response)
+    response = _login(
+        api_view_provider, api_factory, user.username, password_change.old_value)
+    assert_response_is_ok(response)
+    response = _login(api_view_provider, api_factory, user.username, "blah")
+    assert_response_is_bad_request(response)
+    response = _login(
+        api_view_provider, api_factory, user.username, password_change.old_value)
+    assert_response_is_ok(response)
+
+
+@override_rest_registration_settings(
+    {
+        "LOGIN_SHIELD_ENABLED": True,
+        "LOGIN_SHIELD_MAX_FAILURES_PER_LOGIN": None,
+        "LOGIN_SHIELD_MAX_FAILURES_PER_IP": 1,
+    }
+)
+def test_when_too_many_failures_from_ip_then_login_rejected(
+    settings_minimal,
+    user,
+    password_change,
+    api_view_provider,
+    api_factory,
+):
+    response = _login(api_view_provider, api_factory, "someone-else", "blah")
+    assert_response_is_bad_request(response)
+    response = _login(
+        api_view_provider, api_factory, user.username, password_change.old_value)
+    assert_response_is_bad_request(response)
+
+
+def _login(api_view_provider, api_factory, login, password):
+    request = api_factory.create_post_request(
+        {
+            "login": login,
+            "password": password,
+        }
+    )
+    api_factory.add_session_to_request(request)
+    return api_view_provider.view_func(request)
+
+
+def _fail_when_called(*args, **kwargs):
+    pytest.fail("authentication should not be performed")
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def api_view_provider():
+    return ViewProvider("login")
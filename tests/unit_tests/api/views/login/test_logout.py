@@ -3,12 +3,19 @@ from django.test.utils import modify_settings, override_settings
 from rest_framework.authtoken.models import Token
 from rest_framework.test import force_authenticate
 
+from rest_registration.contrib.device_auth_tokens.auth_token_managers import (
+    DeviceAuthTokenManager,
+)
+from rest_registration.contrib.device_auth_tokens.models import DeviceAuthToken
 from tests.helpers.api_views import (
     assert_response_is_bad_request,
     assert_response_is_forbidden,
     assert_response_is_ok,
 )
-from tests.helpers.settings import override_rest_registration_settings
+from tests.helpers.settings import (
+    override_rest_framework_settings,
+    override_rest_registration_settings,
+)
 from tests.helpers.views import ViewProvider
 
 
@@ -125,6 +132,38 @@ def _test_fail_with_revoke_token_when_nonexistent_token(
     assert_response_is_bad_request(response)
 
 
+@override_rest_registration_settings(
+    {
+        "AUTH_TOKEN_MANAGER_CLASS": (
+            "rest_registration.contrib.device_auth_tokens.auth_token_managers.DeviceAuthTokenManager"  # noqa: E501
+        ),
+    }
+)
+@override_rest_framework_settings(
+    {
+        "DEFAULT_AUTHENTICATION_CLASSES": (
+            "rest_registration.contrib.device_auth_tokens.auth_token_managers.DeviceTokenAuthentication",  # noqa: E501
+        ),
+    }
+)
+def test_ok_with_revoke_device_token(
+    settings_minimal, user, api_view_provider, api_factory
+):
+    auth_token_manager = DeviceAuthTokenManager()
+    token = auth_token_manager.provide_token(user)
+    other_device_token = auth_token_manager.provide_token(user)
+    request = api_factory.create_post_request(
+        {
+            "revoke_token": True,
+        }
+    )
+    request.META["HTTP_AUTHORIZATION"] = f"Token {token}"
+    response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    assert not DeviceAuthToken.objects.get_by_raw_token(token)
+    assert DeviceAuthToken.objects.get_by_raw_token(other_device_token)
+
+
 def test_fail_when_not_logged_in(
     settings_minimal, user, api_view_provider, api_factory
 ):
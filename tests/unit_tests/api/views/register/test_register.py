@@ -5,7 +5,8 @@ from urllib.parse import urlparse
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.mail.backends.base import BaseEmailBackend
-from django.test.utils import override_settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
 
 from rest_registration.signers.register import RegisterSigner
 from tests.helpers.api_views import (
@@ -539,6 +540,54 @@ def test_fail_when_register_flow_disabled(
     assert_no_email_sent(sent_emails)
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize("optimistic_uniqueness_check_enabled", [False, True])
+def test_fail_when_username_already_registered(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    optimistic_uniqueness_check_enabled,
+):
+    data = _get_register_user_data(password="testpassword")
+    create_test_user(username=data["username"])
+    request = api_factory.create_post_request(data)
+    with override_rest_registration_settings({
+        "USER_OPTIMISTIC_UNIQUENESS_CHECK_ENABLED": (
+            optimistic_uniqueness_check_enabled
+        ),
+    }):
+        with capture_sent_emails() as sent_emails:
+            response = api_view_provider.view_func(request)
+    assert_response_status_is_bad_request(response)
+    assert response.data == {
+        "username": ["A user with that username already exists."],
+    }
+    assert get_user_model().objects.filter(username=data["username"]).count() == 1
+    assert_no_email_sent(sent_emails)
+
+
+@pytest.mark.django_db
+@override_rest_registration_settings(
+    {
+        "REGISTER_VERIFICATION_ENABLED": False,
+        "USER_OPTIMISTIC_UNIQUENESS_CHECK_ENABLED": True,
+    }
+)
+def test_ok_with_optimistic_uniqueness_check_skips_uniqueness_queries(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+):
+    data = _get_register_user_data(password="testpassword")
+    request = api_factory.create_post_request(data)
+    with CaptureQueriesContext(connection) as context:
+        response = api_view_provider.view_func(request)
+    assert_response_status_is_created(response)
+    user = _get_register_response_user(response)
+    assert_user_state_matches_data(user, data, verified=True)
+    assert not [q for q in context.captured_queries if q["sql"].startswith("SELECT")]
+
+
 @pytest.fixture
 def api_view_provider():
     return ViewProvider("register")
@@ -1,8 +1,11 @@
+import importlib
 import time
 from unittest import mock
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
+from django.db.models.signals import post_save, pre_save
 
 from rest_registration.api.views.register import RegisterSigner
 from tests.helpers.api_views import (
@@ -30,6 +33,38 @@ def test_ok(
     assert user.is_active
 
 
+def test_ok_with_token(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+):
+    user = inactive_user
+    signer = RegisterSigner({"user_id": user.pk})
+    request = api_factory.create_post_request({"token": signer.get_signed_token()})
+    response = api_view_provider.view_func(request)
+    assert_response_status_is_ok(response)
+    user.refresh_from_db()
+    assert user.is_active
+
+
+def test_tampered_token_fail(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+):
+    user = inactive_user
+    signer = RegisterSigner({"user_id": user.pk})
+    token = signer.get_signed_token()
+    token = token[:-1] + ("A" if token[-1] != "A" else "B")
+    request = api_factory.create_post_request({"token": token})
+    response = api_view_provider.view_func(request)
+    assert_response_status_is_bad_request(response)
+    user.refresh_from_db()
+    assert not user.is_active
+
+
 def test_ok_signal(
     settings_with_register_verification,
     api_view_provider,
@@ -49,6 +84,54 @@ def test_ok_signal(
     assert user.is_active
 
 
+def test_ok_sends_model_save_signals(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+):
+    user = inactive_user
+    request = prepare_request(api_factory, user)
+    pre_save_receiver = mock.Mock()
+    post_save_receiver = mock.Mock()
+    pre_save.connect(pre_save_receiver, sender=type(user))
+    post_save.connect(post_save_receiver, sender=type(user))
+    try:
+        response = api_view_provider.view_func(request)
+    finally:
+        pre_save.disconnect(pre_save_receiver, sender=type(user))
+        post_save.disconnect(post_save_receiver, sender=type(user))
+    assert_response_status_is_ok(response)
+    assert pre_save_receiver.call_count == 1
+    assert post_save_receiver.call_count == 1
+    post_save_kwargs = post_save_receiver.call_args.kwargs
+    assert post_save_kwargs["instance"].pk == user.pk
+    assert post_save_kwargs["instance"].is_active
+    assert post_save_kwargs["update_fields"] == {"is_active"}
+    assert not post_save_kwargs["created"]
+
+
+def test_ok_already_verified_user_no_save_signals(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    user,
+):
+    request = prepare_request(api_factory, user)
+    pre_save_receiver = mock.Mock()
+    post_save_receiver = mock.Mock()
+    pre_save.connect(pre_save_receiver, sender=type(user))
+    post_save.connect(post_save_receiver, sender=type(user))
+    try:
+        response = api_view_provider.view_func(request)
+    finally:
+        pre_save.disconnect(pre_save_receiver, sender=type(user))
+        post_save.disconnect(post_save_receiver, sender=type(user))
+    assert_response_status_is_ok(response)
+    pre_save_receiver.assert_not_called()
+    post_save_receiver.assert_not_called()
+
+
 @override_rest_registration_settings(
     {
         "USER_VERIFICATION_ID_FIELD": "username",
@@ -90,6 +173,78 @@ def test_ok_idempotent(
     assert user.is_active
 
 
+@override_rest_registration_settings(
+    {
+        "REGISTER_VERIFICATION_ONE_TIME_USE": True,
+    }
+)
+def test_ok_with_one_time_use_loads_user_once(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+    django_assert_num_queries,
+):
+    user = inactive_user
+    request = prepare_request(api_factory, user)
+    # SELECT user + UPDATE user
+    with django_assert_num_queries(2):
+        response = api_view_provider.view_func(request)
+    assert_response_status_is_ok(response)
+    user.refresh_from_db()
+    assert user.is_active
+
+
+def test_ok_already_verified_user_not_updated(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    django_assert_num_queries,
+):
+    request = prepare_request(api_factory, user)
+    # SELECT user only, the already verified user is not written
+    with django_assert_num_queries(1) as context:
+        response = api_view_provider.view_func(request)
+    assert_response_status_is_ok(response)
+    assert context.captured_queries[0]["sql"].startswith("SELECT")
+    user.refresh_from_db()
+    assert user.is_active
+
+
+@override_rest_registration_settings(
+    {
+        "REGISTER_VERIFICATION_ONE_TIME_USE": True,
+    }
+)
+def test_concurrent_verification_with_one_time_use_fail(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+):
+    user = inactive_user
+    request = prepare_request(api_factory, user)
+    user_class = type(user)
+    views_register = importlib.import_module("rest_registration.api.views.register")
+    get_user_by_verification_id = views_register.get_user_by_verification_id
+
+    def get_user_verified_concurrently(*args, **kwargs):
+        found_user = get_user_by_verification_id(*args, **kwargs)
+        user_class.objects.filter(pk=found_user.pk).update(is_active=True)
+        return found_user
+
+    with patch.object(
+        views_register,
+        "get_user_by_verification_id",
+        side_effect=get_user_verified_concurrently,
+    ):
+        response = api_view_provider.view_func(request)
+    assert_response_status_is_bad_request(response)
+    user.refresh_from_db()
+    assert user.is_active
+
+
 @override_rest_registration_settings(
     {
         "REGISTER_VERIFICATION_ONE_TIME_USE": True,
@@ -116,6 +271,72 @@ def test_ok_then_fail_with_one_time_use(
     assert user.is_active
 
 
+@override_rest_registration_settings(
+    {
+        "REGISTER_VERIFICATION_ONE_TIME_USE": True,
+        "VERIFICATION_ONE_TIME_USE_STORE_CLASS": "rest_registration.one_time_use_stores.CacheOneTimeUseStore",  # noqa: E501
+    }
+)
+def test_ok_then_fail_with_one_time_use_store(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+    django_assert_num_queries,
+):
+    cache.clear()
+    user = inactive_user
+    request1 = prepare_request(api_factory, user)
+    request2 = prepare_request(api_factory, user)
+
+    # SELECT user + UPDATE user, the signer salt does not need a query;
+    # the store consumes the link in a transaction (SAVEPOINT + RELEASE)
+    with django_assert_num_queries(4):
+        response1 = api_view_provider.view_func(request1)
+    assert_response_status_is_ok(response1)
+    user.refresh_from_db()
+    assert user.is_active
+
+    # The link is rejected before the user is queried
+    # (the only queries are the savepoint ones).
+    with django_assert_num_queries(3) as context:
+        response2 = api_view_provider.view_func(request2)
+    assert all(
+        "SAVEPOINT" in query["sql"] for query in context.captured_queries)
+    assert_response_status_is_bad_request(response2)
+    cache.clear()
+
+
+@override_rest_registration_settings(
+    {
+        "REGISTER_VERIFICATION_ONE_TIME_USE": True,
+        "VERIFICATION_ONE_TIME_USE_STORE_CLASS": "rest_registration.contrib.verification_nonces.one_time_use_stores.DatabaseOneTimeUseStore",  # noqa: E501
+    }
+)
+def test_failed_verification_with_database_store_does_not_use_link(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+):
+    user = inactive_user
+    request1 = prepare_request(api_factory, user)
+    request2 = prepare_request(api_factory, user)
+    pre_save_receiver = mock.Mock(side_effect=RuntimeError("Write failed"))
+    pre_save.connect(pre_save_receiver, sender=type(user))
+    try:
+        with pytest.raises(RuntimeError):
+            api_view_provider.view_func(request1)
+    finally:
+        pre_save.disconnect(pre_save_receiver, sender=type(user))
+
+    # The used nonce was rolled back together with the failed write.
+    response = api_view_provider.view_func(request2)
+    assert_response_status_is_ok(response)
+    user.refresh_from_db()
+    assert user.is_active
+
+
 @override_rest_registration_settings(
     {
         "REGISTER_VERIFICATION_AUTO_LOGIN": True,
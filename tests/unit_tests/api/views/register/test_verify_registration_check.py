@@ -0,0 +1,193 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from rest_registration.api.views.register import RegisterSigner
+from tests.helpers.api_views import (
+    assert_response_status_is_bad_request,
+    assert_response_status_is_not_found,
+    assert_response_status_is_ok,
+)
+from tests.helpers.settings import override_rest_registration_settings
+from tests.helpers.views import ViewProvider
+
+
+def test_ok(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+    django_assert_num_queries,
+):
+    timestamp = int(time.time())
+    with patch("time.time", side_effect=lambda: timestamp):
+        signer = RegisterSigner({"user_id": inactive_user.pk})
+        request = api_factory.create_get_request(signer.get_signed_data())
+        with django_assert_num_queries(0):
+            response = api_view_provider.view_func(request)
+    assert_response_status_is_ok(response)
+    assert response.data["signature_checked"] is True
+    assert response["Cache-Control"] == "private, max-age=86400"
+    inactive_user.refresh_from_db()
+    assert not inactive_user.is_active
+
+
+def test_ok_cache_max_age_limited_by_expiration(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+):
+    timestamp = int(time.time())
+    with patch("time.time", side_effect=lambda: timestamp):
+        signer = RegisterSigner({"user_id": inactive_user.pk})
+        request = api_factory.create_get_request(signer.get_signed_data())
+    valid_secs = 7 * 24 * 3600
+    with patch("time.time", side_effect=lambda: timestamp + valid_secs - 60):
+        response = api_view_provider.view_func(request)
+    assert_response_status_is_ok(response)
+    assert response["Cache-Control"] == "private, max-age=60"
+
+
+def test_ok_with_token(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+):
+    signer = RegisterSigner({"user_id": inactive_user.pk})
+    request = api_factory.create_get_request({"token": signer.get_signed_token()})
+    response = api_view_provider.view_func(request)
+    assert_response_status_is_ok(response)
+
+
+def test_expired(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+    django_assert_num_queries,
+):
+    timestamp = int(time.time())
+    with patch("time.time", side_effect=lambda: timestamp):
+        signer = RegisterSigner({"user_id": inactive_user.pk})
+        request = api_factory.create_get_request(signer.get_signed_data())
+    with patch("time.time", side_effect=lambda: timestamp + 3600 * 24 * 8):
+        with django_assert_num_queries(0):
+            response = api_view_provider.view_func(request)
+    assert_response_status_is_bad_request(response)
+    assert response.data["detail"].code == "signature-expired"
+    assert response["Cache-Control"] == "private, max-age=86400"
+
+
+def test_tampered_signature(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+    django_assert_num_queries,
+):
+    signer = RegisterSigner({"user_id": inactive_user.pk})
+    data = signer.get_signed_data()
+    data["signature"] += "blah"
+    request = api_factory.create_get_request(data)
+    with django_assert_num_queries(0):
+        response = api_view_provider.view_func(request)
+    assert_response_status_is_bad_request(response)
+    assert response.data["detail"].code == "signature-invalid"
+
+
+def test_malformed(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+):
+    request = api_factory.create_get_request({"user_id": "1"})
+    response = api_view_provider.view_func(request)
+    assert_response_status_is_bad_request(response)
+    assert "signature" in response.data
+    assert "Cache-Control" in response
+
+
+@override_rest_registration_settings(
+    {
+        "REGISTER_VERIFICATION_ONE_TIME_USE": True,
+    }
+)
+def test_one_time_use_salt_not_checked(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+    django_assert_num_queries,
+):
+    signer = RegisterSigner({"user_id": inactive_user.pk})
+    request = api_factory.create_get_request(signer.get_signed_data())
+    # The signature salt depends on the user state, so it cannot be checked.
+    with django_assert_num_queries(0):
+        response = api_view_provider.view_func(request)
+    assert_response_status_is_ok(response)
+    assert response.data["signature_checked"] is False
+    assert response["Cache-Control"] == "private, no-cache"
+
+
+@override_rest_registration_settings(
+    {
+        "REGISTER_VERIFICATION_ONE_TIME_USE": True,
+        "VERIFICATION_ONE_TIME_USE_STORE_CLASS": "rest_registration.one_time_use_stores.CacheOneTimeUseStore",  # noqa: E501
+    }
+)
+def test_one_time_use_store_ok_not_cached(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+    django_assert_num_queries,
+):
+    signer = RegisterSigner({"user_id": inactive_user.pk})
+    request = api_factory.create_get_request(signer.get_signed_data())
+    with django_assert_num_queries(0):
+        response = api_view_provider.view_func(request)
+    assert_response_status_is_ok(response)
+    assert response.data["signature_checked"] is True
+    # The link becomes invalid once it is used.
+    assert response["Cache-Control"] == "private, no-cache"
+
+
+@override_rest_registration_settings(
+    {
+        "REGISTER_VERIFICATION_ONE_TIME_USE": True,
+        "VERIFICATION_ONE_TIME_USE_STORE_CLASS": "rest_registration.one_time_use_stores.CacheOneTimeUseStore",  # noqa: E501
+    }
+)
+def test_one_time_use_store_tampered_signature(
+    settings_with_register_verification,
+    api_view_provider,
+    api_factory,
+    inactive_user,
+    django_assert_num_queries,
+):
+    signer = RegisterSigner({"user_id": inactive_user.pk})
+    data = signer.get_signed_data()
+    data["signature"] += "blah"
+    request = api_factory.create_get_request(data)
+    with django_assert_num_queries(0):
+        response = api_view_provider.view_func(request)
+    assert_response_status_is_bad_request(response)
+
+
+def test_noverify_not_found(
+    api_view_provider,
+    api_factory,
+    inactive_user,
+):
+    signer = RegisterSigner({"user_id": inactive_user.pk}, strict=False)
+    request = api_factory.create_get_request(signer.get_signed_data())
+    response = api_view_provider.view_func(request)
+    assert_response_status_is_not_found(response)
+
+
+@pytest.fixture
+def api_view_provider():
+    return ViewProvider("verify-registration-check")
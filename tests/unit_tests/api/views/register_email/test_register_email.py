@@ -227,6 +227,82 @@ def test_register_email_fail_email_already_used(
     assert "detail" in response.data
 
 
+@override_rest_registration_settings(
+    {
+        "REGISTER_EMAIL_VERIFICATION_ENABLED": False,
+        "USER_OPTIMISTIC_UNIQUENESS_CHECK_ENABLED": True,
+    }
+)
+def test_register_email_with_optimistic_uniqueness_check_fail_email_already_used(
+    settings_with_user_with_unique_email,
+    user,
+    user2_with_user_new_email,
+    email_change,
+    api_view_provider,
+    api_factory,
+):
+    request = api_factory.create_post_request(
+        {
+            "email": email_change.new_value,
+        }
+    )
+    force_authenticate(request, user=user)
+    response = api_view_provider.view_func(request)
+    assert_response_is_bad_request(response)
+    assert response.data["detail"].code == "email-already-registered"
+    user.refresh_from_db()
+    assert user.email == email_change.old_value
+
+
+@override_rest_registration_settings(
+    {
+        "REGISTER_EMAIL_VERIFICATION_ENABLED": False,
+        "USER_OPTIMISTIC_UNIQUENESS_CHECK_ENABLED": True,
+    }
+)
+def test_register_email_with_optimistic_uniqueness_check_fail_own_email(
+    settings_with_simple_email_based_user, user, api_view_provider, api_factory
+):
+    request = api_factory.create_post_request(
+        {
+            "email": user.email,
+        }
+    )
+    force_authenticate(request, user=user)
+    response = api_view_provider.view_func(request)
+    assert_response_is_bad_request(response)
+    assert response.data["detail"].code == "email-already-registered"
+
+
+@override_rest_registration_settings(
+    {
+        "REGISTER_EMAIL_VERIFICATION_ENABLED": False,
+        "USER_OPTIMISTIC_UNIQUENESS_CHECK_ENABLED": True,
+    }
+)
+def test_noverify_with_optimistic_uniqueness_check_ok(
+    settings_with_simple_email_based_user,
+    user,
+    email_change,
+    api_view_provider,
+    api_factory,
+    django_assert_num_queries,
+):
+    new_email = email_change.new_value
+    request = api_factory.create_post_request(
+        {
+            "email": new_email,
+        }
+    )
+    force_authenticate(request, user=user)
+    # SAVEPOINT + UPDATE user + RELEASE SAVEPOINT (no e-mail existence check)
+    with django_assert_num_queries(3):
+        response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    user.refresh_from_db()
+    assert user.email == new_email
+
+
 @override_rest_registration_settings(
     {
         "VERIFICATION_TEMPLATES_SELECTOR": "tests.testapps.custom_templates.utils.select_verification_templates",  # noqa E501
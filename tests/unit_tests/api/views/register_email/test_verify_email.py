@@ -2,7 +2,8 @@ import time
 from unittest.mock import patch
 
 import pytest
-from django.test.utils import override_settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
 
 from rest_registration.api.views.register_email import RegisterEmailSigner
 from tests.helpers.api_views import (
@@ -31,6 +32,44 @@ def test_ok(
     assert_email_changed()
 
 
+def test_ok_with_token(
+    settings_with_register_email_verification,
+    user,
+    email_change,
+    signer,
+    api_view_provider,
+    api_factory,
+    assert_email_changed,
+):
+    request = api_factory.create_post_request({"token": signer.get_signed_token()})
+    response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    assert_email_changed()
+
+
+def test_ok_updates_email_column_only(
+    settings_with_register_email_verification,
+    user,
+    email_change,
+    signer,
+    api_view_provider,
+    api_factory,
+    assert_email_changed,
+):
+    data = signer.get_signed_data()
+    request = api_factory.create_post_request(data)
+    with CaptureQueriesContext(connection) as context:
+        response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    assert_email_changed()
+    [update_sql] = [
+        q["sql"] for q in context.captured_queries if q["sql"].startswith("UPDATE")
+    ]
+    assert '"email"' in update_sql
+    assert '"username"' not in update_sql
+    assert '"password"' not in update_sql
+
+
 def test_new_email_already_in_use_ok(
     settings_with_register_email_verification,
     user,
@@ -210,6 +249,52 @@ def test_user_with_unique_email_user_email_already_exists_non_field_errors(
     assert_email_not_changed()
 
 
+@override_rest_registration_settings(
+    {"USER_OPTIMISTIC_UNIQUENESS_CHECK_ENABLED": True}
+)
+def test_with_optimistic_uniqueness_check_user_email_already_exists(
+    settings_with_register_email_verification,
+    settings_with_user_with_unique_email,
+    user,
+    user2_with_user_new_email,
+    signer,
+    api_view_provider,
+    api_factory,
+    assert_email_not_changed,
+):
+    data = signer.get_signed_data()
+    request = api_factory.create_post_request(data)
+    response = api_view_provider.view_func(request)
+    assert_response_is_bad_request(response)
+    assert response.data["detail"].code == "email-already-registered"
+    assert_email_not_changed()
+
+
+@override_rest_registration_settings(
+    {"USER_OPTIMISTIC_UNIQUENESS_CHECK_ENABLED": True}
+)
+def test_with_optimistic_uniqueness_check_ok(
+    settings_with_register_email_verification,
+    settings_with_user_with_unique_email,
+    user,
+    signer,
+    api_view_provider,
+    api_factory,
+    assert_email_changed,
+):
+    data = signer.get_signed_data()
+    request = api_factory.create_post_request(data)
+    with CaptureQueriesContext(connection) as context:
+        response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    assert_email_changed()
+    select_sqls = [
+        q["sql"] for q in context.captured_queries if q["sql"].startswith("SELECT")
+    ]
+    # Only the user is loaded; there is no e-mail existence check.
+    assert len(select_sqls) == 1
+
+
 @pytest.fixture
 def signer(user, email_change):
     return RegisterEmailSigner(
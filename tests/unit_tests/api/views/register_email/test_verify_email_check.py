@@ -0,0 +1,51 @@
+import pytest
+
+from rest_registration.api.views.register_email import RegisterEmailSigner
+from tests.helpers.api_views import (
+    assert_response_is_bad_request,
+    assert_response_is_ok,
+)
+from tests.helpers.views import ViewProvider
+
+
+def test_ok(
+    settings_with_register_email_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    email_change,
+    django_assert_num_queries,
+):
+    signer = RegisterEmailSigner({
+        "user_id": user.pk,
+        "email": email_change.new_value,
+    })
+    request = api_factory.create_get_request(signer.get_signed_data())
+    with django_assert_num_queries(0):
+        response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    user.refresh_from_db()
+    assert user.email == email_change.old_value
+
+
+def test_tampered_email(
+    settings_with_register_email_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    email_change,
+):
+    signer = RegisterEmailSigner({
+        "user_id": user.pk,
+        "email": email_change.new_value,
+    })
+    data = signer.get_signed_data()
+    data["email"] = "p" + data["email"]
+    request = api_factory.create_get_request(data)
+    response = api_view_provider.view_func(request)
+    assert_response_is_bad_request(response)
+
+
+@pytest.fixture
+def api_view_provider():
+    return ViewProvider("verify-email-check")
@@ -2,9 +2,14 @@ import time
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
 from rest_framework.exceptions import ErrorDetail
 
-from rest_registration.api.views.reset_password import ResetPasswordSigner
+from rest_registration.api.views.reset_password import (
+    PASSWORD_VALIDATION_DEFERRED_CONTEXT_KEY,
+    ResetPasswordSerializer,
+    ResetPasswordSigner,
+)
 from tests.helpers.api_views import (
     assert_response_is_bad_request,
     assert_response_is_not_found,
@@ -30,6 +35,25 @@ def test_reset_ok(
     assert user.check_password(new_password)
 
 
+def test_reset_with_token_ok(
+    settings_with_reset_password_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    new_password,
+):
+    signer = ResetPasswordSigner({"user_id": user.pk})
+    data = {
+        "token": signer.get_signed_token(),
+        "password": new_password,
+    }
+    request = api_factory.create_post_request(data)
+    response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    user.refresh_from_db()
+    assert user.check_password(new_password)
+
+
 @override_rest_registration_settings(
     {
         "USER_VERIFICATION_ID_FIELD": "username",
@@ -75,6 +99,35 @@ def test_reset_twice_ok(
     assert user.check_password(new_second_password)
 
 
+@override_rest_registration_settings(
+    {
+        "RESET_PASSWORD_VERIFICATION_ONE_TIME_USE": True,
+    }
+)
+def test_one_time_reset_ok_loads_user_once(
+    settings_with_reset_password_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    new_password,
+    django_assert_num_queries,
+):
+    signer = ResetPasswordSigner({"user_id": user.pk})
+    user_signed_data = signer.get_signed_data()
+    user_signed_data["password"] = new_password
+    request = api_factory.create_post_request(user_signed_data)
+    # SELECT user + UPDATE user
+    with django_assert_num_queries(2) as context:
+        response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    user.refresh_from_db()
+    assert user.check_password(new_password)
+    update_sql = context.captured_queries[-1]["sql"]
+    assert update_sql.startswith("UPDATE")
+    assert '"password"' in update_sql
+    assert '"username"' not in update_sql
+
+
 @override_rest_registration_settings(
     {
         "RESET_PASSWORD_VERIFICATION_ONE_TIME_USE": True,
@@ -181,6 +234,146 @@ def test_reset_expired(
     assert user.check_password(old_password)
 
 
+@override_rest_registration_settings(
+    {
+        "RESET_PASSWORD_VERIFICATION_ONE_TIME_USE": True,
+        "VERIFICATION_ONE_TIME_USE_STORE_CLASS": "rest_registration.one_time_use_stores.CacheOneTimeUseStore",  # noqa: E501
+    }
+)
+def test_one_time_reset_with_store_twice_fail(
+    settings_with_reset_password_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    new_password,
+):
+    cache.clear()
+    signer = ResetPasswordSigner({"user_id": user.pk})
+    user_signed_data = signer.get_signed_data()
+    weak_data = {**user_signed_data, "password": "ftayx"}
+    response = api_view_provider.view_func(api_factory.create_post_request(weak_data))
+    assert_response_is_bad_request(response)
+
+    # The rejected password does not make the link used.
+    data = {**user_signed_data, "password": new_password}
+    response = api_view_provider.view_func(api_factory.create_post_request(data))
+    assert_response_is_ok(response)
+    user.refresh_from_db()
+    assert user.check_password(new_password)
+
+    data = {**user_signed_data, "password": "eaWrivtig6"}
+    response = api_view_provider.view_func(api_factory.create_post_request(data))
+    assert_response_is_bad_request(response)
+    user.refresh_from_db()
+    assert user.check_password(new_password)
+    cache.clear()
+
+
+@override_rest_registration_settings(
+    {
+        "RESET_PASSWORD_VERIFICATION_ONE_TIME_USE": True,
+        "VERIFICATION_ONE_TIME_USE_STORE_CLASS": "rest_registration.one_time_use_stores.CacheOneTimeUseStore",  # noqa: E501
+    }
+)
+def test_one_time_reset_with_store_invalidates_other_links(
+    settings_with_reset_password_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    new_password,
+):
+    cache.clear()
+    timestamp = int(time.time())
+    with patch("time.time", side_effect=lambda: timestamp - 60):
+        first_signed_data = ResetPasswordSigner(
+            {"user_id": user.pk}).get_signed_data()
+    second_signed_data = ResetPasswordSigner(
+        {"user_id": user.pk}).get_signed_data()
+
+    data = {**second_signed_data, "password": new_password}
+    response = api_view_provider.view_func(api_factory.create_post_request(data))
+    assert_response_is_ok(response)
+
+    data = {**first_signed_data, "password": "eaWrivtig6"}
+    response = api_view_provider.view_func(api_factory.create_post_request(data))
+    assert_response_is_bad_request(response)
+    user.refresh_from_db()
+    assert user.check_password(new_password)
+    cache.clear()
+
+
+@override_rest_registration_settings(
+    {
+        "RESET_PASSWORD_VERIFICATION_ONE_TIME_USE": True,
+    }
+)
+def test_one_time_reset_fail_after_password_changed(
+    settings_with_reset_password_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    new_password,
+):
+    user_signed_data = ResetPasswordSigner({"user_id": user.pk}).get_signed_data()
+    user.set_password("eaWrivtig6")
+    user.save()
+
+    data = {**user_signed_data, "password": new_password}
+    response = api_view_provider.view_func(api_factory.create_post_request(data))
+    assert_response_is_bad_request(response)
+    user.refresh_from_db()
+    assert user.check_password("eaWrivtig6")
+
+
+@override_rest_registration_settings(
+    {
+        "RESET_PASSWORD_VERIFICATION_ONE_TIME_USE": True,
+    }
+)
+def test_reset_expired_no_queries_nor_password_validation(
+    settings_with_reset_password_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    new_password,
+    django_assert_num_queries,
+):
+    timestamp = int(time.time())
+    with patch("time.time", side_effect=lambda: timestamp):
+        signer = ResetPasswordSigner({"user_id": user.pk})
+        user_signed_data = signer.get_signed_data()
+    user_signed_data["password"] = new_password
+    request = api_factory.create_post_request(user_signed_data)
+
+    with patch("time.time", side_effect=lambda: timestamp + 3600 * 24 * 8), patch(
+        "rest_registration.utils.validation.validate_password"
+    ) as validate_password, django_assert_num_queries(0):
+        response = api_view_provider.view_func(request)
+    assert_response_is_bad_request(response)
+    validate_password.assert_not_called()
+
+
+def test_reset_forged_signature_no_queries_nor_password_validation(
+    settings_with_reset_password_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    user_signed_data,
+    new_password,
+    django_assert_num_queries,
+):
+    user_signed_data["signature"] = "a" + user_signed_data["signature"]
+    user_signed_data["password"] = new_password
+    request = api_factory.create_post_request(user_signed_data)
+
+    with patch(
+        "rest_registration.utils.validation.validate_password"
+    ) as validate_password, django_assert_num_queries(0):
+        response = api_view_provider.view_func(request)
+    assert_response_is_bad_request(response)
+    validate_password.assert_not_called()
+
+
 @pytest.fixture
 def api_view_provider():
     return ViewProvider("reset-password")
@@ -334,6 +527,23 @@ def test_when_password_same_as_username_then_failure(
     assert user.check_password(old_password)
 
 
+def test_serializer_validates_password_unless_deferred(
+    settings_with_reset_password_verification,
+    user,
+    user_signed_data,
+):
+    user_signed_data["password"] = user.username
+    serializer = ResetPasswordSerializer(data=user_signed_data)
+    assert not serializer.is_valid()
+    assert "password" in serializer.errors
+
+    serializer = ResetPasswordSerializer(
+        data=user_signed_data,
+        context={PASSWORD_VALIDATION_DEFERRED_CONTEXT_KEY: True},
+    )
+    assert serializer.is_valid()
+
+
 def _assert_response_is_bad_password(
     request,
     expected_error_message,
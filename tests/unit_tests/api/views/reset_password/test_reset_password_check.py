@@ -0,0 +1,96 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from rest_registration.api.views.reset_password import ResetPasswordSigner
+from tests.helpers.api_views import (
+    assert_response_is_bad_request,
+    assert_response_is_ok,
+)
+from tests.helpers.settings import override_rest_registration_settings
+from tests.helpers.views import ViewProvider
+
+
+def test_ok(
+    settings_with_reset_password_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    django_assert_num_queries,
+):
+    signer = ResetPasswordSigner({"user_id": user.pk})
+    request = api_factory.create_get_request(signer.get_signed_data())
+    with django_assert_num_queries(0):
+        response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    assert response.data["signature_checked"] is True
+    assert "private" in response["Cache-Control"]
+
+
+@override_rest_registration_settings(
+    {
+        "RESET_PASSWORD_VERIFICATION_ONE_TIME_USE": True,
+        "VERIFICATION_ONE_TIME_USE_STORE_CLASS": "rest_registration.one_time_use_stores.CacheOneTimeUseStore",  # noqa: E501
+    }
+)
+def test_one_time_use_signature_not_checked(
+    settings_with_reset_password_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    django_assert_num_queries,
+):
+    signer = ResetPasswordSigner({"user_id": user.pk})
+    data = signer.get_signed_data()
+    data["signature"] += "blah"
+    request = api_factory.create_get_request(data)
+    with django_assert_num_queries(0):
+        response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    assert response.data["signature_checked"] is False
+    assert response.data["detail"] != "Verification link is valid"
+    assert response["Cache-Control"] == "private, no-cache"
+
+
+@override_rest_registration_settings(
+    {
+        "RESET_PASSWORD_VERIFICATION_ONE_TIME_USE": True,
+    }
+)
+def test_expired(
+    settings_with_reset_password_verification,
+    api_view_provider,
+    api_factory,
+    user,
+    django_assert_num_queries,
+):
+    timestamp = int(time.time())
+    with patch("time.time", side_effect=lambda: timestamp):
+        signer = ResetPasswordSigner({"user_id": user.pk})
+        request = api_factory.create_get_request(signer.get_signed_data())
+    with patch("time.time", side_effect=lambda: timestamp + 3600 * 24 * 8):
+        with django_assert_num_queries(0):
+            response = api_view_provider.view_func(request)
+    assert_response_is_bad_request(response)
+    assert response.data["detail"].code == "signature-expired"
+
+
+def test_tampered_timestamp(
+    settings_with_reset_password_verification,
+    api_view_provider,
+    api_factory,
+    user,
+):
+    signer = ResetPasswordSigner({"user_id": user.pk})
+    data = signer.get_signed_data()
+    data["timestamp"] += 1
+    request = api_factory.create_get_request(data)
+    response = api_view_provider.view_func(request)
+    assert_response_is_bad_request(response)
+    assert response.data["detail"].code == "signature-invalid"
+
+
+@pytest.fixture
+def api_view_provider():
+    return ViewProvider("reset-password-check")
@@ -1,8 +1,11 @@
 import pytest
 from rest_framework.test import force_authenticate
 
-from tests.helpers.api_views import assert_response_is_ok
-from tests.helpers.constants import USERNAME
+from tests.helpers.api_views import (
+    assert_response_is_bad_request,
+    assert_response_is_ok,
+)
+from tests.helpers.constants import USERNAME, USERNAME2
 from tests.helpers.views import ViewProvider
 
 
@@ -93,6 +96,71 @@ def test_patch_id_nochange(
     assert user.last_name == old_last_name
 
 
+def test_patch_unchanged_username_no_queries(
+    settings_minimal,
+    user,
+    api_view_provider,
+    api_factory,
+    django_assert_num_queries,
+):
+    request = api_factory.create_patch_request(
+        {
+            "username": USERNAME,
+        }
+    )
+    force_authenticate(request, user=user)
+    with django_assert_num_queries(0):
+        response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    assert response.data["username"] == USERNAME
+
+
+def test_patch_updates_changed_fields_only(
+    settings_minimal,
+    user,
+    api_view_provider,
+    api_factory,
+    django_assert_num_queries,
+):
+    request = api_factory.create_patch_request(
+        {
+            "username": USERNAME,
+            "first_name": "Donald",
+        }
+    )
+    force_authenticate(request, user=user)
+    # UPDATE user
+    with django_assert_num_queries(1) as context:
+        response = api_view_provider.view_func(request)
+    assert_response_is_ok(response)
+    update_sql = context.captured_queries[0]["sql"]
+    assert '"first_name"' in update_sql
+    assert '"username"' not in update_sql
+    user.refresh_from_db()
+    assert user.username == USERNAME
+    assert user.first_name == "Donald"
+
+
+def test_patch_username_already_used_fail(
+    settings_minimal,
+    user,
+    user2_with_user_new_email,
+    api_view_provider,
+    api_factory,
+):
+    request = api_factory.create_patch_request(
+        {
+            "username": USERNAME2,
+        }
+    )
+    force_authenticate(request, user=user)
+    response = api_view_provider.view_func(request)
+    assert_response_is_bad_request(response)
+    assert "username" in response.data
+    user.refresh_from_db()
+    assert user.username == USERNAME
+
+
 @pytest.fixture
 def api_view_provider():
     return ViewProvider("profile")
@@ -0,0 +1,118 @@
+import pytest
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+from rest_registration.auth_token_managers import (
+    CachedRestFrameworkAuthTokenManager,
+    CachedTokenAuthentication,
+)
+from rest_registration.exceptions import AuthTokenError
+from tests.helpers.settings import override_rest_registration_settings
+
+
+@pytest.fixture
+def auth_token_manager():
+    return CachedRestFrameworkAuthTokenManager()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def settings_with_cached_token_manager():
+    with override_rest_registration_settings({
+        "AUTH_TOKEN_MANAGER_CLASS": "rest_registration.auth_token_managers.CachedRestFrameworkAuthTokenManager",  # noqa: E501
+    }):
+        yield
+
+
+def test_token_receivers_connected():
+    assert post_save.has_listeners(Token)
+    assert post_delete.has_listeners(Token)
+
+
+def test_provide_token_creates_token(
+        user, auth_token_manager, django_assert_num_queries):
+    with django_assert_num_queries(3):
+        token_key = auth_token_manager.provide_token(user)
+    assert_token_keys_equals(user, [token_key])
+
+
+def test_provide_token_uses_cache(
+        user, user_token_obj, auth_token_manager, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert auth_token_manager.provide_token(user) == user_token_obj.key
+    with django_assert_num_queries(0):
+        assert auth_token_manager.provide_token(user) == user_token_obj.key
+
+
+def test_when_token_revoked_then_new_token_provided(
+        user, user_token_obj, auth_token_manager):
+    auth_token_manager.provide_token(user)
+    auth_token_manager.revoke_token(user)
+    assert_token_keys_equals(user, [])
+
+    token_key = auth_token_manager.provide_token(user)
+    assert token_key != user_token_obj.key
+    assert_token_keys_equals(user, [token_key])
+
+
+def test_when_token_deleted_then_new_token_provided(
+        user, user_token_obj, auth_token_manager):
+    auth_token_manager.provide_token(user)
+    user_token_obj.delete()
+
+    token_key = auth_token_manager.provide_token(user)
+    assert token_key != user_token_obj.key
+    assert_token_keys_equals(user, [token_key])
+
+
+def test_when_no_token_then_revoke_token_fails(
+        user, auth_token_manager):
+    with pytest.raises(AuthTokenError):
+        auth_token_manager.revoke_token(user)
+    assert_token_keys_equals(user, [])
+
+
+def test_revoke_tokens_invalidates_cache(
+        user, user_token_obj, user2_with_user_new_email, auth_token_manager,
+        django_assert_num_queries):
+    user2 = user2_with_user_new_email
+    user2_token_obj = Token.objects.create(user=user2)
+    auth_token_manager.provide_token(user)
+    authenticate(user_token_obj.key)
+    users = type(user).objects.filter(pk__in=[user.pk, user2.pk])
+    # SELECT token keys + DELETE tokens
+    with django_assert_num_queries(2):
+        assert auth_token_manager.revoke_tokens(users) == 2
+    assert_token_keys_equals(user, [])
+    assert_token_keys_equals(user2, [])
+
+    with pytest.raises(AuthenticationFailed):
+        authenticate(user_token_obj.key)
+    with pytest.raises(AuthenticationFailed):
+        authenticate(user2_token_obj.key)
+    assert auth_token_manager.provide_token(user) != user_token_obj.key
+
+
+def test_revoke_tokens_without_tokens(user, auth_token_manager):
+    assert auth_token_manager.revoke_tokens([user]) == 0
+
+
+def authenticate(token_key):
+    request = APIRequestFactory().get(
+        "/", HTTP_AUTHORIZATION=f"Token {token_key}")
+    return CachedTokenAuthentication().authenticate(request)
+
+
+def assert_token_keys_equals(user, expected_token_keys):
+    assert [
+        t.key for t in Token.objects.filter(user=user)
+    ] == expected_token_keys
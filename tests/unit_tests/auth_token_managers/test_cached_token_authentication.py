@@ -0,0 +1,100 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+from rest_registration.auth_token_managers import (
+    CachedTokenAuthentication,
+    RestFrameworkAuthTokenManager,
+    build_token_user_cache_key,
+)
+from rest_registration.utils.cache import hash_cache_key_part
+from tests.helpers.settings import override_rest_registration_settings
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def settings_with_cached_token_manager():
+    with override_rest_registration_settings({
+        "AUTH_TOKEN_MANAGER_CLASS": "rest_registration.auth_token_managers.CachedRestFrameworkAuthTokenManager",  # noqa: E501
+    }):
+        yield
+
+
+def test_authenticate_uses_cache(user, user_token_obj):
+    authenticated_user, token_key = authenticate(user_token_obj.key)
+    assert authenticated_user == user
+    assert token_key == user_token_obj.key
+
+    with CaptureQueriesContext(connection) as context:
+        authenticated_user, _ = authenticate(user_token_obj.key)
+    assert authenticated_user == user
+    assert len(context.captured_queries) == 1
+    assert 'authtoken_token' not in context.captured_queries[0]['sql']
+
+
+def test_authenticate_caches_only_user_pk(user, user_token_obj):
+    authenticate(user_token_obj.key)
+    cache_key = build_token_user_cache_key(
+        hash_cache_key_part(user_token_obj.key))
+    assert cache.get(cache_key) == user.pk
+
+
+def test_authenticate_fails_for_replaced_token_of_same_user(
+        user, user_token_obj):
+    old_token_key = user_token_obj.key
+    authenticate(old_token_key)
+    user_token_obj.delete()
+    new_token_obj = type(user_token_obj).objects.create(
+        key='x' * 40, user=user)
+    authenticate(new_token_obj.key)
+
+    with pytest.raises(AuthenticationFailed):
+        authenticate(old_token_key)
+    authenticated_user, _ = authenticate(new_token_obj.key)
+    assert authenticated_user == user
+
+
+def test_authenticate_fails_after_revoke(user, user_token_obj):
+    authenticate(user_token_obj.key)
+    RestFrameworkAuthTokenManager().revoke_token(user)
+    with pytest.raises(AuthenticationFailed):
+        authenticate(user_token_obj.key)
+
+
+def test_authenticate_fails_after_token_deleted(user, user_token_obj):
+    authenticate(user_token_obj.key)
+    user_token_obj.delete()
+    with pytest.raises(AuthenticationFailed):
+        authenticate(user_token_obj.key)
+
+
+def test_authenticate_fails_after_user_deactivated(user, user_token_obj):
+    authenticate(user_token_obj.key)
+    user.is_active = False
+    user.save()
+    with pytest.raises(AuthenticationFailed):
+        authenticate(user_token_obj.key)
+
+
+def test_authenticate_reloads_user_after_user_saved(user, user_token_obj):
+    authenticate(user_token_obj.key)
+    user.first_name = 'John'
+    user.save()
+
+    authenticated_user, _ = authenticate(user_token_obj.key)
+    assert authenticated_user.first_name == 'John'
+
+
+def authenticate(token_key):
+    request = APIRequestFactory().get(
+        '/', HTTP_AUTHORIZATION=f'Token {token_key}')
+    return CachedTokenAuthentication().authenticate(request)
@@ -1,4 +1,5 @@
 import pytest
+from django.db.models.signals import post_delete, post_save
 from rest_framework.authtoken.models import Token
 
 from rest_registration.auth_token_managers import RestFrameworkAuthTokenManager
@@ -32,7 +33,35 @@ def test_when_token_created_then_revoke_token_fails_with_another_token(
     assert_token_keys_equals(user, [token_key])
 
 
+def test_token_receivers_not_connected():
+    # The fast (signal-less) deletes of the tokens are not blocked.
+    assert not post_save.has_listeners(Token)
+    assert not post_delete.has_listeners(Token)
+
+
 def assert_token_keys_equals(user, expected_token_keys):
     assert [
         t.key for t in Token.objects.filter(user=user)
     ] == expected_token_keys
+
+
+def test_revoke_tokens_with_queryset(
+        user, user_token_obj, user2_with_user_new_email, auth_token_manager,
+        django_assert_num_queries):
+    user2 = user2_with_user_new_email
+    Token.objects.create(user=user2)
+    users = type(user).objects.filter(pk__in=[user.pk, user2.pk])
+    # Single DELETE statement, the tokens are not loaded.
+    with django_assert_num_queries(1) as context:
+        assert auth_token_manager.revoke_tokens(users) == 2
+    assert context.captured_queries[0]["sql"].startswith("DELETE")
+    assert_token_keys_equals(user, [])
+    assert_token_keys_equals(user2, [])
+
+
+def test_revoke_tokens_skips_users_without_token(
+        user, user2_with_user_new_email, auth_token_manager):
+    user2 = user2_with_user_new_email
+    token_obj = Token.objects.create(user=user2)
+    assert auth_token_manager.revoke_tokens([user, user2]) == 1
+    assert not Token.objects.filter(pk=token_obj.pk).exists()
@@ -0,0 +1,126 @@
+import time
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+from rest_registration.auth_token_managers import (
+    SignedAuthTokenManager,
+    SignedTokenAuthentication,
+)
+from rest_registration.exceptions import AuthTokenError
+
+
+@pytest.fixture
+def auth_token_manager():
+    return SignedAuthTokenManager()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_provide_token_reads_key_version_through_cache(
+        user, auth_token_manager, django_assert_num_queries):
+    auth_token_manager.provide_token(user)
+    with django_assert_num_queries(0):
+        token = auth_token_manager.provide_token(user)
+    assert token
+
+
+def test_authenticate_ok(user, auth_token_manager, django_assert_num_queries):
+    token = auth_token_manager.provide_token(user)
+    with django_assert_num_queries(1):
+        authenticated_user, auth_token = authenticate(token)
+    assert authenticated_user == user
+    assert auth_token == token
+
+
+def test_authenticate_fails_with_tampered_token(user, auth_token_manager):
+    token = auth_token_manager.provide_token(user)
+    with pytest.raises(AuthenticationFailed):
+        authenticate(token + 'x')
+
+
+def test_authenticate_fails_with_expired_token(user, auth_token_manager):
+    timestamp = int(time.time())
+    with patch("time.time", side_effect=lambda: timestamp):
+        token = auth_token_manager.provide_token(user)
+    with patch("time.time", side_effect=lambda: timestamp + 3600 * 24 * 31):
+        with pytest.raises(AuthenticationFailed):
+            authenticate(token)
+
+
+def test_authenticate_fails_after_revoke(user, auth_token_manager):
+    token = auth_token_manager.provide_token(user)
+    auth_token_manager.revoke_token(user)
+    with pytest.raises(AuthenticationFailed):
+        authenticate(token)
+
+    new_token = auth_token_manager.provide_token(user)
+    authenticated_user, _ = authenticate(new_token)
+    assert authenticated_user == user
+
+
+def test_authenticate_fails_after_password_change(
+        user, password_change, auth_token_manager):
+    token = auth_token_manager.provide_token(user)
+    user.set_password(password_change.new_value)
+    user.save()
+    with pytest.raises(AuthenticationFailed):
+        authenticate(token)
+
+
+def test_authenticate_ok_when_key_version_evicted(user, auth_token_manager):
+    token = auth_token_manager.provide_token(user)
+    cache.clear()
+    authenticated_user, _ = authenticate(token)
+    assert authenticated_user == user
+
+
+def test_authenticate_fails_after_revoke_when_key_version_evicted(
+        user, auth_token_manager):
+    token = auth_token_manager.provide_token(user)
+    auth_token_manager.revoke_token(user)
+    cache.clear()
+    with pytest.raises(AuthenticationFailed):
+        authenticate(token)
+
+
+def test_authenticate_fails_for_inactive_user(user, auth_token_manager):
+    token = auth_token_manager.provide_token(user)
+    user.is_active = False
+    user.save()
+    with pytest.raises(AuthenticationFailed):
+        authenticate(token)
+
+
+def test_revoke_token_fails_with_token_of_another_user(
+        user, user2_with_user_new_email, auth_token_manager):
+    token = auth_token_manager.provide_token(user2_with_user_new_email)
+    with pytest.raises(AuthTokenError):
+        auth_token_manager.revoke_token(user, token=token)
+
+
+def authenticate(token):
+    request = APIRequestFactory().get(
+        '/', HTTP_AUTHORIZATION=f'Token {token}')
+    return SignedTokenAuthentication().authenticate(request)
+
+
+def test_authenticate_fails_after_revoke_tokens(
+        user, user2_with_user_new_email, auth_token_manager):
+    user2 = user2_with_user_new_email
+    token = auth_token_manager.provide_token(user)
+    token2 = auth_token_manager.provide_token(user2)
+    users = type(user).objects.filter(pk=user.pk)
+    assert auth_token_manager.revoke_tokens(users) == 1
+    with pytest.raises(AuthenticationFailed):
+        authenticate(token)
+    authenticated_user, _ = authenticate(token2)
+    assert authenticated_user == user2
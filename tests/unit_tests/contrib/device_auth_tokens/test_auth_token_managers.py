@@ -0,0 +1,92 @@
+import pytest
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+from rest_registration.contrib.device_auth_tokens.auth_token_managers import (
+    DeviceAuthTokenManager,
+    DeviceTokenAuthentication,
+)
+from rest_registration.contrib.device_auth_tokens.models import DeviceAuthToken
+from rest_registration.exceptions import AuthTokenError
+
+
+@pytest.fixture
+def auth_token_manager():
+    return DeviceAuthTokenManager()
+
+
+def test_provide_token_creates_new_token_each_time(user, auth_token_manager):
+    token1 = auth_token_manager.provide_token(user)
+    token2 = auth_token_manager.provide_token(user)
+    assert token1 != token2
+    assert DeviceAuthToken.objects.filter(user=user).count() == 2
+
+
+def test_token_not_stored_in_plaintext(user, auth_token_manager):
+    token = auth_token_manager.provide_token(user)
+    token_obj = DeviceAuthToken.objects.get(user=user)
+    assert token_obj.digest != token
+    assert token.startswith(token_obj.prefix)
+    assert token_obj.matches(token)
+
+
+def test_authenticate_ok(user, auth_token_manager, django_assert_num_queries):
+    token = auth_token_manager.provide_token(user)
+    with django_assert_num_queries(1):
+        authenticated_user, auth_token = authenticate(token)
+    assert authenticated_user == user
+    assert auth_token == token
+
+
+def test_authenticate_fails_with_token_with_same_prefix(user, auth_token_manager):
+    token = auth_token_manager.provide_token(user)
+    tampered_token = token[:-1] + ('0' if token[-1] != '0' else '1')
+    with pytest.raises(AuthenticationFailed):
+        authenticate(tampered_token)
+
+
+def test_revoke_token_revokes_only_given_token(user, auth_token_manager):
+    token1 = auth_token_manager.provide_token(user)
+    token2 = auth_token_manager.provide_token(user)
+    auth_token_manager.revoke_token(user, token=token1)
+    with pytest.raises(AuthenticationFailed):
+        authenticate(token1)
+    authenticated_user, _ = authenticate(token2)
+    assert authenticated_user == user
+
+
+def test_revoke_token_fails_with_token_of_another_user(
+        user, user2_with_user_new_email, auth_token_manager):
+    token = auth_token_manager.provide_token(user2_with_user_new_email)
+    with pytest.raises(AuthTokenError):
+        auth_token_manager.revoke_token(user, token=token)
+    assert DeviceAuthToken.objects.count() == 1
+
+
+def test_revoke_token_without_token_revokes_all_tokens(user, auth_token_manager):
+    auth_token_manager.provide_token(user)
+    auth_token_manager.provide_token(user)
+    auth_token_manager.revoke_token(user)
+    assert not DeviceAuthToken.objects.filter(user=user).exists()
+
+
+def test_when_no_token_then_revoke_token_fails(user, auth_token_manager):
+    with pytest.raises(AuthTokenError):
+        auth_token_manager.revoke_token(user)
+
+
+def test_revoke_tokens(user, user2_with_user_new_email, auth_token_manager):
+    auth_token_manager.provide_token(user)
+    auth_token_manager.provide_token(user)
+    auth_token_manager.provide_token(user2_with_user_new_email)
+    users = type(user).objects.filter(pk=user.pk)
+    assert auth_token_manager.revoke_tokens(users) == 2
+    assert list(DeviceAuthToken.objects.values_list('user_id', flat=True)) == [
+        user2_with_user_new_email.pk,
+    ]
+
+
+def authenticate(token):
+    request = APIRequestFactory().get(
+        '/', HTTP_AUTHORIZATION=f'Token {token}')
+    return DeviceTokenAuthentication().authenticate(request)
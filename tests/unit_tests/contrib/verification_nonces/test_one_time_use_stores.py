@@ -0,0 +1,56 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from rest_registration.contrib.verification_nonces.models import (
+    UsedVerificationNonce,
+)
+from rest_registration.contrib.verification_nonces.one_time_use_stores import (
+    DatabaseOneTimeUseStore,
+)
+
+
+@pytest.fixture
+def store():
+    return DatabaseOneTimeUseStore()
+
+
+@pytest.mark.django_db
+def test_consume_once(store):
+    timeout = datetime.timedelta(days=1)
+    assert store.consume("nonce1", timeout)
+    assert not store.consume("nonce1", timeout)
+    assert store.consume("nonce2", timeout)
+    assert UsedVerificationNonce.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_consume_without_timeout(store):
+    assert store.consume("nonce1", None)
+    assert not store.consume("nonce1", None)
+    assert UsedVerificationNonce.objects.get(nonce="nonce1").expires is None
+
+
+@pytest.mark.django_db
+def test_consume_expired_again(store):
+    UsedVerificationNonce.objects.create(
+        nonce="nonce1",
+        expires=timezone.now() - datetime.timedelta(seconds=1),
+    )
+    assert store.consume("nonce1", datetime.timedelta(days=1))
+    assert not store.consume("nonce1", datetime.timedelta(days=1))
+    assert UsedVerificationNonce.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_delete_expired(store):
+    store.consume("nonce1", datetime.timedelta(days=1))
+    UsedVerificationNonce.objects.create(
+        nonce="nonce2",
+        expires=timezone.now() - datetime.timedelta(seconds=1),
+    )
+    assert UsedVerificationNonce.objects.delete_expired() == 1
+    assert list(
+        UsedVerificationNonce.objects.values_list("nonce", flat=True)
+    ) == ["nonce1"]
@@ -27,6 +27,23 @@ def test_ok(
     assert user.is_active
 
 
+def test_ok_with_token(
+    settings_with_verification_redirects_urls,
+    settings_with_register_verification_redirects,
+    view_provider,
+    http_client,
+    inactive_user,
+):
+    user = inactive_user
+    signer = RegisterSigner({"user_id": user.pk})
+    response = http_client.get(
+        view_provider.view_url, data={"token": signer.get_signed_token()})
+    assert response.status_code == 302
+    assert response.url == SUCCESS_URL
+    user.refresh_from_db()
+    assert user.is_active
+
+
 def test_tampered_signature(
     settings_with_verification_redirects_urls,
     settings_with_register_verification_redirects,
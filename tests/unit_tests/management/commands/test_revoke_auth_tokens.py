@@ -0,0 +1,57 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from rest_framework.authtoken.models import Token
+
+from tests.helpers.common import create_test_user
+
+
+@pytest.fixture
+def users_with_tokens(db):
+    users = [
+        create_test_user(username=f'user{i}', email=f'user{i}@example.com')
+        for i in range(5)
+    ]
+    for user in users:
+        Token.objects.create(user=user)
+    return users
+
+
+def test_revoke_all_tokens(users_with_tokens):
+    out = StringIO()
+    call_command('revoke_auth_tokens', '--noinput', '--chunk-size=2', stdout=out)
+    assert not Token.objects.exists()
+    output = out.getvalue()
+    assert "Processed 2 users" in output
+    assert "Processed 4 users" in output
+    assert "Done: processed 5 users, revoked 5 tokens" in output
+
+
+def test_revoke_tokens_resumed(users_with_tokens):
+    start_after_pk = users_with_tokens[2].pk
+    call_command(
+        'revoke_auth_tokens', '--noinput', f'--start-after-pk={start_after_pk}',
+        stdout=StringIO())
+    assert sorted(Token.objects.values_list('user_id', flat=True)) == [
+        user.pk for user in users_with_tokens[:3]
+    ]
+
+
+def test_revoke_tokens_only_active(users_with_tokens):
+    inactive_user = users_with_tokens[0]
+    inactive_user.is_active = False
+    inactive_user.save()
+    call_command(
+        'revoke_auth_tokens', '--noinput', '--only-active', stdout=StringIO())
+    assert list(Token.objects.values_list('user_id', flat=True)) == [
+        inactive_user.pk,
+    ]
+
+
+def test_revoke_tokens_cancelled(users_with_tokens, monkeypatch):
+    monkeypatch.setattr('builtins.input', lambda msg: 'no')
+    with pytest.raises(CommandError):
+        call_command('revoke_auth_tokens', stdout=StringIO())
+    assert Token.objects.count() == len(users_with_tokens)
@@ -4,6 +4,7 @@ from django.test.utils import override_settings
 
 from rest_registration.auth_token_managers import AbstractAuthTokenManager
 from rest_registration.checks import ErrorCode, WarningCode
+from rest_registration.one_time_use_stores import AbstractOneTimeUseStore
 from rest_registration.settings import DEFAULTS
 from tests.helpers.settings import override_rest_registration_settings
 
@@ -51,6 +52,85 @@ def test_checks_multiple_time_auto_login():
     ])
 
 
+@override_settings(
+    REST_REGISTRATION={
+        'REGISTER_VERIFICATION_ENABLED': False,
+        'REGISTER_EMAIL_VERIFICATION_ENABLED': False,
+        'RESET_PASSWORD_VERIFICATION_ENABLED': False,
+        'LOGIN_PASSWORD_HASH_UPGRADE_DEFERRED': True,
+    },
+)
+def test_checks_password_hash_upgrade_not_deferred():
+    errors = simulate_checks()
+    assert_error_codes_match(errors, [
+        WarningCode.LOGIN_PASSWORD_HASH_UPGRADE_NOT_DEFERRED,
+    ])
+
+
+@override_settings(
+    REST_REGISTRATION={
+        'REGISTER_VERIFICATION_ENABLED': False,
+        'REGISTER_EMAIL_VERIFICATION_ENABLED': False,
+        'RESET_PASSWORD_VERIFICATION_ENABLED': False,
+        'READ_REPLICA_DB_ALIAS': 'nonexistent',
+    },
+)
+def test_checks_invalid_read_replica_db_alias():
+    errors = simulate_checks()
+    assert_error_codes_match(errors, [
+        ErrorCode.INVALID_READ_REPLICA_DB_ALIAS,
+    ])
+
+
+class NotInstalledOneTimeUseStore(AbstractOneTimeUseStore):
+
+    def get_app_names(self):
+        return ['tests.testapps.not_installed']
+
+
+@override_settings(
+    REST_REGISTRATION={
+        'REGISTER_VERIFICATION_ENABLED': False,
+        'REGISTER_EMAIL_VERIFICATION_ENABLED': False,
+        'RESET_PASSWORD_VERIFICATION_ENABLED': False,
+        'VERIFICATION_ONE_TIME_USE_STORE_CLASS': AbstractOneTimeUseStore,
+    },
+)
+def test_checks_invalid_one_time_use_store_class():
+    errors = simulate_checks()
+    assert_error_codes_match(errors, [
+        ErrorCode.INVALID_ONE_TIME_USE_STORE_CLASS,
+    ])
+
+
+@override_settings(
+    REST_REGISTRATION={
+        'REGISTER_VERIFICATION_ENABLED': False,
+        'REGISTER_EMAIL_VERIFICATION_ENABLED': False,
+        'RESET_PASSWORD_VERIFICATION_ENABLED': False,
+        'VERIFICATION_ONE_TIME_USE_STORE_CLASS': NotInstalledOneTimeUseStore,
+    },
+)
+def test_checks_one_time_use_store_app_not_installed():
+    errors = simulate_checks()
+    assert_error_codes_match(errors, [
+        ErrorCode.INVALID_ONE_TIME_USE_STORE_CLASS,
+    ])
+
+
+@override_settings(
+    REST_REGISTRATION={
+        'REGISTER_VERIFICATION_ENABLED': False,
+        'REGISTER_EMAIL_VERIFICATION_ENABLED': False,
+        'RESET_PASSWORD_VERIFICATION_ENABLED': False,
+        'VERIFICATION_ONE_TIME_USE_STORE_CLASS': 'rest_registration.contrib.verification_nonces.one_time_use_stores.DatabaseOneTimeUseStore',  # noqa: E501
+    },
+)
+def test_checks_database_one_time_use_store_ok():
+    errors = simulate_checks()
+    assert_error_codes_match(errors, [])
+
+
 @override_settings(
     REST_REGISTRATION={
         'REGISTER_VERIFICATION_ENABLED': False,
@@ -326,6 +406,53 @@ def test_when_custom_authtokenmanager_wrt_specs_then_check_succeeds():
     assert_error_codes_match(errors, [])
 
 
+SIGNED_AUTH_TOKEN_SETTINGS = {
+    'AUTH_TOKEN_MANAGER_CLASS': 'rest_registration.auth_token_managers.SignedAuthTokenManager',  # noqa: E501
+}
+SIGNED_AUTH_TOKEN_REST_FRAMEWORK_SETTINGS = {
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'rest_registration.auth_token_managers.SignedTokenAuthentication',
+    ],
+}
+
+
+@override_settings(
+    REST_FRAMEWORK=SIGNED_AUTH_TOKEN_REST_FRAMEWORK_SETTINGS,
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    },
+)
+@override_rest_registration_settings(SIGNED_AUTH_TOKEN_SETTINGS)
+def test_when_signed_authtokenmanager_with_local_cache_then_check_fails():
+    errors = simulate_checks()
+    assert_error_codes_match(errors, [
+        ErrorCode.NON_SHARED_AUTH_TOKEN_CACHE,
+    ])
+
+
+@override_settings(
+    REST_FRAMEWORK=SIGNED_AUTH_TOKEN_REST_FRAMEWORK_SETTINGS,
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+        'shared': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'cache_table',
+        },
+    },
+)
+@override_rest_registration_settings({
+    **SIGNED_AUTH_TOKEN_SETTINGS,
+    'CACHE_ALIAS': 'shared',
+})
+def test_when_signed_authtokenmanager_with_shared_cache_then_check_succeeds():
+    errors = simulate_checks()
+    assert_error_codes_match(errors, [])
+
+
 class InvalidAuthTokenManager:
     pass
 
@@ -0,0 +1,56 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from rest_registration.one_time_use_stores import (
+    CacheOneTimeUseStore,
+    get_one_time_use_store,
+)
+from tests.helpers.settings import override_rest_registration_settings
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def store():
+    return CacheOneTimeUseStore()
+
+
+def test_consume_once(store):
+    timeout = datetime.timedelta(days=1)
+    assert store.consume("nonce1", timeout)
+    assert not store.consume("nonce1", timeout)
+    assert store.consume("nonce2", timeout)
+
+
+def test_consume_without_timeout(store):
+    assert store.consume("nonce1", None)
+    assert not store.consume("nonce1", None)
+
+
+def test_consume_passes_timeout_to_cache(store):
+    with patch(
+        "rest_registration.one_time_use_stores.get_cache"
+    ) as get_cache:
+        store.consume("nonce1", datetime.timedelta(hours=2))
+    assert get_cache.return_value.add.call_args.kwargs["timeout"] == 7200
+
+
+def test_get_one_time_use_store_not_set():
+    assert get_one_time_use_store() is None
+
+
+@override_rest_registration_settings(
+    {
+        "VERIFICATION_ONE_TIME_USE_STORE_CLASS": "rest_registration.one_time_use_stores.CacheOneTimeUseStore",  # noqa: E501
+    }
+)
+def test_get_one_time_use_store():
+    assert isinstance(get_one_time_use_store(), CacheOneTimeUseStore)
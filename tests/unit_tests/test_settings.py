@@ -1,3 +1,6 @@
+from collections import OrderedDict
+from unittest.mock import patch
+
 import pytest
 from django.test.utils import override_settings
 
@@ -33,3 +36,54 @@ def settings_defaults():
         'A': 2,
         'B': 3,
     }
+
+
+def test_compiled_settings_resolve_import_strings(settings_defaults):
+    settings_defaults['C'] = 'collections.OrderedDict'
+    settings = NestedSettings(
+        {'A': 1}, settings_defaults, ('C',), 'NESTED_TEST_SETTING')
+    compiled = settings.compile()
+
+    assert compiled.A == 1
+    assert compiled.C is OrderedDict
+    assert settings.C is OrderedDict
+    assert not settings.is_default('A')
+    assert settings.is_default('B')
+    with pytest.raises(AttributeError):
+        compiled.A = 2
+
+
+def test_compiled_settings_swapped_on_reset(settings_defaults):
+    with override_settings(REST_REGISTRATION={'A': 5}):
+        settings = NestedSettings(
+            None, settings_defaults, (), 'REST_REGISTRATION')
+        compiled = settings.compile()
+        assert settings.A == 5
+
+    settings.reset_user_settings()
+    settings.reset_attr_cache()
+    assert settings.A == 2
+    assert compiled.A == 5
+
+
+def test_compiled_settings_invalid_import_string(settings_defaults):
+    settings_defaults['C'] = 'nonexistent_module.Class'
+    settings = NestedSettings(
+        None, settings_defaults, ('C',), 'NESTED_TEST_SETTING')
+    settings.compile()
+
+    assert settings.A == 2
+    with pytest.raises(ImportError):
+        settings.C  # pylint: disable=pointless-statement
+
+
+def test_compiled_settings_propagate_non_import_errors(settings_defaults):
+    settings_defaults['C'] = 'collections.OrderedDict'
+    settings = NestedSettings(
+        None, settings_defaults, ('C',), 'NESTED_TEST_SETTING')
+    with patch(
+        'rest_registration.utils.nested_settings.perform_import',
+        side_effect=RuntimeError,
+    ):
+        with pytest.raises(RuntimeError):
+            settings.compile()
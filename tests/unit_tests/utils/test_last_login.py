@@ -0,0 +1,107 @@
+import datetime
+import time
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.signals import user_logged_in
+from django.core.signals import request_finished
+from django.utils import timezone
+
+from rest_registration.utils.last_login import (
+    flush_last_login_updates,
+    has_buffered_last_login_updates,
+)
+from tests.helpers.settings import override_rest_registration_settings
+
+
+def test_last_login_updated_by_default(user, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        send_user_logged_in(user)
+    user.refresh_from_db()
+    assert user.last_login is not None
+
+
+@override_rest_registration_settings({
+    'LOGIN_LAST_LOGIN_UPDATE_GRANULARITY': datetime.timedelta(minutes=5),
+})
+def test_last_login_update_skipped_within_granularity(
+        user, django_assert_num_queries):
+    recent_last_login = timezone.now() - datetime.timedelta(minutes=1)
+    user.last_login = recent_last_login
+    user.save()
+
+    with django_assert_num_queries(0):
+        send_user_logged_in(user)
+    user.refresh_from_db()
+    assert user.last_login == recent_last_login
+
+
+@override_rest_registration_settings({
+    'LOGIN_LAST_LOGIN_UPDATE_GRANULARITY': datetime.timedelta(minutes=5),
+})
+def test_last_login_updated_after_granularity(user, django_assert_num_queries):
+    old_last_login = timezone.now() - datetime.timedelta(minutes=10)
+    user.last_login = old_last_login
+    user.save()
+
+    with django_assert_num_queries(1):
+        send_user_logged_in(user)
+    user.refresh_from_db()
+    assert user.last_login > old_last_login
+
+
+@override_rest_registration_settings({
+    'LOGIN_LAST_LOGIN_UPDATE_FLUSH_INTERVAL': datetime.timedelta(hours=1),
+})
+def test_last_login_updates_buffered(
+        user, user2_with_user_new_email, django_assert_num_queries):
+    user2 = user2_with_user_new_email
+    with django_assert_num_queries(0):
+        send_user_logged_in(user)
+        send_user_logged_in(user2)
+    assert has_buffered_last_login_updates()
+    user.refresh_from_db()
+    assert user.last_login is None
+
+    with django_assert_num_queries(1):
+        assert flush_last_login_updates() == 2
+    assert not has_buffered_last_login_updates()
+    user.refresh_from_db()
+    user2.refresh_from_db()
+    assert user.last_login is not None
+    assert user2.last_login is not None
+
+
+@override_rest_registration_settings({
+    'LOGIN_LAST_LOGIN_UPDATE_FLUSH_INTERVAL': datetime.timedelta(0),
+})
+def test_last_login_updates_flushed_after_interval(user):
+    send_user_logged_in(user)
+    assert not has_buffered_last_login_updates()
+    user.refresh_from_db()
+    assert user.last_login is not None
+
+
+@override_rest_registration_settings({
+    'LOGIN_LAST_LOGIN_UPDATE_FLUSH_INTERVAL': datetime.timedelta(hours=1),
+})
+def test_last_login_updates_flushed_on_request_finished_after_interval(user):
+    send_user_logged_in(user)
+    request_finished.send(sender=None)
+    assert has_buffered_last_login_updates()
+
+    monotonic_time = time.monotonic() + 3600
+    with patch("time.monotonic", side_effect=lambda: monotonic_time):
+        request_finished.send(sender=None)
+    assert not has_buffered_last_login_updates()
+    user.refresh_from_db()
+    assert user.last_login is not None
+
+
+def send_user_logged_in(user):
+    user_logged_in.send(sender=user.__class__, request=None, user=user)
+
+
+@pytest.fixture(autouse=True)
+def clear_buffered_last_login_updates(db):
+    flush_last_login_updates()
@@ -0,0 +1,94 @@
+import pytest
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.test.utils import override_settings
+
+from rest_registration.utils import passwords
+from rest_registration.utils.passwords import (
+    apply_pending_password_hash_upgrades,
+    has_pending_password_hash_upgrades,
+)
+from rest_registration.utils.users import authenticate_by_login_data
+from tests.helpers.settings import override_rest_registration_settings
+
+
+@override_settings(
+    PASSWORD_HASHERS=[
+        "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ],
+)
+@override_rest_registration_settings(
+    {
+        "LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED": True,
+        "LOGIN_PASSWORD_HASH_UPGRADE_DEFERRED": True,
+    }
+)
+def test_authenticate_by_login_data_defers_password_hash_upgrade(
+    user,
+    password_change,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    password = password_change.old_value
+    user.password = make_password(password, hasher="md5")
+    user.save()
+    data = {
+        "login": user.username,
+        "password": password,
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        # Only the user lookup, no password hash update.
+        with django_assert_num_queries(1):
+            authenticated_user = authenticate_by_login_data(data)
+    assert authenticated_user == user
+    user.refresh_from_db()
+    assert identify_hasher(user.password).algorithm == "md5"
+    assert has_pending_password_hash_upgrades()
+    for upgrade in passwords._pending_upgrades:
+        assert password not in upgrade
+
+    assert apply_pending_password_hash_upgrades() == 1
+    assert not has_pending_password_hash_upgrades()
+    user.refresh_from_db()
+    assert identify_hasher(user.password).algorithm == "pbkdf2_sha256"
+    assert user.check_password(password)
+
+
+@override_settings(
+    PASSWORD_HASHERS=[
+        "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ],
+)
+@override_rest_registration_settings(
+    {
+        "LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED": True,
+        "LOGIN_PASSWORD_HASH_UPGRADE_DEFERRED": True,
+    }
+)
+def test_apply_pending_password_hash_upgrades_skips_changed_password(
+    user,
+    password_change,
+    django_capture_on_commit_callbacks,
+):
+    password = password_change.old_value
+    user.password = make_password(password, hasher="md5")
+    user.save()
+    data = {
+        "login": user.username,
+        "password": password,
+    }
+    with django_capture_on_commit_callbacks(execute=True):
+        authenticate_by_login_data(data)
+    user.set_password(password_change.new_value)
+    user.save()
+
+    assert apply_pending_password_hash_upgrades() == 0
+    user.refresh_from_db()
+    assert user.check_password(password_change.new_value)
+
+
+@pytest.fixture(autouse=True)
+def clear_pending_password_hash_upgrades():
+    apply_pending_password_hash_upgrades()
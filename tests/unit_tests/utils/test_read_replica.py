@@ -0,0 +1,110 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_registration.utils.users import (
+    find_user_by_login_selectors,
+    get_user_by_lookup_dict,
+    get_user_values_by_lookup_dict,
+    user_with_email_exists,
+)
+from tests.helpers.constants import USERNAME
+from tests.helpers.settings import override_rest_registration_settings
+
+READ_REPLICA_SETTINGS = {
+    'READ_REPLICA_DB_ALIAS': 'replica',
+}
+
+pytestmark = pytest.mark.django_db(databases=['default', 'replica'])
+
+
+@pytest.fixture
+def replicated_user(user):
+    replica_user = get_user_model().objects.get(pk=user.pk)
+    replica_user.first_name = 'Replicated'
+    replica_user.save(using='replica', force_insert=True)
+    return replica_user
+
+
+@override_rest_registration_settings(READ_REPLICA_SETTINGS)
+def test_get_user_by_lookup_dict_uses_read_replica(user, replicated_user):
+    with CaptureQueriesContext(connection) as context:
+        found_user = get_user_by_lookup_dict(
+            {'username': USERNAME}, require_verified=False, use_read_replica=True)
+    # The user is loaded from the primary database by the primary key
+    # found in the replica.
+    assert len(context.captured_queries) == 1
+    assert '"id" = ' in context.captured_queries[0]['sql']
+    assert found_user == user
+    assert found_user.first_name == user.first_name
+    assert found_user._state.db == 'default'  # pylint: disable=protected-access
+
+
+@override_rest_registration_settings(READ_REPLICA_SETTINGS)
+def test_get_user_values_by_lookup_dict_uses_read_replica(
+        user, replicated_user, django_assert_num_queries):
+    # django_assert_num_queries counts the primary database queries only.
+    with django_assert_num_queries(0):
+        user_values = get_user_values_by_lookup_dict(
+            {'username': USERNAME}, ['first_name'], require_verified=False,
+            use_read_replica=True)
+    assert user_values == {'first_name': 'Replicated'}
+
+
+@override_rest_registration_settings(READ_REPLICA_SETTINGS)
+def test_get_user_values_by_lookup_dict_falls_back_to_primary(
+        user, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        user_values = get_user_values_by_lookup_dict(
+            {'username': USERNAME}, ['first_name'], require_verified=False,
+            use_read_replica=True)
+    assert user_values == {'first_name': user.first_name}
+
+
+@override_rest_registration_settings(READ_REPLICA_SETTINGS)
+def test_get_user_by_lookup_dict_falls_back_to_primary(
+        user, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        found_user = get_user_by_lookup_dict(
+            {'username': USERNAME}, require_verified=False, use_read_replica=True)
+    assert found_user == user
+
+
+@override_rest_registration_settings(READ_REPLICA_SETTINGS)
+def test_get_user_by_lookup_dict_uses_primary_by_default(user, replicated_user):
+    found_user = get_user_by_lookup_dict(
+        {'username': USERNAME}, require_verified=False)
+    assert found_user.first_name == user.first_name
+
+
+def test_get_user_by_lookup_dict_read_replica_not_configured(
+        user, replicated_user):
+    found_user = get_user_by_lookup_dict(
+        {'username': USERNAME}, require_verified=False, use_read_replica=True)
+    assert found_user.first_name == user.first_name
+
+
+@override_rest_registration_settings(READ_REPLICA_SETTINGS)
+def test_find_user_by_login_selectors_uses_read_replica(user, replicated_user):
+    with CaptureQueriesContext(connection) as context:
+        found_user = find_user_by_login_selectors(
+            [('username', USERNAME)], use_read_replica=True)
+    assert len(context.captured_queries) == 1
+    assert '"id" = ' in context.captured_queries[0]['sql']
+    assert found_user == user
+    assert found_user.first_name == user.first_name
+    assert found_user._state.db == 'default'  # pylint: disable=protected-access
+
+
+@override_rest_registration_settings(READ_REPLICA_SETTINGS)
+def test_find_user_by_login_selectors_falls_back_to_primary(user):
+    found_user = find_user_by_login_selectors(
+        [('username', USERNAME)], use_read_replica=True)
+    assert found_user == user
+
+
+@override_rest_registration_settings(READ_REPLICA_SETTINGS)
+def test_user_with_email_exists_uses_read_replica(user):
+    assert not user_with_email_exists(user.email, use_read_replica=True)
+    assert user_with_email_exists(user.email)
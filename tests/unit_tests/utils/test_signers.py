@@ -1,12 +1,22 @@
 import datetime
+import functools
+import string
 import time
 from unittest.mock import patch
 from urllib.parse import urlencode
 
 import pytest
-from django.core.signing import BadSignature, SignatureExpired
+from django.core.signing import BadSignature, SignatureExpired, Signer
 
-from rest_registration.utils.signers import DataSigner, URLParamsSigner
+from rest_registration.utils import signers
+from rest_registration.utils.signers import (
+    DataSigner,
+    SigningEngine,
+    URLParamsSigner,
+    get_dict_canonical_repr,
+    get_dict_repr,
+)
+from tests.helpers.settings import override_rest_registration_settings
 
 
 class ExampleSigner(DataSigner):
@@ -18,12 +28,22 @@ class ExampleTimestampSigner(DataSigner):
     VALID_PERIOD = datetime.timedelta(days=1)
 
 
+class ExamplePerUserSaltSigner(DataSigner):
+
+    def _calculate_salt(self, data):
+        return f"{self.SALT_BASE}:{data['email']}"
+
+
 class ExampleURLSigner(URLParamsSigner):
     BASE_URL = "/verify/"
     USE_TIMESTAMP = True
     VALID_PERIOD = datetime.timedelta(days=1)
 
 
+class ExampleTokenURLSigner(ExampleURLSigner):
+    TOKEN_FIELDS = ("email",)
+
+
 SIGNER_CLASSES = [ExampleSigner, ExampleTimestampSigner, ExampleURLSigner]
 
 
@@ -106,6 +126,95 @@ def test_verify_expired(unsigned_data):
             verify_signer.verify()
 
 
+def test_verify_expired_forged_does_not_calculate_salt(unsigned_data):
+    signer_cls = ExampleTimestampSigner
+    timestamp = int(time.time())
+    with patch("time.time", side_effect=lambda: timestamp):
+        signer = signer_cls(unsigned_data)
+        signed_data = signer.get_signed_data()
+    signed_data["signature"] = "forged"
+    with patch("time.time", side_effect=lambda: timestamp + 3600 * 24 * 2):
+        verify_signer = signer_cls(signed_data)
+        with patch.object(signer_cls, "_calculate_salt") as calculate_salt:
+            with pytest.raises(SignatureExpired):
+                verify_signer.verify()
+    calculate_salt.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("field", "value"), [("signature", 123), ("timestamp", "abc")],
+)
+def test_verify_malformed_does_not_calculate_salt(unsigned_data, field, value):
+    signer_cls = ExampleTimestampSigner
+    signed_data = signer_cls(unsigned_data).get_signed_data()
+    signed_data[field] = value
+    verify_signer = signer_cls(signed_data)
+    with patch.object(signer_cls, "_calculate_salt") as calculate_salt:
+        with pytest.raises(BadSignature):
+            verify_signer.verify()
+    calculate_salt.assert_not_called()
+
+
+def test_signing_engine_compatible_with_django_signer():
+    value = b"test value"
+    salt = "test-salt"
+    assert SigningEngine(salt).signature(value) == Signer(salt=salt).signature(value)
+
+
+def test_signing_engine_without_cached_key_compatible_with_django_signer():
+    value = b"test value"
+    salt = "test-salt"
+    assert SigningEngine(salt, cache_key=False).signature(value) == (
+        Signer(salt=salt).signature(value))
+
+
+def test_only_salt_base_hmac_keys_cached(unsigned_data):
+    signers._derive_cached_hmac_key.cache_clear()
+    signed_data = ExamplePerUserSaltSigner(unsigned_data).get_signed_data()
+    ExamplePerUserSaltSigner(signed_data).verify()
+    assert signers._derive_cached_hmac_key.cache_info().currsize == 0
+
+    ExampleSigner(unsigned_data).get_signed_data()
+    assert signers._derive_cached_hmac_key.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize(
+    "signer_cls", SIGNER_CLASSES,
+)
+def test_verify_legacy_signature_ok(
+    signer_cls, unsigned_data,
+):
+    signer = signer_cls(unsigned_data)
+    signed_data = signer.get_signed_data()
+    del signed_data[DataSigner.SIGNATURE_FIELD]
+    legacy_signature = Signer(salt=signer_cls.SALT_BASE).signature(
+        get_dict_repr(signed_data))
+    signed_data[DataSigner.SIGNATURE_FIELD] = legacy_signature
+    assert legacy_signature != signer.calculate_signature()
+    verify_signer = signer_cls(signed_data)
+    verify_signer.verify()
+
+
+def test_verify_legacy_sha1_signature_ok(unsigned_data):
+    # Django < 3.1 (or DEFAULT_HASHING_ALGORITHM = 'sha1') signs using sha1.
+    sha1_signer_cls = functools.partial(Signer, algorithm="sha1")
+    signed_data = ExampleSigner(unsigned_data).get_signed_data()
+    del signed_data[DataSigner.SIGNATURE_FIELD]
+    signed_data[DataSigner.SIGNATURE_FIELD] = sha1_signer_cls(
+        salt=ExampleSigner.SALT_BASE).signature(get_dict_repr(signed_data))
+    verify_signer = ExampleSigner(signed_data)
+    with pytest.raises(BadSignature):
+        verify_signer.verify()
+    with patch("rest_registration.utils.signers.Signer", sha1_signer_cls):
+        ExampleSigner(signed_data).verify()
+
+
+def test_get_dict_canonical_repr_unambiguous():
+    assert get_dict_canonical_repr({"a": "b1:c"}) != get_dict_canonical_repr(
+        {"a": "b", "c": ""})
+    assert get_dict_canonical_repr({"a": 1}) == get_dict_canonical_repr({"a": "1"})
+
+
 def test_get_url(unsigned_data, unsigned_data_email):
     signer_cls = ExampleURLSigner
     signer = signer_cls(unsigned_data)
@@ -114,6 +223,77 @@ def test_get_url(unsigned_data, unsigned_data_email):
     assert urlencode({"email": unsigned_data_email}) in url
 
 
+def test_token_verify_ok(unsigned_data):
+    signer = ExampleTokenURLSigner(unsigned_data)
+    token = signer.get_signed_token()
+    token_data = ExampleTokenURLSigner.parse_token(token)
+    assert token_data["email"] == unsigned_data["email"]
+    assert token_data["timestamp"] == signer.get_signed_data()["timestamp"]
+    verify_signer = ExampleTokenURLSigner(token_data)
+    verify_signer.verify()
+
+
+def test_token_shorter_than_params(unsigned_data):
+    signer = ExampleTokenURLSigner(unsigned_data)
+    token_params = urlencode({"token": signer.get_signed_token()})
+    assert len(token_params) < len(urlencode(signer.get_signed_data()))
+
+
+def test_token_tampered_fail(unsigned_data):
+    signer = ExampleTokenURLSigner(unsigned_data)
+    token = signer.get_signed_token()
+    token_data = ExampleTokenURLSigner.parse_token(token)
+    token_data["email"] = "a" + token_data["email"]
+    verify_signer = ExampleTokenURLSigner(token_data)
+
+    with pytest.raises(BadSignature):
+        verify_signer.verify()
+
+
+def test_token_with_tampered_last_char_fail(unsigned_data):
+    token = ExampleTokenURLSigner(unsigned_data).get_signed_token()
+    alphabet = string.ascii_letters + string.digits + "-_"
+    for char in alphabet.replace(token[-1], ""):
+        with pytest.raises(BadSignature):
+            token_data = ExampleTokenURLSigner.parse_token(token[:-1] + char)
+            ExampleTokenURLSigner(token_data).verify()
+
+
+def test_token_expired(unsigned_data):
+    timestamp = int(time.time())
+    with patch("time.time", side_effect=lambda: timestamp):
+        signer = ExampleTokenURLSigner(unsigned_data)
+        token = signer.get_signed_token()
+    token_data = ExampleTokenURLSigner.parse_token(token)
+    verify_signer = ExampleTokenURLSigner(token_data)
+    with patch("time.time", side_effect=lambda: timestamp + 3600 * 24 + 1):
+        with pytest.raises(SignatureExpired):
+            verify_signer.verify()
+
+
+@pytest.mark.parametrize(
+    "token", ["", "!!!", "AAAA", "ł", "AQAAAAAA" * 4],
+)
+def test_parse_malformed_token_fail(token):
+    with pytest.raises(BadSignature):
+        ExampleTokenURLSigner.parse_token(token)
+
+
+def test_supports_token(unsigned_data):
+    assert ExampleTokenURLSigner(unsigned_data).supports_token()
+    assert not ExampleURLSigner(unsigned_data).supports_token()
+    assert not ExampleTokenURLSigner({"email": "a" * 256}).supports_token()
+
+
+def test_get_url_with_compact_token(unsigned_data, unsigned_data_email):
+    signer = ExampleTokenURLSigner(unsigned_data)
+    with override_rest_registration_settings(
+        {"VERIFICATION_COMPACT_TOKEN_ENABLED": True}
+    ):
+        url = signer.get_url()
+    assert url == f"/verify/?token={signer.get_signed_token()}"
+
+
 @pytest.fixture
 def unsigned_data(unsigned_data_email):
     return {
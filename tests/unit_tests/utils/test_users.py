@@ -3,9 +3,14 @@ import pytest
 from rest_registration.exceptions import UserNotFound
 from rest_registration.utils.users import (
     authenticate_by_login_data,
+    get_user_by_verification_id,
     get_user_field_names,
+    get_user_field_schema,
     get_user_public_field_names,
+    get_user_values_by_verification_id,
+    user_identity_map,
 )
+from tests.helpers.common import create_test_user
 from tests.helpers.constants import USER_PASSWORD, USERNAME
 from tests.helpers.settings import override_rest_registration_settings
 
@@ -215,3 +220,197 @@ def test_get_user_public_field_names(
 def test_authenticate_by_login_data_fails(user, data):
     with pytest.raises(UserNotFound):
         authenticate_by_login_data(data)
+
+
+@override_rest_registration_settings(
+    {
+        "USER_LOGIN_FIELDS": ["username", "email"],
+        "LOGIN_SINGLE_QUERY_USER_LOOKUP_ENABLED": True,
+    }
+)
+def test_authenticate_by_login_data_with_single_query_lookup_ok(
+    user, email_change, password_change, django_assert_num_queries,
+):
+    data = {
+        "login": email_change.old_value,
+        "password": password_change.old_value,
+    }
+    # One query to find the candidate, one query done by ModelBackend.
+    with django_assert_num_queries(2):
+        authenticated_user = authenticate_by_login_data(data)
+    assert authenticated_user == user
+
+
+@override_rest_registration_settings(
+    {
+        "USER_LOGIN_FIELDS": ["username", "email"],
+        "LOGIN_SINGLE_QUERY_USER_LOOKUP_ENABLED": True,
+    }
+)
+def test_authenticate_by_login_data_with_single_query_lookup_tie_break(
+    user, email_change, password_change,
+):
+    user2 = create_test_user(
+        username=email_change.old_value,
+        email=email_change.new_value,
+        password=password_change.new_value,
+    )
+    # user2 matches on "username" which is listed before "email",
+    # therefore it is the only one candidate to be authenticated.
+    data = {
+        "login": email_change.old_value,
+        "password": password_change.new_value,
+    }
+    assert authenticate_by_login_data(data) == user2
+    data = {
+        "login": email_change.old_value,
+        "password": password_change.old_value,
+    }
+    with pytest.raises(UserNotFound):
+        authenticate_by_login_data(data)
+
+
+@override_rest_registration_settings(
+    {
+        "USER_LOGIN_FIELDS": ["username", "email"],
+        "LOGIN_SINGLE_QUERY_USER_LOOKUP_ENABLED": True,
+    }
+)
+def test_authenticate_by_login_data_with_single_query_lookup_not_found(
+    user, password_change, django_assert_num_queries,
+):
+    data = {
+        "login": "nonexistent@example.com",
+        "password": password_change.old_value,
+    }
+    with django_assert_num_queries(1):
+        with pytest.raises(UserNotFound):
+            authenticate_by_login_data(data)
+
+
+@pytest.mark.parametrize(
+    ("single_query_lookup_enabled", "expected_num_queries"),
+    [
+        pytest.param(False, 2, id="per-field-lookup"),
+        pytest.param(True, 1, id="single-query-lookup"),
+    ],
+)
+def test_authenticate_by_login_data_with_direct_credentials_check_ok(
+    user,
+    email_change,
+    password_change,
+    django_assert_num_queries,
+    single_query_lookup_enabled,
+    expected_num_queries,
+):
+    data = {
+        "login": email_change.old_value,
+        "password": password_change.old_value,
+    }
+    with override_rest_registration_settings(
+        {
+            "USER_LOGIN_FIELDS": ["username", "email"],
+            "LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED": True,
+            "LOGIN_SINGLE_QUERY_USER_LOOKUP_ENABLED": single_query_lookup_enabled,
+        }
+    ):
+        with django_assert_num_queries(expected_num_queries):
+            authenticated_user = authenticate_by_login_data(data)
+    assert authenticated_user == user
+    assert authenticated_user.backend == (
+        "django.contrib.auth.backends.ModelBackend"
+    )
+
+
+@override_rest_registration_settings(
+    {
+        "LOGIN_DIRECT_CREDENTIALS_CHECK_ENABLED": True,
+    }
+)
+def test_authenticate_by_login_data_with_direct_credentials_check_inactive_user(
+    inactive_user, password_change,
+):
+    data = {
+        "login": inactive_user.username,
+        "password": password_change.old_value,
+    }
+    with pytest.raises(UserNotFound):
+        authenticate_by_login_data(data)
+
+
+def test_get_user_field_schema_is_memoized():
+    schema = get_user_field_schema()
+    assert get_user_field_schema() is schema
+    assert get_user_public_field_names() == schema.public_field_names[False, False]
+
+
+def test_get_user_field_schema_rebuilt_when_settings_changed():
+    schema = get_user_field_schema()
+    with override_rest_registration_settings({
+        'USER_PUBLIC_FIELDS': ['username'],
+    }):
+        changed_schema = get_user_field_schema()
+        assert changed_schema is not schema
+        assert get_user_field_names() == ('username',)
+    assert get_user_field_schema() is not changed_schema
+    assert get_user_field_names() == schema.field_names[True, False]
+
+
+def test_user_identity_map_loads_user_once(user, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        with user_identity_map():
+            user1 = get_user_by_verification_id(user.pk, require_verified=False)
+            user2 = get_user_by_verification_id(
+                str(user.pk), require_verified=False)
+    assert user1 == user
+    assert user1 is user2
+
+    with django_assert_num_queries(1):
+        user3 = get_user_by_verification_id(user.pk, require_verified=False)
+    assert user3 is not user1
+
+
+def test_get_user_values_by_verification_id_fetches_given_columns_only(
+        user, django_assert_num_queries):
+    with django_assert_num_queries(1) as context:
+        values = get_user_values_by_verification_id(
+            user.pk, ['password'], require_verified=False)
+    assert values == {'password': user.password}
+    [query] = context.captured_queries
+    assert 'password' in query['sql']
+    assert 'username' not in query['sql']
+
+
+def test_get_user_values_by_verification_id_uses_loaded_user(
+        user, django_assert_num_queries):
+    with user_identity_map():
+        loaded_user = get_user_by_verification_id(user.pk, require_verified=False)
+        with django_assert_num_queries(0):
+            values = get_user_values_by_verification_id(
+                str(user.pk), ['password', 'is_active'], require_verified=False)
+    assert values == {
+        'password': loaded_user.password,
+        'is_active': loaded_user.is_active,
+    }
+
+
+def test_get_user_values_by_verification_id_loads_user_within_identity_map(
+        user, django_assert_num_queries):
+    with user_identity_map():
+        with django_assert_num_queries(1) as context:
+            values = get_user_values_by_verification_id(
+                user.pk, ['password'], require_verified=False)
+        # The whole user is loaded, so the subsequent lookup reuses it.
+        assert 'username' in context.captured_queries[0]['sql']
+        with django_assert_num_queries(0):
+            loaded_user = get_user_by_verification_id(
+                user.pk, require_verified=False)
+    assert values == {'password': loaded_user.password}
+
+
+def test_get_user_values_by_verification_id_not_found(user):
+    with pytest.raises(UserNotFound):
+        get_user_values_by_verification_id(
+            user.pk + 1, ['password'], require_verified=False)
+    assert get_user_values_by_verification_id(
+        'invalid', ['password'], default=None, require_verified=False) is None